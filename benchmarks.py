@@ -0,0 +1,316 @@
+"""
+Benchmark suite for the Field Emulator arithmetic.
+Times the hot paths of cs425proj_mod (polynomial products and reductions, irreducibility
+testing, table construction, parsing, expression evaluation, matrix elimination, polynomials
+over extension fields, Reed-Solomon coding and tower fields) over a fixed matrix of fields, writes the
+results as JSON and compares them with a stored baseline.
+
+    python benchmarks.py                         run everything, compare with the baseline if present
+    python benchmarks.py --save-baseline         run and store the results as the new baseline
+    python benchmarks.py -k poly_mul --quick     a subset, with shorter timings
+    python benchmarks.py -o results.json --threshold 0.10
+
+The exit status is 1 when a case present in the baseline got slower by more than the threshold.
+"""
+
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+
+import cs425proj_mod as ffc
+
+# Fields for the per-element operations: small and large binary fields, small odd
+# characteristic and large primes (61- and 127-bit Mersenne primes)
+FIELDS = [(2, 8), (2, 16), (2, 64), (2, 127), (2, 521), (3, 5), (3, 40), (65521, 4),
+          (2 ** 61 - 1, 3), (2 ** 127 - 1, 2)]
+# The legacy dictionary tables are quadratic in the field size, so only small fields
+TABLE_FIELDS = [(2, 6), (2, 8), (3, 4), (13, 2)]
+# Long polynomial products and reductions (Kronecker / Barrett paths)
+LONG_POLY_CASES = [(2, 1000), (65521, 1000), (2 ** 61 - 1, 500)]
+# Square matrices (p, m, size): bit-packed rows for p = 2, NumPy rows for the others
+MATRIX_CASES = [(2, 8, 200), (2, 64, 100), (3, 4, 100), (65521, 1, 100)]
+# Polynomials over the extension field (p, m, length): products, multipoint evaluation, interpolation
+FIELD_POLY_CASES = [(2, 8, 255), (2, 16, 1024), (3, 5, 200)]
+# Reed-Solomon codes (p, m, n, k) over 64 KiB of data; need NumPy
+RS_CASES = [(2, 8, 255, 223), (2, 16, 1000, 900)]
+RS_DATA_BYTES = 1 << 16
+# Towers GF((p^k)^n) as (p, k, n): products and inverses, and conversion from a flat modulus
+TOWER_CASES = [(2, 4, 2), (2, 16, 2), (3, 4, 2)]
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks_baseline.json")
+DEFAULT_THRESHOLD = 0.25
+RESULT_VERSION = 1
+
+# Large primes are written relative to a power of two, e.g. (2^61-1)
+def _prime_label(p):
+    return str(p) if p < 1 << 20 else f"(2^{p.bit_length()}-{(1 << p.bit_length()) - p})"
+
+def _field_label(p, m):
+    return f"GF({_prime_label(p)}^{m})"
+
+def _random_element(rng, p, m):
+    return [rng.randrange(p) for _ in range(m - 1)] + [rng.randrange(1, p)]
+
+# Per-element operations in one field; returns {benchmark: callable}
+def _element_cases(p, m):
+    rng = random.Random(f"{p}^{m}")
+    mod_poly = ffc.random_irreducible_poly(p, m, rng)
+    a, b = _random_element(rng, p, m), _random_element(rng, p, m)
+    product = ffc.poly_mul(a, b, p)
+    text = ffc.poly_str(a)
+    field = ffc.make_field(p, m, mod_poly, cache=False)
+    operands = [ffc.poly_str(_random_element(rng, p, m)) for _ in range(4)]
+    expr = f"(({operands[0]}) + ({operands[1]})) * ({operands[2]}) / ({operands[3]})"
+    compiled = ffc.compile_expression("a*x^2 + b*x + c", field)
+    values = {name: field.to_int(_random_element(rng, p, m)) for name in "abc"}
+
+    # The compiled-expression cache is cleared so every call parses, folds and evaluates
+    def evaluate():
+        ffc._expression_cache.clear()
+        return ffc.evaluate_expression(expr, p, m, field=field)
+
+    return {
+        "poly_mul": lambda: ffc.poly_mul(a, b, p),
+        "poly_mod": lambda: ffc.poly_mod(product, mod_poly, p),
+        "is_irreducible": lambda: ffc.is_irreducible(mod_poly, p),
+        "parse_poly": lambda: ffc.parse_poly(text, p, m),
+        "evaluate_expression": evaluate,
+        "evaluate_compiled": lambda: compiled.evaluate(values),
+    }
+
+def _table_cases(p, m):
+    mod_poly = ffc.random_irreducible_poly(p, m, random.Random(f"{p}^{m}"))
+    elements = ffc.generate_field_elements(p, m)
+    return {
+        "build_mul_table": lambda: ffc.build_mul_table(elements, mod_poly, p),
+        "build_inv_table": lambda: ffc.build_inv_table(elements, mod_poly=mod_poly, p=p),
+    }
+
+def _long_poly_cases(p, n):
+    rng = random.Random(f"long {p} {n}")
+    a = [rng.randrange(p) for _ in range(n + 1)]
+    b = [rng.randrange(p) for _ in range(n + 1)]
+    f = [rng.randrange(p) for _ in range(n)] + [1]
+    product = ffc.poly_mul(a, b, p)
+    return {
+        "poly_mul": lambda: ffc.poly_mul(a, b, p),
+        "poly_mod": lambda: ffc.poly_mod(product, f, p),
+    }
+
+def _field_poly_cases(p, m, n):
+    rng = random.Random(f"field poly {p}^{m} {n}")
+    field = ffc.make_field(p, m, ffc.random_irreducible_poly(p, m, rng), cache=False)
+    a = ffc.FieldPoly(field, [rng.randrange(field.order) for _ in range(n)])
+    b = ffc.FieldPoly(field, [rng.randrange(field.order) for _ in range(n)])
+    points = rng.sample(range(field.order), n)
+    values = a.evaluate(points)
+    return {
+        "field_poly_mul": lambda: a * b,
+        "field_poly_evaluate": lambda: a.evaluate(points),
+        "field_poly_interpolate": lambda: ffc.FieldPoly.interpolate(field, points, values),
+    }
+
+# Encoding, decoding clean codewords, and correcting (n - k) // 4 errors in every block
+def _rs_cases(p, m, n, k):
+    rng = random.Random(f"rs {p}^{m} {n} {k}")
+    field = ffc.make_field(p, m, ffc.random_irreducible_poly(p, m, rng), cache=False)
+    codec = ffc.ReedSolomonCodec(field, n, k)
+    data = rng.getrandbits(8 * RS_DATA_BYTES).to_bytes(RS_DATA_BYTES, 'little')
+    encoded = codec.encode_bytes(data)
+    symbol = m // 8
+    damaged = bytearray(encoded)
+    for start in range(0, len(damaged) - n * symbol + 1, n * symbol):
+        for i in rng.sample(range(n), (n - k) // 4):
+            damaged[start + i * symbol] ^= rng.randrange(1, 256)
+    damaged = bytes(damaged)
+    return {
+        "rs_encode": lambda: codec.encode_bytes(data),
+        "rs_decode": lambda: codec.decode_bytes(encoded),
+        "rs_correct": lambda: codec.decode_bytes(damaged),
+    }
+
+def _tower_cases(p, k, n):
+    rng = random.Random(f"tower {p}^{k} {n}")
+    base = ffc.make_field(p, k, ffc.random_irreducible_poly(p, k, rng), cache=False)
+    tower = ffc.TowerField(base, n)
+    flat = ffc.make_field(p, k * n, ffc.random_irreducible_poly(p, k * n, rng), cache=False)
+    iso = ffc.FieldIsomorphism(flat, tower)
+    a, b = rng.randrange(1, tower.order), rng.randrange(1, tower.order)
+    values = [rng.randrange(flat.order) for _ in range(1000)]
+    return {
+        "tower_mul": lambda: tower.mul(a, b),
+        "tower_inv": lambda: tower.inv(a),
+        "isomorphism_map": lambda: [iso(v) for v in values],
+    }
+
+def _have_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return False
+    return True
+
+def _matrix_cases(p, m, n):
+    rng = random.Random(f"matrix {p}^{m} {n}")
+    field = ffc.make_field(p, m, ffc.random_irreducible_poly(p, m, rng), cache=False)
+    a = ffc.FieldMatrix.random(field, n, n, rng)
+    b = ffc.FieldMatrix.random(field, n, n, rng)
+    return {
+        "matrix_rank": a.rank,
+        "matrix_inverse": a.inverse,
+        "matrix_mul": lambda: a @ b,
+    }
+
+# Case groups sharing one setup: (label, p, m, benchmark names, setup returning {name: callable})
+def _groups():
+    for p, m in FIELDS:
+        yield _field_label(p, m), p, m, ("poly_mul", "poly_mod", "is_irreducible", "parse_poly",
+                                         "evaluate_expression", "evaluate_compiled"), _element_cases
+    for p, m in TABLE_FIELDS:
+        yield _field_label(p, m), p, m, ("build_mul_table", "build_inv_table"), _table_cases
+    for p, n in LONG_POLY_CASES:
+        yield f"F{_prime_label(p)}[x] deg {n}", p, n, ("poly_mul", "poly_mod"), _long_poly_cases
+    for p, m, n in MATRIX_CASES:
+        yield f"{_field_label(p, m)} {n}x{n}", p, m, ("matrix_rank", "matrix_inverse", "matrix_mul"), \
+            lambda p, m, n=n: _matrix_cases(p, m, n)
+    for p, m, n in FIELD_POLY_CASES:
+        yield f"{_field_label(p, m)}[x] len {n}", p, m, \
+            ("field_poly_mul", "field_poly_evaluate", "field_poly_interpolate"), \
+            lambda p, m, n=n: _field_poly_cases(p, m, n)
+    for p, k, n in TOWER_CASES:
+        yield f"GF(({_prime_label(p)}^{k})^{n})", p, k * n, ("tower_mul", "tower_inv", "isomorphism_map"), \
+            lambda p, m, k=k, n=n: _tower_cases(p, k, n)
+    if _have_numpy():
+        for p, m, n, k in RS_CASES:
+            yield f"RS({n},{k}) {_field_label(p, m)}", p, m, ("rs_encode", "rs_decode", "rs_correct"), \
+                lambda p, m, n=n, k=k: _rs_cases(p, m, n, k)
+
+# Cases whose id ("function[label]") contains pattern, as (case id, function, p, m, callable);
+# groups without a selected case are not set up at all
+def _cases(pattern=None):
+    for label, p, m, names, setup in _groups():
+        selected = [name for name in names if not pattern or pattern in f"{name}[{label}]"]
+        if not selected:
+            continue
+        functions = setup(p, m)
+        for name in selected:
+            function = "evaluate_expression" if name == "evaluate_compiled" else name
+            yield f"{name}[{label}]", function, p, m, functions[name]
+
+def case_ids(pattern=None):
+    return [f"{name}[{label}]" for label, _, _, names, _ in _groups() for name in names
+            if not pattern or pattern in f"{name}[{label}]"]
+
+# Time fn: grow the loop count until one measurement takes min_time, then take repeat
+# measurements (garbage collection is off while timing, as in timeit). Seconds per call.
+def time_case(fn, min_time=0.2, repeat=5):
+    timer = timeit.Timer(fn)
+    loops = 1
+    while True:
+        elapsed = timer.timeit(loops)
+        if elapsed >= min_time / repeat or loops >= 1 << 24:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / repeat / elapsed) + 1))
+    times = [elapsed / loops] + [t / loops for t in timer.repeat(repeat - 1, loops)]
+    return {"loops": loops, "best": min(times), "median": statistics.median(times)}
+
+def run(pattern=None, min_time=0.2, repeat=5, report=None):
+    results = {}
+    for case_id, function, p, m, fn in _cases(pattern):
+        if pattern and pattern not in case_id:
+            continue
+        timing = time_case(fn, min_time, repeat)
+        results[case_id] = dict(function=function, p=p, m=m, **timing)
+        if report:
+            report(case_id, timing)
+    return {
+        "version": RESULT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "cases": results,
+    }
+
+# Compare best times with a baseline; returns [(case id, baseline, current, ratio, regressed)]
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    rows = []
+    for case_id, current in results["cases"].items():
+        old = baseline.get("cases", {}).get(case_id)
+        if old is None:
+            continue
+        ratio = current["best"] / old["best"] if old["best"] else float("inf")
+        rows.append((case_id, old["best"], current["best"], ratio, ratio > 1 + threshold))
+    return rows
+
+def _format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark the finite field arithmetic.")
+    parser.add_argument("-k", dest="pattern", help="only run cases whose id contains this text")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON to compare with (default: benchmarks_baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="fail when a case is slower than the baseline by more than this fraction")
+    parser.add_argument("--repeat", type=int, default=5, help="measurements per case (best is compared)")
+    parser.add_argument("--quick", action="store_true", help="shorter measurements, for smoke runs")
+    parser.add_argument("--list", action="store_true", help="list the case ids and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(case_ids(args.pattern)))
+        return 0
+
+    def report(case_id, timing):
+        print(f"{case_id:45} {_format_time(timing['best']):>10}  (median {_format_time(timing['median'])}, "
+              f"{timing['loops']} loops)", flush=True)
+
+    results = run(args.pattern, 0.05 if args.quick else 0.2, max(1, args.repeat), report)
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    status = 0
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        rows = compare(results, baseline, args.threshold)
+        print(f"\nCompared with {args.baseline} ({baseline.get('created', '?')}, "
+              f"threshold +{args.threshold:.0%}):")
+        for case_id, old, new, ratio, regressed in rows:
+            print(f"{case_id:45} {_format_time(old):>10} -> {_format_time(new):>10}  {ratio - 1:+7.1%}"
+                  f"{'  REGRESSION' if regressed else ''}")
+        regressions = sum(row[4] for row in rows)
+        if regressions:
+            print(f"{regressions} case(s) slowed down past the threshold", file=sys.stderr)
+            status = 1
+    elif args.baseline != DEFAULT_BASELINE and not args.save_baseline:
+        print(f"error: baseline {args.baseline} not found", file=sys.stderr)
+        status = 2
+    if args.save_baseline:
+        if args.pattern and os.path.exists(args.baseline):
+            # A partial run updates only its own cases in the stored baseline
+            with open(args.baseline) as handle:
+                merged = json.load(handle)
+            merged["cases"].update(results["cases"])
+            results = dict(results, cases=merged["cases"])
+        with open(args.baseline, "w") as handle:
+            json.dump(results, handle, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,9 +6,8 @@ The user is then presented with a calculator-like interface giving them operatio
 """
 
 import itertools
-import tkinter as tk
-from tkinter import messagebox, scrolledtext
-from tkinter import ttk # Import ttk for themed widgets like scrollbar
+import sys
+import time
 
 # Polynomial operations
 def poly_add(a, b, p):
@@ -23,20 +22,42 @@ def poly_sub(a, b, p):
         res.pop()
     return res
 
+# Shorter factors than this are multiplied by schoolbook, longer ones by Kronecker
+# substitution (one big-integer product, which CPython does by Karatsuba). Picked by
+# benchmark: with slots sized to the coefficients (see _kron_layout) packing pays off
+# from 12 to 16 coefficients for every p measured (2 up to 2^89 - 1).
+POLY_MUL_KRONECKER_THRESHOLD = 16
+# Moduli of at least this degree reduce with a cached Barrett context (see _PackedModulus);
+# by benchmark it beats long division from degree 12 to 16 depending on p
+POLY_MOD_BARRETT_THRESHOLD = 16
+
 def poly_mul(a, b, p):
+    if min(len(a), len(b)) >= POLY_MUL_KRONECKER_THRESHOLD:
+        a = [c % p for c in a]
+        b = [c % p for c in b]
+        layout = _kron_layout(min(len(a), len(b)) * (p - 1) ** 2, p)
+        return _kron_unpack(_kron_pack(a, layout) * _kron_pack(b, layout), len(a) + len(b) - 1, layout, p)
     res = [0] * (len(a) + len(b) - 1)
-    for i in range(len(a)):
-        for j in range(len(b)):
-            res[i + j] = (res[i + j] + a[i] * b[j]) % p
-    return res
+    # Accumulate exact products and reduce once per coefficient
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                res[i + j] += x * y
+    return [c % p for c in res]
 
 def poly_mod(poly, mod_poly, p):
+    if len(mod_poly) - 1 >= POLY_MOD_BARRETT_THRESHOLD and len(poly) >= len(mod_poly):
+        res = _packed_modulus(mod_poly, p).reduce_any([c % p for c in poly])
+        while res and res[-1] == 0:
+            res.pop()
+        return res
     poly = poly[:]
+    lead_inv = pow(mod_poly[-1], p - 2, p)
     while len(poly) >= len(mod_poly):
         if poly[-1] == 0:
             poly.pop()
             continue
-        factor = poly[-1]
+        factor = poly[-1] * lead_inv % p
         for i in range(len(mod_poly)):
             poly[len(poly) - len(mod_poly) + i] -= factor * mod_poly[i]
             poly[len(poly) - len(mod_poly) + i] %= p
@@ -44,118 +65,3728 @@ def poly_mod(poly, mod_poly, p):
             poly.pop()
     return poly
 
-# Check if a number is prime
-def is_prime(n):
-    if n <= 1:
-        return False
-    if n <= 3:
-        return True
-    if n % 2 == 0 or n % 3 == 0:
-        return False
-    i = 5
-    while i * i <= n:
-        if n % i == 0 or n % (i + 2) == 0:
-            return False
-        i += 6
-    return True
+# Raise a polynomial to the power e modulo mod_poly (square-and-multiply)
+def poly_pow_mod(base, e, mod_poly, p):
+    result = [1]
+    base = poly_mod(base, mod_poly, p)
+    while e > 0:
+        if e & 1:
+            result = poly_mod(poly_mul(result, base, p), mod_poly, p)
+        base = poly_mod(poly_mul(base, base, p), mod_poly, p)
+        e >>= 1
+    return result
+
+# Divide a by b over F_p, returning (quotient, remainder); b may be non-monic
+def poly_divmod(a, b, p):
+    b = b[:]
+    while b and b[-1] % p == 0:
+        b.pop()
+    if not b:
+        raise ValueError("Polynomial division by zero")
+    rem = [c % p for c in a]
+    while rem and rem[-1] == 0:
+        rem.pop()
+    lead_inv = pow(b[-1], p - 2, p)
+    quot = [0] * max(len(rem) - len(b) + 1, 0)
+    while len(rem) >= len(b):
+        shift = len(rem) - len(b)
+        factor = rem[-1] * lead_inv % p
+        quot[shift] = factor
+        for i in range(len(b)):
+            rem[shift + i] = (rem[shift + i] - factor * b[i]) % p
+        while rem and rem[-1] == 0:
+            rem.pop()
+    return quot, rem
+
+# Invert a modulo mod_poly with the extended Euclidean algorithm over F_p[x]
+def poly_inv_mod(a, mod_poly, p):
+    r0, r1 = poly_divmod(mod_poly, [1], p)[0], poly_mod(a, mod_poly, p)
+    while r1 and r1[-1] == 0:
+        r1.pop()
+    s0, s1 = [0], [1]
+    while r1:
+        quot, rem = poly_divmod(r0, r1, p)
+        r0, r1 = r1, rem
+        s0, s1 = s1, poly_sub(s0, poly_mul(quot, s1, p), p)
+    # r0 is gcd(a, mod_poly); a is invertible only when it is a nonzero constant
+    if len(r0) != 1:
+        raise ValueError(f"No inverse exists for {poly_str(a)}")
+    scale = pow(r0[0], p - 2, p)
+    return poly_mod([c * scale % p for c in s0], mod_poly, p)
+
+# Invert many polynomials modulo mod_poly at once (Montgomery's trick):
+# one extended Euclid inversion plus 3(N - 1) modular multiplications
+def poly_batch_inv_mod(polys, mod_poly, p):
+    if not polys:
+        return []
+    prefix = []
+    acc = [1]
+    for a in polys:
+        acc = poly_mod(poly_mul(acc, a, p), mod_poly, p)
+        prefix.append(acc)
+    inv = poly_inv_mod(acc, mod_poly, p)
+    result = [None] * len(polys)
+    for i in range(len(polys) - 1, 0, -1):
+        result[i] = poly_mod(poly_mul(inv, prefix[i - 1], p), mod_poly, p)
+        inv = poly_mod(poly_mul(inv, polys[i], p), mod_poly, p)
+    result[0] = inv
+    return result
+
+# Scale a polynomial so that its leading coefficient is 1
+def poly_monic(poly, p):
+    poly = poly[:]
+    while len(poly) > 1 and poly[-1] % p == 0:
+        poly.pop()
+    lead_inv = pow(poly[-1], p - 2, p)
+    return [(c * lead_inv) % p for c in poly]
+
+# Primes below SMALL_PRIME_LIMIT come from a sieve built once and cached; they are used
+# for trial division before the probabilistic tests and Pollard's rho take over
+SMALL_PRIME_LIMIT = 1 << 16
+_small_prime_list = None
+_small_prime_set = None
+
+def small_primes():
+    global _small_prime_list, _small_prime_set
+    if _small_prime_list is None:
+        sieve = bytearray([1]) * SMALL_PRIME_LIMIT
+        sieve[:2] = b"\0\0"
+        for i in range(2, int(SMALL_PRIME_LIMIT ** 0.5) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = bytes(len(range(i * i, SMALL_PRIME_LIMIT, i)))
+        _small_prime_list = [i for i in range(SMALL_PRIME_LIMIT) if sieve[i]]
+        _small_prime_set = frozenset(_small_prime_list)
+    return _small_prime_list
+
+# Miller-Rabin with these bases is exact below 4759123141 (Jaeschke), and with the
+# seven-base set of Jim Sinclair for every n < 2^64
+_MR_BASES_32 = (2, 7, 61)
+_MR_BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+# Strong probable-prime test to base a for odd n > 2
+def _strong_probable_prime(n, a):
+    a %= n
+    if a == 0:
+        return True
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+def _jacobi(a, n):
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+# Strong Lucas probable-prime test with Selfridge's parameters (D, P = 1, Q = (1 - D) / 4)
+def _strong_lucas_probable_prime(n):
+    from math import isqrt
+    if isqrt(n) ** 2 == n:
+        return False
+    D = 5
+    while True:
+        j = _jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    Q = (1 - D) // 4
+    d = n + 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    # Binary ladder for U_d, V_d with P = 1; halving mod odd n adds n to odd values
+    U, V, Qk = 1, 1, Q % n
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == '1':
+            U, V = U + V, D * U + V
+            U = (U + n if U & 1 else U) // 2 % n
+            V = (V + n if V & 1 else V) // 2 % n
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+# Check if a number is prime: trial division by the cached small primes, then
+# deterministic Miller-Rabin for 64-bit n or the Baillie-PSW test beyond
+# (Miller-Rabin to base 2 plus a strong Lucas test; no counterexample is known)
+def is_prime(n):
+    if n < 2:
+        return False
+    primes = small_primes()
+    if n < SMALL_PRIME_LIMIT:
+        return n in _small_prime_set
+    for r in primes[:64]:
+        if n % r == 0:
+            return False
+    if n >> 64 == 0:
+        bases = _MR_BASES_32 if n < 4759123141 else _MR_BASES_64
+        return all(_strong_probable_prime(n, a) for a in bases)
+    return _strong_probable_prime(n, 2) and _strong_lucas_probable_prime(n)
+
+# A nontrivial factor of the odd composite n (Pollard's rho with Brent's cycle finding)
+def _pollard_brent(n):
+    from math import gcd
+    from random import Random
+    rng = Random(n)
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+# Factorizations of recently used numbers (keyed by n; values are never mutated)
+FACTOR_CACHE_SIZE = 256
+_factor_cache = {}
+
+# Drop the oldest entry of an insertion-ordered cache dict. The field server builds fields and
+# evaluates expressions in worker threads, so another thread may change the dict in between.
+def _evict_oldest(cache):
+    try:
+        cache.pop(next(iter(cache)), None)
+    except (StopIteration, RuntimeError):
+        pass
+
+# Factorize n into {prime: exponent}: trial division by the sieved primes, then
+# Pollard's rho on what is left
+def factorize(n):
+    cached = _factor_cache.pop(n, None)
+    if cached is None:
+        cached = _factorize(n)
+        if len(_factor_cache) >= FACTOR_CACHE_SIZE:
+            _evict_oldest(_factor_cache)
+    _factor_cache[n] = cached
+    return dict(cached)
+
+def _factorize(n):
+    factors = {}
+    for r in small_primes():
+        if r * r > n:
+            break
+        while n % r == 0:
+            factors[r] = factors.get(r, 0) + 1
+            n //= r
+    stack = [n] if n > 1 else []
+    while stack:
+        n = stack.pop()
+        if n < SMALL_PRIME_LIMIT ** 2 or is_prime(n):
+            factors[n] = factors.get(n, 0) + 1
+        else:
+            d = _pollard_brent(n)
+            stack += [d, n // d]
+    return factors
+
+# Factorize p^m - 1, the order of the multiplicative group of F(p^m). It splits into the
+# cyclotomic values Phi_d(p) for d dividing m, which are factored separately (and cached).
+def factorize_group_order(p, m):
+    phi = {}
+    factors = {}
+    for d in range(1, m + 1):
+        if m % d:
+            continue
+        value = p ** d - 1
+        for e in phi:
+            if d % e == 0:
+                value //= phi[e]
+        phi[d] = value
+        for r, k in factorize(value).items():
+            factors[r] = factors.get(r, 0) + k
+    return factors
+
+# Polynomials at least this long with p < 2^31 run Euclid's algorithm on NumPy arrays when it
+# is installed (by benchmark several times faster from degree 64 up)
+POLY_GCD_ARRAY_THRESHOLD = 64
+# Unpacking switches to NumPy from this many coefficients (see _kron_unpack_array)
+KRON_UNPACK_ARRAY_THRESHOLD = 64
+
+# Greatest common divisor of two polynomials over F_p, made monic ([] when both are zero)
+def poly_gcd(a, b, p):
+    if p < 1 << 31 and min(len(a), len(b)) >= POLY_GCD_ARRAY_THRESHOLD:
+        try:
+            return _poly_gcd_array(a, b, p, _require_numpy())
+        except ImportError:
+            pass
+    a = [c % p for c in a]
+    b = [c % p for c in b]
+    while b and b[-1] == 0:
+        b.pop()
+    while b:
+        a, b = b, poly_divmod(a, b, p)[1]
+    while a and a[-1] == 0:
+        a.pop()
+    return poly_monic(a, p) if a else []
+
+# Euclid on int64 arrays (p < 2^31, so every product fits): each reduction step is one
+# vectorized update, and the arrays are only shortened by tracking their lengths
+def _poly_gcd_array(a, b, p, np):
+    a = np.array(a, dtype=np.int64) % p
+    b = np.array(b, dtype=np.int64) % p
+    na, nb = len(a), len(b)
+    while na and a[na - 1] == 0:
+        na -= 1
+    while nb and b[nb - 1] == 0:
+        nb -= 1
+    while nb:
+        lead_inv = pow(int(b[nb - 1]), p - 2, p)
+        divisor = b[:nb]
+        while na >= nb:
+            factor = int(a[na - 1]) * lead_inv % p
+            shift = na - nb
+            a[shift:na] = (a[shift:na] - factor * divisor) % p
+            na -= 1
+            while na and a[na - 1] == 0:
+                na -= 1
+        a, b, na, nb = b, a, nb, na
+    return poly_monic(a[:na].tolist(), p) if na else []
+
+# Kronecker substitution: coefficient i fills slot i of one big integer, so a polynomial
+# product is a single integer product. A slot is `words` items of an array typecode,
+# using the item size that makes slots narrowest (the product cost grows faster than
+# linearly in its size) while still holding p - 1 in one item and `bound` in a slot.
+# Returns (typecode, words, slot_bits); typecode is None for p >= 2^64 (byte packing).
+def _kron_layout(bound, p):
+    need = bound.bit_length()
+    best = None
+    for typecode, bits in (('B', 8), ('H', 16), ('I', 32), ('Q', 64)):
+        if (p - 1) >> bits:
+            continue
+        words = -(-need // bits)
+        if best is None or (words * bits, words) < (best[2], best[1]):
+            best = (typecode, words, words * bits)
+    if best is None:
+        words = -(-need // 64)
+        best = (None, words, 64 * words)
+    return best
+
+def _kron_pack(poly, layout):
+    from array import array
+    typecode, words, slot_bits = layout
+    if typecode is None:
+        return int.from_bytes(b"".join(c.to_bytes(slot_bits // 8, 'little') for c in poly), 'little')
+    buf = array(typecode, bytes(slot_bits // 8 * len(poly)))
+    buf[::words] = array(typecode, poly)
+    if sys.byteorder == 'big':
+        buf.byteswap()
+    return int.from_bytes(buf, 'little')
+
+# Read count coefficients back out of a packed integer, reducing them mod p
+def _kron_unpack(value, count, layout, p):
+    from array import array
+    typecode, words, slot_bits = layout
+    raw = value.to_bytes(slot_bits // 8 * count, 'little')
+    if typecode is None:
+        step = slot_bits // 8
+        return [int.from_bytes(raw[i:i + step], 'little') % p for i in range(0, len(raw), step)]
+    if words > 1 and typecode != 'Q' and p >> 32 == 0 and count >= KRON_UNPACK_ARRAY_THRESHOLD:
+        try:
+            return _kron_unpack_array(raw, layout, p, _require_numpy())
+        except ImportError:
+            pass
+    buf = array(typecode, raw)
+    if sys.byteorder == 'big':
+        buf.byteswap()
+    bits = slot_bits // words
+    if words == 1:
+        return [c % p for c in buf]
+    if words == 2:
+        return [(lo | hi << bits) % p for lo, hi in zip(buf[::2], buf[1::2])]
+    if words == 3:
+        return [(lo | mid << bits | hi << (2 * bits)) % p
+                for lo, mid, hi in zip(buf[::3], buf[1::3], buf[2::3])]
+    return [sum(buf[i + j] << (bits * j) for j in range(words)) % p for i in range(0, words * count, words)]
+
+# Slots of at most 32-bit items for p < 2^32: item j of a slot is weighted by 2^(bits*j) mod p,
+# so every term fits in uint64 and the reduction of all slots is a few vectorized operations
+def _kron_unpack_array(raw, layout, p, np):
+    typecode, words, slot_bits = layout
+    bits = slot_bits // words
+    items = np.frombuffer(raw, dtype='<u%d' % (bits // 8)).astype(np.uint64).reshape(-1, words)
+    modulus = np.uint64(p)
+    total = items[:, 0] % modulus
+    for j in range(1, words):
+        total += items[:, j] * np.uint64(pow(2, bits * j, p)) % modulus
+    return (total % modulus).tolist()
+
+# Polynomial arithmetic modulo a fixed f over F_p by Kronecker substitution: coefficient
+# vectors are packed into one big integer, so a product or a linear combination of
+# packed rows is a single big-integer operation instead of a Python double loop.
+# Products are reduced Barrett-style with the reversed inverse of f computed once.
+class _PackedModulus:
+    def __init__(self, mod_poly, p):
+        self.p = p
+        self.mod_poly = poly_monic(mod_poly, p)
+        self.n = n = len(self.mod_poly) - 1
+        # Slots with room for a sum of n products of two coefficients below p
+        self.layout = _kron_layout(n * p * p, p)
+        self.low_f = self.pack(self.mod_poly[:n])
+        # 1 / rev(f) mod x^(n-1) by Newton iteration, used to read quotients off products
+        rev_f = self.mod_poly[::-1][:max(n - 1, 1)]
+        inv, prec = [1], 1
+        while prec < n - 1:
+            prec = min(2 * prec, n - 1)
+            err = [(-c) % p for c in self.mul_low(self.pack(rev_f[:prec]), self.pack(inv), prec)]
+            err[0] = (err[0] + 2) % p
+            inv = self.mul_low(self.pack(inv), self.pack(err), prec)
+        self.inv_rev_f = self.pack(inv[:n - 1])
+
+    def pack(self, poly):
+        return _kron_pack(poly, self.layout)
+
+    def unpack(self, value, count):
+        return _kron_unpack(value, count, self.layout, self.p)
+
+    # Low count coefficients of the product of two packed polynomials
+    def mul_low(self, a, b, count):
+        return self.unpack(a * b & ((1 << (self.layout[2] * count)) - 1), count)
+
+    # Reduce a coefficient list of length at most 2n - 1 modulo f
+    def reduce(self, c):
+        n = self.n
+        c = c + [0] * (2 * n - 1 - len(c))
+        quot = self.mul_low(self.pack(c[:n - 1:-1]), self.inv_rev_f, n - 1)[::-1]
+        qf = self.mul_low(self.pack(quot), self.low_f, n)
+        return [(x - y) % self.p for x, y in zip(c, qf)]
+
+    # Reduce a coefficient list of any length modulo f, folding the top 2n - 1
+    # coefficients down by n - 1 places at a time
+    def reduce_any(self, c):
+        n = self.n
+        c = c[:]
+        while len(c) > 2 * n - 1:
+            shift = len(c) - (2 * n - 1)
+            c[shift:] = self.reduce(c[shift:])
+        return self.reduce(c)
+
+    # Reduce sum(coeffs[j] * rows[j]) to a length-n coefficient list
+    def combine(self, coeffs, rows):
+        return self.unpack(sum(c * r for c, r in zip(coeffs, rows) if c), self.n)
+
+    def mulmod(self, a, b):
+        return self.reduce(self.unpack(self.pack(a) * self.pack(b), 2 * self.n - 1))
+
+    # Squaring one packed integer lets CPython use its faster squaring path
+    def sqrmod(self, a):
+        packed = self.pack(a)
+        return self.reduce(self.unpack(packed * packed, 2 * self.n - 1))
+
+    def powmod(self, a, e):
+        result = [1]
+        while e:
+            if e & 1:
+                result = self.mulmod(result, a)
+            e >>= 1
+            if e:
+                a = self.sqrmod(a)
+        return result
+
+    # x^e mod f by left-to-right square-and-multiply, where multiplying by x is a shift and
+    # the subtraction of one multiple of f (about a third fewer products than powmod)
+    def x_powmod(self, e):
+        p, f = self.p, self.mod_poly
+        result = [1] + [0] * (self.n - 1)
+        for bit in bin(e)[2:]:
+            result = self.sqrmod(result)
+            if bit == "1":
+                top = result[-1]
+                result = [0] + result[:-1]
+                if top:
+                    result = [(c - top * fc) % p for c, fc in zip(result, f)]
+        return result
+
+    # Packed powers h^0 ... h^(k-1) for k about sqrt(n), and h^k, for compose()
+    def composition_powers(self, h):
+        k = max(1, int(self.n ** 0.5))
+        powers = [[1]]
+        for _ in range(k - 1):
+            powers.append(self.mulmod(powers[-1], h))
+        return [self.pack(c) for c in powers], self.mulmod(powers[-1], h)
+
+    # g(h) mod f by Brent and Kung's baby-step giant-step, given composition_powers(h): each
+    # block of k coefficients of g is one packed linear combination of the powers of h, and
+    # the blocks are joined by Horner's rule in h^k (about sqrt(n) products per composition)
+    def compose(self, g, powers):
+        rows, hk = powers
+        k = len(rows)
+        result = None
+        for start in reversed(range(0, len(g), k)):
+            block = self.combine(g[start:start + k], rows)
+            if result is not None:
+                block = [(a + b) % self.p for a, b in zip(self.mulmod(result, hk), block)]
+            result = block
+        return result if result is not None else [0] * self.n
+
+# Barrett contexts of recently used moduli, so the Newton inverse is computed once per field
+_PACKED_MODULUS_CACHE_SIZE = 32
+_packed_moduli = {}
+
+def _packed_modulus(mod_poly, p):
+    key = (tuple(mod_poly), p)
+    ctx = _packed_moduli.pop(key, None)
+    if ctx is None:
+        ctx = _PackedModulus(mod_poly, p)
+        if len(_packed_moduli) >= _PACKED_MODULUS_CACHE_SIZE:
+            _evict_oldest(_packed_moduli)
+    _packed_moduli[key] = ctx
+    return ctx
+
+# Check if a polynomial is irreducible (Rabin's test): f of degree n is irreducible iff
+# x^(p^n) = x mod f and gcd(x^(p^(n/r)) - x, f) = 1 for every prime r dividing n
+def is_irreducible(poly, p):
+    degree = len(poly) - 1
+    if degree <= 0 or poly[-1] % p == 0:
+        return False
+    if degree == 1:
+        return True
+    return _rabin_test(_PackedModulus(poly, p))
+
+# Rabin's test for the modulus of ctx. The Frobenius powers x^(p^i) are produced by applying
+# the Frobenius matrix (one packed linear combination per step), which costs n - 1 modular
+# products up front; by benchmark this beats Brent-Kung modular composition of only the
+# needed powers for every degree up to 1000, since a packed product costs several
+# combinations in CPython.
+def _rabin_test(ctx):
+    p, degree, x = ctx.p, ctx.n, [0, 1]
+    # Frobenius matrix: row j is x^(p*j) mod f, so h(x)^p = sum h_j * row_j
+    xp = ctx.x_powmod(p)
+    # Cheap early exit: a linear factor shows up in gcd(x^p - x, f)
+    if len(poly_gcd(poly_sub(xp, x, p), ctx.mod_poly, p)) > 1:
+        return False
+    rows = [ctx.pack([1])]
+    cur = [1]
+    for _ in range(degree - 1):
+        cur = ctx.mulmod(cur, xp)
+        rows.append(ctx.pack(cur))
+
+    checkpoints = {degree // r for r in factorize(degree)} - {1}
+    h = x
+    for i in range(1, degree + 1):
+        h = ctx.combine(h, rows)
+        if i in checkpoints and len(poly_gcd(poly_sub(h, x, p), ctx.mod_poly, p)) > 1:
+            return False
+    return poly_sub(h, x, p) == [0]
+
+# Ben-Or's distinct-degree test: f has an irreducible factor of degree dividing i iff
+# gcd(x^(p^i) - x, f) != 1. The factors x^(p^i) - x for i = 1 ... limit are multiplied
+# together mod f and checked with one gcd at i = 1, 2, 4, 8, ... and at limit, so most
+# random candidates are rejected after a step or two. Each x^(p^i) is the previous one
+# raised to the p-th power, or for large p the previous one composed with x^p.
+def _has_factor_up_to(ctx, limit):
+    p, x = ctx.p, [0, 1]
+    xp = h = ctx.x_powmod(p)
+    powers = None
+    acc, check = [1], 1
+    for i in range(1, limit + 1):
+        if i > 1:
+            if powers is None:
+                compose = 3 * p.bit_length() > 2 * int(ctx.n ** 0.5)
+                powers = ctx.composition_powers(xp) if compose else ()
+            h = ctx.compose(h, powers) if powers else ctx.powmod(h, p)
+        acc = ctx.mulmod(acc, poly_sub(h, x, p))
+        if i == check or i == limit:
+            if len(poly_gcd(acc, ctx.mod_poly, p)) > 1:
+                return True
+            check *= 2
+    return False
+
+# Number of monic irreducible polynomials of degree m over F_p (Gauss's formula)
+def count_irreducible_polys(p, m):
+    total = 0
+    for d in range(1, m + 1):
+        if m % d:
+            continue
+        factors = factorize(m // d)
+        if any(e > 1 for e in factors.values()):
+            continue
+        total += (-1) ** len(factors) * p ** d
+    return total // m
+
+# Monic irreducible polynomials of degree 1, 2, ... used to sieve candidates of degree m
+# by trial division; the flag says whether every degree up to m // 2 is covered
+def _sieve_polys(p, m, limit=64):
+    sieve = []
+    for d in range(1, m // 2 + 1):
+        if len(sieve) + count_irreducible_polys(p, d) > limit:
+            return sieve, False
+        sieve.extend(irreducible_polys(p, d))
+    return sieve, True
+
+def _has_small_factor(poly, sieve, p):
+    if len(poly) > 2 and poly[0] == 0:
+        return True
+    return any(not poly_mod(poly, g, p) for g in sieve)
+
+# Stream all monic irreducible polynomials of degree m over F_p in increasing order of
+# their base-p encoding. Candidates divisible by a small irreducible are rejected by the
+# sieve; the rest go through Rabin's test unless the sieve already covers degrees <= m/2
+def irreducible_polys(p, m):
+    sieve, complete = _sieve_polys(p, m)
+    for n in range(p ** m):
+        poly = int_to_poly(n, p, m) + [1]
+        if _has_small_factor(poly, sieve, p):
+            continue
+        if complete or is_irreducible(poly, p):
+            yield poly
+
+# Draw random monic polynomials of degree m until one is irreducible (about m tries expected).
+# Candidates with a factor of degree up to about sqrt(m) are dropped by Ben-Or's test (see
+# _has_factor_up_to), which is decisive on its own up to degree m // 2; only the survivors,
+# mostly irreducible, pay for Rabin's test.
+def random_irreducible_poly(p, m, rng=None):
+    if rng is None:
+        import random
+        rng = random
+    sieve, _ = _sieve_polys(p, m)
+    limit = min(m // 2, max(1, int(m ** 0.5)))
+    while True:
+        poly = [rng.randrange(p) for _ in range(m)] + [1]
+        if _has_small_factor(poly, sieve, p):
+            continue
+        if m == 1:
+            return poly
+        ctx = _PackedModulus(poly, p)
+        if not _has_factor_up_to(ctx, limit) and (limit == m // 2 or _rabin_test(ctx)):
+            return poly
+
+# Check if poly is primitive: irreducible, and x generates the multiplicative group
+def is_primitive_poly(poly, p):
+    if not is_irreducible(poly, p):
+        return False
+    m = len(poly) - 1
+    q = p ** m
+    ctx = _PackedModulus(poly, p)
+    x = poly_mod([0, 1], ctx.mod_poly, p)
+    if not any(x):
+        return False
+    one = [1] + [0] * (m - 1)
+    return all(ctx.powmod(x, (q - 1) // r) != one for r in factorize_group_order(p, m))
+
+# Draw random monic polynomials of degree m until one is primitive
+def random_primitive_poly(p, m, rng=None):
+    if rng is None:
+        import random
+        rng = random
+    while True:
+        poly = random_irreducible_poly(p, m, rng)
+        if is_primitive_poly(poly, p):
+            return poly
+
+# Generate all elements of the field
+def generate_field_elements(p, m):
+    with stats_phase("element generation"):
+        return [list(coeffs) for coeffs in itertools.product(range(p), repeat=m)]
+
+# Build multiplication table
+def build_mul_table(elements, mod_poly, p):
+    with stats_phase("multiplication table"):
+        table = {}
+        for a in elements:
+            for b in elements:
+                prod = poly_mod(poly_mul(a, b, p), mod_poly, p)
+                prod_tuple = tuple(prod + [0] * (len(a) - len(prod)))
+                table[(tuple(a), tuple(b))] = prod_tuple
+        return table
+
+# Build inverse table; with mod_poly and p the inverses are computed directly
+# by batch inversion instead of scanning the multiplication table
+def build_inv_table(elements, mul_table=None, mod_poly=None, p=None):
+    with stats_phase("inverse table"):
+        return _build_inv_table(elements, mul_table, mod_poly, p)
+
+def _build_inv_table(elements, mul_table, mod_poly, p):
+    m = len(elements[0])
+    if mod_poly is not None and p is not None:
+        nonzero = [a for a in elements if any(a)]
+        inverses = poly_batch_inv_mod(nonzero, mod_poly, p)
+        return {tuple(a): tuple(inv + [0] * (m - len(inv))) for a, inv in zip(nonzero, inverses)}
+
+    identity = tuple([1] + [0] * (m - 1))
+    inv_table = {}
+    for a in elements:
+        a_tuple = tuple(a)
+        for b in elements:
+            if mul_table.get((a_tuple, tuple(b))) == identity:
+                inv_table[a_tuple] = tuple(b)
+                break
+    return inv_table
+
+# Pretty print polynomial
+def poly_str(poly):
+    terms = []
+    for i, c in enumerate(poly):
+        if c == 0:
+            continue
+        if i == 0:
+            terms.append(f"{c}")
+        elif i == 1:
+            if c == 1:
+                terms.append("x")
+            else:
+                terms.append(f"{c}x")
+        else:
+            if c == 1:
+                terms.append(f"x^{i}")
+            else:
+                terms.append(f"{c}x^{i}")
+    return ' + '.join(terms) if terms else "0"
+
+# Coefficients of a polynomial string by exponent, reduced mod p
+def _parse_poly_terms(s, p):
+    s = s.replace(" ", "")
+    terms = s.split("+")
+    coeffs = {}
+    for term in terms:
+        if "x^" in term:
+            c, i = term.split("x^")
+            c = int(c) if c else 1
+            i = int(i)
+        elif "x" in term:
+            c = term.replace("x", "")
+            c = int(c) if c else 1
+            i = 1
+        else:
+            c = int(term)
+            i = 0
+        coeffs[i] = (coeffs.get(i, 0) + c) % p
+    return coeffs
+
+# Parse polynomial string like "1+x+x^2"
+def parse_poly(s, p, m=None):
+    coeffs = _parse_poly_terms(s, p)
+    size = m if m else max(coeffs) + 1
+    result = [0] * size
+    for i, c in coeffs.items():
+        if i < size:
+            result[i] = c % p
+    return result
+
+# Encode a coefficient list as a base-p integer (coefficient i is digit i)
+def poly_to_int(poly, p):
+    if p == 2:
+        return sum((c & 1) << i for i, c in enumerate(poly))
+    n = 0
+    for c in reversed(poly):
+        n = n * p + c % p
+    return n
+
+# Decode a base-p integer back into a coefficient list of length m
+def int_to_poly(n, p, m):
+    if p == 2:
+        return [(n >> i) & 1 for i in range(m)]
+    res = []
+    for _ in range(m):
+        n, c = divmod(n, p)
+        res.append(c)
+    return res
+
+# Multiply two GF(2)[x] polynomials packed as bit masks, reducing modulo mod_int of degree m
+def _gf2_mulmod(a, b, mod_int, m):
+    top_bit = 1 << m
+    res = 0
+    while b:
+        if b & 1:
+            res ^= a
+        b >>= 1
+        a <<= 1
+        if a & top_bit:
+            a ^= mod_int
+    return res
+
+# Log/antilog tables use 32-bit unsigned slots, enough to index fields up to 2^32 elements
+_TABLE_TYPECODE = 'I'
+_TABLE_ITEMSIZE = 4
+# Table entries built between two progress callbacks
+_PROGRESS_BLOCK = 1 << 14
+
+# Opt-in profiling (enable_stats). While it is off _stats is None: instrumented phases pay
+# for one global lookup and field operations are not wrapped at all. While it is on, fields
+# created (or passed to instrument_field) get counting wrappers on their operations, which
+# also see the operations performed inside other operations (e.g. the products in a pow).
+_stats = None
+# Field operations wrapped by instrument_field
+_COUNTED_OPS = ('add', 'sub', 'neg', 'mul', 'div', 'inv', 'pow', 'frobenius', 'sqrt', 'dlog')
+
+class FieldStats:
+    def __init__(self, trace_memory=False):
+        self.started = time.time()
+        self.phases = {}  # name -> [calls, seconds]
+        self.ops = {}  # operation -> calls
+        self.table_hits = 0  # operations answered from log/antilog/Zech tables
+        self.computed = 0  # operations computed on the fly
+        self.fields = None  # weak set of the instrumented fields, created on first use
+        self.trace_memory = False
+        if trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.trace_memory = True
+            tracemalloc.reset_peak()
+
+    def add_phase(self, name, seconds):
+        entry = self.phases.get(name)
+        if entry is None:
+            self.phases[name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def as_dict(self):
+        import tracemalloc
+        result = {
+            "elapsed_seconds": time.time() - self.started,
+            "phases": {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in self.phases.items()},
+            "operations": dict(self.ops),
+            "table_hits": self.table_hits,
+            "computed": self.computed,
+            "traced_peak_bytes": tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None,
+            "max_rss_bytes": None,
+        }
+        try:
+            import resource
+            # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+            scale = 1 if sys.platform == "darwin" else 1024
+            result["max_rss_bytes"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+        except ImportError:
+            pass
+        return result
+
+    # Remove the counting wrappers again and stop tracemalloc if it was started here
+    def stop(self):
+        for field in list(self.fields or ()):
+            for name in _COUNTED_OPS:
+                field.__dict__.pop(name, None)
+            field.__dict__.pop("_instrumented", None)
+        self.fields = None
+        if self.trace_memory:
+            import tracemalloc
+            tracemalloc.stop()
+            self.trace_memory = False
+
+# Start collecting statistics (discarding earlier ones); trace_memory also tracks the peak
+# of Python allocations with tracemalloc, which slows allocation down noticeably
+def enable_stats(trace_memory=False):
+    global _stats
+    if _stats is not None:
+        _stats.stop()
+    _stats = FieldStats(trace_memory)
+    return _stats
+
+# Stop collecting; returns the final statistics (as a dict) or None if they were off
+def disable_stats():
+    global _stats
+    stats, _stats = _stats, None
+    if stats is None:
+        return None
+    result = stats.as_dict()
+    stats.stop()
+    return result
+
+def stats_enabled():
+    return _stats is not None
+
+# The statistics collected so far as a dict, or None while collection is off
+def get_stats():
+    return None if _stats is None else _stats.as_dict()
+
+# Write the current statistics as JSON to path and return them
+def export_stats(path):
+    import json
+    stats = get_stats()
+    if stats is None:
+        raise ValueError("Statistics collection is not enabled")
+    with open(path, "w") as handle:
+        json.dump(stats, handle, indent=2)
+    return stats
+
+class _NoPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NO_PHASE = _NoPhase()
+
+class _Phase:
+    __slots__ = ("stats", "name", "start")
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats.add_phase(self.name, time.perf_counter() - self.start)
+        return False
+
+# Time the enclosed block as one call of the named phase (a shared no-op while stats are off)
+def stats_phase(name):
+    return _NO_PHASE if _stats is None else _Phase(_stats, name)
+
+# Wrap the operations of one field so they are counted, as table hits when the engine
+# answers them from its tables and as computed otherwise
+def instrument_field(field):
+    stats = _stats
+    if stats is None or getattr(field, "_instrumented", None) is stats:
+        return field
+    table_ops = set()
+    if isinstance(field, LogTableField):
+        table_ops = {'mul', 'div', 'inv', 'pow', 'frobenius', 'sqrt', 'dlog'}
+        if field._zech is not None:
+            table_ops |= {'add', 'sub', 'neg'}
+    ops = stats.ops
+    for name in _COUNTED_OPS:
+        method = getattr(type(field), name).__get__(field)
+        from_table = name in table_ops
+
+        def counted(*args, _name=name, _method=method, _from_table=from_table):
+            ops[_name] = ops.get(_name, 0) + 1
+            if _from_table:
+                stats.table_hits += 1
+            else:
+                stats.computed += 1
+            return _method(*args)
+        setattr(field, name, counted)
+    field._instrumented = stats
+    if stats.fields is None:
+        import weakref
+        stats.fields = weakref.WeakSet()
+    stats.fields.add(field)
+    return field
+
+# Plain-text report of a get_stats() result
+def format_stats(stats):
+    if stats is None:
+        return "Statistics collection is off."
+    lines = [f"Collected for {stats['elapsed_seconds']:.1f} s", "", "Phases:"]
+    for name, phase in sorted(stats["phases"].items(), key=lambda item: -item[1]["seconds"]):
+        lines.append(f"  {name:28} {phase['seconds'] * 1000:10.1f} ms  ({phase['calls']} calls)")
+    if not stats["phases"]:
+        lines.append("  (none yet)")
+    lines += ["", "Field operations:"]
+    for name, calls in sorted(stats["operations"].items(), key=lambda item: -item[1]):
+        lines.append(f"  {name:28} {calls:10}")
+    total = stats["table_hits"] + stats["computed"]
+    if total:
+        lines.append(f"  table hits {stats['table_hits']}, computed {stats['computed']} "
+                     f"({100 * stats['table_hits'] / total:.1f}% from tables)")
+    else:
+        lines.append("  (none yet)")
+    lines += ["", "Memory:"]
+    if stats["traced_peak_bytes"] is not None:
+        lines.append(f"  traced peak {stats['traced_peak_bytes'] / 2 ** 20:.1f} MiB")
+    if stats["max_rss_bytes"] is not None:
+        lines.append(f"  process peak RSS {stats['max_rss_bytes'] / 2 ** 20:.1f} MiB")
+    return "\n".join(lines)
+
+# Shared element encoding and additive arithmetic of the field engines.
+# Elements are base-p integers (see poly_to_int); subclasses provide mul and inv.
+class FiniteField:
+    def __init__(self, p, m, mod_poly):
+        self.p = p
+        self.m = m
+        self.mod_poly = poly_monic(mod_poly, p)
+        self.order = p ** m
+        self._factors = None
+        self._primitive = None
+        self._frobenius = None
+        self._non_residue = None
+
+    def to_int(self, poly):
+        return poly_to_int(poly, self.p)
+
+    def from_int(self, n):
+        return int_to_poly(n, self.p, self.m)
+
+    # Parse a polynomial string (parse_poly syntax) into a reduced element. Terms of degree
+    # 2m and up are reduced as powers of x, so x^1000000000 is never expanded densely.
+    def from_str(self, s):
+        p, limit = self.p, 2 * self.m
+        low, result = [0] * limit, 0
+        for i, c in _parse_poly_terms(s, p).items():
+            if i < limit:
+                low[i] = c
+            elif c:
+                result = self.add(result, self.mul(c, self.to_int(poly_pow_mod([0, 1], i, self.mod_poly, p))))
+        return self.add(result, self.to_int(poly_mod(low, self.mod_poly, p)))
+
+    # Format an element the way poly_str does
+    def to_str(self, a):
+        return poly_str(self.from_int(a))
+
+    def add(self, a, b):
+        p = self.p
+        if p == 2:
+            return a ^ b
+        if self.m == 1:
+            return (a + b) % p
+        res, scale = 0, 1
+        while a or b:
+            a, x = divmod(a, p)
+            b, y = divmod(b, p)
+            res += (x + y) % p * scale
+            scale *= p
+        return res
+
+    def neg(self, a):
+        p = self.p
+        if p == 2:
+            return a
+        res, scale = 0, 1
+        while a:
+            a, x = divmod(a, p)
+            res += (-x) % p * scale
+            scale *= p
+        return res
+
+    def sub(self, a, b):
+        return self.add(a, self.neg(b))
+
+    def div(self, a, b):
+        return self.mul(a, self.inv(b))
+
+    # a^e by square-and-multiply. Exponents are reduced mod q - 1 and factors of p are
+    # split off as Frobenius maps; for small odd p the rest is done in base p, where each
+    # digit costs one Frobenius map (a cheap linear map) and one multiplication.
+    def pow(self, a, e):
+        if e < 0:
+            a, e = self.inv(a), -e
+        if a == 0:
+            return 0 if e else 1
+        if e == 0:
+            return 1
+        p = self.p
+        e %= self.order - 1
+        k = 0
+        while e and e % p == 0 and k < self.m:
+            e //= p
+            k += 1
+        if e == 0:
+            return self.frobenius(1, k)
+        if 2 < p <= _FROBENIUS_POW_MAX_P and self.m > 1:
+            powers = [1, a]
+            for _ in range(p - 2):
+                powers.append(self.mul(powers[-1], a))
+            digits = []
+            while e:
+                e, d = divmod(e, p)
+                digits.append(d)
+            result = powers[digits.pop()]
+            while digits:
+                result = self.frobenius(result)
+                d = digits.pop()
+                if d:
+                    result = self.mul(result, powers[d])
+            return self.frobenius(result, k)
+        result = 1
+        while e:
+            if e & 1:
+                result = self.mul(result, a)
+            e >>= 1
+            if e:
+                a = self.mul(a, a)
+        return self.frobenius(result, k)
+
+    # The Frobenius automorphism a -> a^(p^k). It is linear over F_p, so with the rows
+    # x^(p*j) mod f packed once each application is a single packed linear combination.
+    def frobenius(self, a, k=1):
+        k %= self.m
+        if k == 0 or a == 0:
+            return a
+        if self.p == 2:
+            for _ in range(k):
+                a = self.mul(a, a)
+            return a
+        if self._frobenius is None:
+            ctx = _PackedModulus(self.mod_poly, self.p)
+            xp = ctx.powmod([0, 1], self.p)
+            rows, cur = [ctx.pack([1])], [1]
+            for _ in range(self.m - 1):
+                cur = ctx.mulmod(cur, xp)
+                rows.append(ctx.pack(cur))
+            self._frobenius = (ctx, rows)
+        ctx, rows = self._frobenius
+        coeffs = self.from_int(a)
+        for _ in range(k):
+            coeffs = ctx.combine(coeffs, rows)
+        return self.to_int(coeffs)
+
+    # Prime factorization {r: e} of q - 1, the order of the multiplicative group
+    def order_factors(self):
+        if self._factors is None:
+            self._factors = factorize_group_order(self.p, self.m)
+        return self._factors
+
+    # A generator of the multiplicative group, found once
+    def primitive_element(self):
+        if self._primitive is None:
+            self._primitive = self._find_generator()
+        return self._primitive
+
+    def _find_generator(self):
+        q = self.order
+        if q == 2:
+            return 1
+        exponents = [(q - 1) // r for r in self.order_factors()]
+        ctx = _packed_modulus(self.mod_poly, self.p)
+        one = [1] + [0] * (self.m - 1)
+        # For m > 1 the constants lie in F(p) and have order dividing p - 1, so start at x
+        for g in range(self.p if self.m > 1 else 2, q):
+            g_poly = int_to_poly(g, self.p, self.m)
+            if all(ctx.powmod(g_poly, e) != one for e in exponents):
+                return g
+        raise ValueError("No primitive element found; the modulus is not irreducible")
+
+    # Multiplicative order of a nonzero element
+    def element_order(self, a):
+        if a == 0:
+            raise ValueError("0 has no multiplicative order")
+        n = self.order - 1
+        for r, e in self.order_factors().items():
+            for _ in range(e):
+                if self.pow(a, n // r) != 1:
+                    break
+                n //= r
+        return n
+
+    def is_square(self, a):
+        if a == 0 or self.p == 2:
+            return True
+        return self.pow(a, (self.order - 1) // 2) == 1
+
+    # A square root of a (the other one is its negative). For p = 2 every element is a
+    # square, sqrt(a) = a^(q/2); for odd q this is Tonelli-Shanks on q - 1 = 2^s * t.
+    def sqrt(self, a):
+        if a == 0:
+            return 0
+        if self.p == 2:
+            return self.frobenius(a, self.m - 1)
+        if not self.is_square(a):
+            raise ValueError(f"{self.to_str(a)} is not a square in F({self.p}^{self.m})")
+        s, t = 0, self.order - 1
+        while t % 2 == 0:
+            s, t = s + 1, t // 2
+        # Any non-square z gives c = z^t of order exactly 2^s
+        c, x, b = self.pow(self._find_non_residue(), t), self.pow(a, (t + 1) // 2), self.pow(a, t)
+        while b != 1:
+            # Least i with b^(2^i) = 1
+            i, bb = 0, b
+            while bb != 1:
+                bb = self.mul(bb, bb)
+                i += 1
+            w = c
+            for _ in range(s - i - 1):
+                w = self.mul(w, w)
+            x = self.mul(x, w)
+            c = self.mul(w, w)
+            b = self.mul(b, c)
+            s = i
+        return x
+
+    # A non-square, found once. For even m every element of F_p is a square, so the search
+    # starts at x (packed p) and only tries elements outside F_p, half of which are non-squares.
+    def _find_non_residue(self):
+        if self._non_residue is None:
+            z = self.p if self.m % 2 == 0 else 2
+            while self.is_square(z):
+                z += 1
+            self._non_residue = z
+        return self._non_residue
+
+    # Discrete logarithm: the least k >= 0 with base^k = a, base defaulting to the primitive
+    # element. Pohlig-Hellman splits the order of base into prime powers r^e, solving one
+    # base-r digit at a time by baby-step giant-step in the subgroup of order r.
+    def dlog(self, a, base=None):
+        if base is None:
+            base = self.primitive_element()
+        if a == 0 or base == 0:
+            raise ValueError("Discrete logarithms of and to 0 are undefined")
+        n = self.element_order(base)
+        x, modulus = 0, 1
+        for r, e in _divisor_factors(n, self.order_factors()).items():
+            if r > DLOG_MAX_PRIME:
+                raise ValueError(f"The group order has the prime factor {r}, too large for a discrete logarithm")
+            g1 = self.pow(base, n // r ** e)
+            h1 = self.pow(a, n // r ** e)
+            gamma = self.pow(g1, r ** (e - 1))
+            xk = 0
+            for k in range(e):
+                hk = self.pow(self.mul(self.pow(g1, -xk), h1), r ** (e - 1 - k))
+                digit = _baby_giant(self, gamma, hk, r)
+                if digit is None:
+                    raise ValueError(f"{self.to_str(a)} is not a power of {self.to_str(base)}")
+                xk += digit * r ** k
+            # Chinese remaindering with the prime powers done so far
+            x += modulus * ((xk - x) * pow(modulus, -1, r ** e) % r ** e)
+            modulus *= r ** e
+        if self.pow(base, x) != a:
+            raise ValueError(f"{self.to_str(a)} is not a power of {self.to_str(base)}")
+        return x
+
+# pow() works in base p with Frobenius maps for odd p up to this size
+_FROBENIUS_POW_MAX_P = 16
+# Largest prime subgroup order dlog searches by baby-step giant-step (memory grows as its root)
+DLOG_MAX_PRIME = 1 << 40
+
+# Factorization of a divisor n of q - 1, read off the factorization of q - 1
+def _divisor_factors(n, factors):
+    res = {}
+    for r in factors:
+        while n % r == 0:
+            res[r] = res.get(r, 0) + 1
+            n //= r
+    return res
+
+# The d in [0, r) with gamma^d = h, where gamma has prime order r; None if there is none
+def _baby_giant(field, gamma, h, r):
+    from math import isqrt
+    step = isqrt(r) + 1
+    baby = {}
+    cur = 1
+    for j in range(step):
+        baby.setdefault(cur, j)
+        cur = field.mul(cur, gamma)
+    giant = field.inv(cur)  # gamma^-step
+    y = h
+    for i in range(step):
+        j = baby.get(y)
+        if j is not None:
+            return (i * step + j) % r
+        y = field.mul(y, giant)
+    return None
+
+# Field arithmetic through discrete log / antilog tables of size q.
+# A primitive element g is found once, then exp[k] = g^k and log[g^k] = k
+# turn multiplication into index addition. For odd p the Zech logarithm table
+# (g^zech[k] = 1 + g^k) does the same for addition, which is a plain XOR when p = 2.
+# progress, if given, is called as progress(phase, done, total) while the tables are
+# built; an exception raised by it aborts construction. Large tables are built by
+# `processes` worker processes (see _build_tables_parallel); None means TABLE_BUILD_PROCESSES.
+class LogTableField(FiniteField):
+    def __init__(self, p, m, mod_poly, progress=None, processes=None):
+        super().__init__(p, m, mod_poly)
+        with stats_phase("generator search"):
+            self.generator = self._find_generator()
+        self._zech = None
+        if _table_processes(self.order, processes) > 1:
+            with stats_phase("log tables (parallel)"):
+                _build_tables_parallel(self, _table_processes(self.order, processes), progress)
+        else:
+            with stats_phase("log tables"):
+                self._build_tables(progress)
+            if p != 2 and m > 1:
+                with stats_phase("Zech logarithms"):
+                    self._build_zech(progress)
+        if _stats is not None:
+            instrument_field(self)
+
+    # Wrap tables that were already built (e.g. memory-mapped from the table cache)
+    @classmethod
+    def from_tables(cls, p, m, mod_poly, generator, exp, log, zech=None):
+        field = cls.__new__(cls)
+        FiniteField.__init__(field, p, m, mod_poly)
+        field.generator = generator
+        field.exp = exp
+        field.log = log
+        field._zech = zech
+        if _stats is not None:
+            instrument_field(field)
+        return field
+
+    # Return a function computing a -> a * generator on integer-encoded elements (p = 2 or m = 1)
+    def _int_step_function(self):
+        p, m, g = self.p, self.m, self.generator
+        if m == 1:
+            return lambda a: a * g % p
+        mod_int = poly_to_int(self.mod_poly, 2)
+        top_bit = 1 << m
+        if g == 2:
+            def step(a):
+                a <<= 1
+                return a ^ mod_int if a & top_bit else a
+            return step
+        return lambda a: _gf2_mulmod(a, g, mod_int, m)
+
+    # Return a function computing cur -> cur * generator on length-m coefficient lists
+    def _poly_step_function(self):
+        p, m, g = self.p, self.m, self.generator
+        if g < p * p:
+            # Generator is b*x + c (the search starts at x, so this is the usual case): shift
+            # up, fold the top coefficient back in, scale by b and add c * cur
+            b, c = divmod(g, p)
+            fold = [[(-t * f) % p for f in self.mod_poly[:m]] for t in range(p)]
+            if g == p:
+                def step(cur):
+                    top = cur[-1]
+                    cur = [0] + cur[:-1]
+                    if top:
+                        cur = [(a + f) % p for a, f in zip(cur, fold[top])]
+                    return cur
+                return step
+
+            def step(cur):
+                shifted = [0] + cur[:-1]
+                return [(b * (s + f) + c * a) % p for s, f, a in zip(shifted, fold[cur[-1]], cur)]
+            return step
+        # Otherwise cur * g is the sum of cur[i] * (g * x^i mod f); every multiple of those
+        # rows is precomputed, so a step picks one row per digit and sums the columns
+        from operator import getitem
+        rows = []
+        row = int_to_poly(g, p, m)
+        for _ in range(m):
+            rows.append([[a * r for r in row] for a in range(p)])
+            top = row[-1]
+            row = [(a - top * f) % p for a, f in zip([0] + row[:-1], self.mod_poly)]
+
+        def step(cur):
+            return [sum(column) % p for column in zip(*map(getitem, rows, cur))]
+        return step
+
+    def _build_tables(self, progress=None):
+        from array import array
+        q = self.order
+        # exp is stored twice over so exp[log[a] + log[b]] never needs a reduction
+        exp = array(_TABLE_TYPECODE, [0]) * (2 * (q - 1))
+        log = array(_TABLE_TYPECODE, [0]) * q
+        self._fill_log_block(exp, log, 0, q - 1, progress)
+        self.exp = exp
+        self.log = log
+
+    # Fill exp[k], exp[k + q - 1] and log[exp[k]] for start <= k < stop. Blocks are
+    # independent, since each starts from generator^start.
+    def _fill_log_block(self, exp, log, start, stop, progress=None):
+        p, m, q = self.p, self.m, self.order
+        first = poly_pow_mod(int_to_poly(self.generator, p, m), start, self.mod_poly, p)
+        first = first + [0] * (m - len(first))
+        # Work in blocks so progress is reported without a check per element
+        blocks = [range(k, min(k + _PROGRESS_BLOCK, stop)) for k in range(start, stop, _PROGRESS_BLOCK)]
+        if p == 2 or m == 1:
+            step = self._int_step_function()
+            a = poly_to_int(first, p)
+            for block in blocks:
+                for k in block:
+                    exp[k] = exp[k + q - 1] = a
+                    log[a] = k
+                    a = step(a)
+                if progress:
+                    progress("log tables", block.stop, q - 1)
+        else:
+            step = self._poly_step_function()
+            weights = [p ** i for i in range(m)]
+            cur = first
+            for block in blocks:
+                for k in block:
+                    a = sum(map(int.__mul__, cur, weights))
+                    exp[k] = exp[k + q - 1] = a
+                    log[a] = k
+                    cur = step(cur)
+                if progress:
+                    progress("log tables", block.stop, q - 1)
+
+    def _build_zech(self, progress=None):
+        from array import array
+        q = self.order
+        zech = array(_TABLE_TYPECODE, [0]) * (q - 1)
+        for start in range(0, q - 1, _PROGRESS_BLOCK):
+            stop = min(start + _PROGRESS_BLOCK, q - 1)
+            self._fill_zech_block(zech, start, stop)
+            if progress:
+                progress("Zech logarithms", stop, q - 1)
+        self._zech = zech
+
+    def _fill_zech_block(self, zech, start, stop):
+        p, q = self.p, self.order
+        exp, log = self.exp, self.log
+        # q - 1 marks 1 + g^k = 0; adding 1 only touches the lowest base-p digit
+        for k in range(start, stop):
+            v = exp[k]
+            d = v % p
+            s = v - d + (d + 1) % p
+            zech[k] = log[s] if s else q - 1
+
+    def add(self, a, b):
+        if self.p == 2:
+            return a ^ b
+        if self.m == 1:
+            return (a + b) % self.p
+        if a == 0:
+            return b
+        if b == 0:
+            return a
+        q1 = self.order - 1
+        la = self.log[a]
+        z = self._zech[(self.log[b] - la) % q1]
+        return 0 if z == q1 else self.exp[la + z]
+
+    def neg(self, a):
+        if self.p == 2 or a == 0:
+            return a
+        # -1 = g^((q - 1) / 2) for odd q
+        return self.exp[self.log[a] + (self.order - 1) // 2]
+
+    def mul(self, a, b):
+        if a == 0 or b == 0:
+            return 0
+        return self.exp[self.log[a] + self.log[b]]
+
+    def inv(self, a):
+        if a == 0:
+            raise ValueError("No inverse exists for 0")
+        return self.exp[(self.order - 1 - self.log[a]) % (self.order - 1)]
+
+    def pow(self, a, e):
+        if a == 0:
+            if e < 0:
+                raise ValueError("No inverse exists for 0")
+            return 0 if e > 0 else 1
+        return self.exp[self.log[a] * e % (self.order - 1)]
+
+    def primitive_element(self):
+        return self.generator
+
+    def frobenius(self, a, k=1):
+        if a == 0:
+            return 0
+        return self.exp[self.log[a] * pow(self.p, k % self.m, self.order - 1) % (self.order - 1)]
+
+    def is_square(self, a):
+        return a == 0 or self.p == 2 or self.log[a] % 2 == 0
+
+    # Square roots halve the logarithm (for p = 2, q - 1 is odd so every log is halvable)
+    def sqrt(self, a):
+        if a == 0:
+            return 0
+        la, q1 = self.log[a], self.order - 1
+        if la % 2:
+            if self.p != 2:
+                raise ValueError(f"{self.to_str(a)} is not a square in F({self.p}^{self.m})")
+            la += q1
+        return self.exp[la // 2]
+
+    # log[a] = k * log[base] (mod q - 1) is a linear congruence
+    def dlog(self, a, base=None):
+        if a == 0 or base == 0:
+            raise ValueError("Discrete logarithms of and to 0 are undefined")
+        q1 = self.order - 1
+        la = self.log[a]
+        if base is None or base == self.generator:
+            return la
+        from math import gcd
+        lb = self.log[base]
+        d = gcd(lb, q1)
+        if la % d:
+            raise ValueError(f"{self.to_str(a)} is not a power of {self.to_str(base)}")
+        n = q1 // d
+        return la // d * pow(lb // d, -1, n) % n if n > 1 else 0
+
+    # Zech logarithm: the k with g^k = 1 + g^n, or None when 1 + g^n = 0
+    def zech_log(self, n):
+        q = self.order
+        if self._zech is None:
+            self._build_zech()
+        z = self._zech[n % (q - 1)]
+        return None if z == q - 1 else z
+
+# Table-free field arithmetic: every product is computed on demand by polynomial
+# multiplication and reduction, so fields of any size work without enumeration
+class LazyField(FiniteField):
+    def __init__(self, p, m, mod_poly):
+        super().__init__(p, m, mod_poly)
+        if p == 2:
+            self._mod_int = poly_to_int(self.mod_poly, 2)
+        # Large odd-p moduli multiply through one Barrett context built up front
+        self._packed = None
+        if p != 2 and m >= POLY_MOD_BARRETT_THRESHOLD:
+            self._packed = _PackedModulus(self.mod_poly, p)
+        if _stats is not None:
+            instrument_field(self)
+
+    def mul(self, a, b):
+        if a == 0 or b == 0:
+            return 0
+        if self.p == 2:
+            return _gf2_mulmod(a, b, self._mod_int, self.m)
+        if self._packed is not None:
+            return self.to_int(self._packed.mulmod(self.from_int(a), self.from_int(b)))
+        prod = poly_mul(self.from_int(a), self.from_int(b), self.p)
+        return self.to_int(poly_mod(prod, self.mod_poly, self.p))
+
+    def inv(self, a):
+        if a == 0:
+            raise ValueError("No inverse exists for 0")
+        return self.to_int(poly_inv_mod(self.from_int(a), self.mod_poly, self.p))
+
+# Default memory allowed for log/antilog tables before make_field falls back to LazyField
+TABLE_MEMORY_BUDGET = 32 * 1024 * 1024
+
+# Bytes used by the exp, log (and for odd p, Zech) tables of a LogTableField for GF(p^m)
+def log_table_bytes(p, m):
+    q = p ** m
+    slots = 3 * q - 2 if p == 2 or m == 1 else 4 * q - 3
+    return slots * _TABLE_ITEMSIZE
+
+# On-disk cache of LogTableField tables. Each field is one file named by a hash of
+# (p, m, modulus): a fixed header, the modulus, then the exp / log / Zech tables in
+# native byte order at 8-byte aligned offsets, covered by a CRC-32. Loading
+# memory-maps the file and hands out memoryviews of it, so nothing is copied.
+TABLE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Fields smaller than this rebuild faster than a file can be opened, so they are not cached
+TABLE_CACHE_MIN_ORDER = 1 << 12
+_TABLE_CACHE_MAGIC = b"FFCT"
+_TABLE_CACHE_VERSION = 1
+_TABLE_CACHE_SUFFIX = ".tables"
+# magic, version, flags, p, m, generator, len(exp), len(log), len(zech), crc32, len(modulus)
+_TABLE_CACHE_HEADER = "<4sHHQIQQQQII"
+_TABLE_CACHE_HAS_ZECH = 1
+_TABLE_CACHE_BIG_ENDIAN = 2
+
+# Directory holding cached tables: $FFC_TABLE_CACHE, else the user cache directory
+def table_cache_dir():
+    import os
+    path = os.environ.get("FFC_TABLE_CACHE")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "finite-field-calculator")
+
+def _table_cache_path(p, m, mod_poly, directory=None):
+    import hashlib
+    import os
+    key = hashlib.blake2b(repr((p, m, tuple(mod_poly))).encode(), digest_size=12).hexdigest()
+    return os.path.join(directory or table_cache_dir(), f"gf{p}_{m}-{key}{_TABLE_CACHE_SUFFIX}")
+
+def _table_cache_flags(has_zech):
+    flags = _TABLE_CACHE_HAS_ZECH if has_zech else 0
+    if sys.byteorder == "big":
+        flags |= _TABLE_CACHE_BIG_ENDIAN
+    return flags
+
+# Write the tables of a LogTableField to the cache, then evict old entries over max_bytes
+def save_field_tables(field, directory=None, max_bytes=None):
+    import os
+    import struct
+    import tempfile
+    import zlib
+    directory = directory or table_cache_dir()
+    if max_bytes is None:
+        max_bytes = TABLE_CACHE_MAX_BYTES
+    sections = [field.exp, field.log]
+    if field._zech is not None:
+        sections.append(field._zech)
+    crc = 0
+    for table in sections:
+        crc = zlib.crc32(table, crc)
+    header = struct.pack(_TABLE_CACHE_HEADER, _TABLE_CACHE_MAGIC, _TABLE_CACHE_VERSION,
+                         _table_cache_flags(field._zech is not None), field.p, field.m,
+                         field.generator, len(field.exp), len(field.log),
+                         len(field._zech) if field._zech is not None else 0,
+                         crc, len(field.mod_poly))
+    header += struct.pack(f"<{len(field.mod_poly)}Q", *field.mod_poly)
+    header += bytes(-len(header) % 8)
+    path = _table_cache_path(field.p, field.m, field.mod_poly, directory)
+    os.makedirs(directory, exist_ok=True)
+    # Write to a temporary name and rename, so readers never see a half-written file
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            for table in sections:
+                f.write(table)
+                f.write(bytes(-len(table) * _TABLE_ITEMSIZE % 8))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    _evict_table_cache(directory, max_bytes, keep=path)
+    return path
+
+# Memory-map the cached tables for GF(p^m) mod mod_poly; returns a LogTableField or
+# None on a miss. Files that fail the header or checksum checks are deleted.
+def load_field_tables(p, m, mod_poly, directory=None):
+    import mmap
+    import os
+    import struct
+    import zlib
+    mod_poly = poly_monic(mod_poly, p)
+    path = _table_cache_path(p, m, mod_poly, directory)
+    try:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    q = p ** m
+    head_size = struct.calcsize(_TABLE_CACHE_HEADER)
+    tables = None
+    if len(mm) >= head_size:
+        (magic, version, flags, fp, fm, generator, n_exp, n_log, n_zech,
+         crc, n_mod) = struct.unpack_from(_TABLE_CACHE_HEADER, mm)
+        offset = head_size + 8 * n_mod
+        offset += -offset % 8
+        if (magic == _TABLE_CACHE_MAGIC and version == _TABLE_CACHE_VERSION
+                and flags & ~_TABLE_CACHE_HAS_ZECH == _table_cache_flags(False)
+                and (fp, fm) == (p, m) and n_exp == 2 * (q - 1) and n_log == q
+                and n_zech in (0, q - 1) and (n_zech > 0) == bool(flags & _TABLE_CACHE_HAS_ZECH)
+                and offset <= len(mm)
+                and list(struct.unpack_from(f"<{n_mod}Q", mm, head_size)) == mod_poly):
+            view = memoryview(mm)
+            tables = []
+            check = 0
+            for n in (n_exp, n_log, n_zech):
+                end = offset + n * _TABLE_ITEMSIZE
+                if end > len(mm):
+                    tables = None
+                    break
+                section = view[offset:end]
+                check = zlib.crc32(section, check)
+                tables.append(section.cast(_TABLE_TYPECODE) if n else None)
+                offset = end + (-end % 8)
+            if tables is not None and check != crc:
+                tables = None
+    if tables is None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+    # The modification time doubles as the last-used time for LRU eviction
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    exp, log, zech = tables
+    return LogTableField.from_tables(p, m, mod_poly, generator, exp, log, zech)
+
+# Delete the least recently used cache files until the total size is at most max_bytes
+def _evict_table_cache(directory, max_bytes, keep=None):
+    import os
+    entries = []
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    for name in names:
+        if not name.endswith(_TABLE_CACHE_SUFFIX):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+# Remove every cached table file; returns how many were deleted
+def clear_table_cache(directory=None):
+    import os
+    directory = directory or table_cache_dir()
+    removed = 0
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return 0
+    for name in names:
+        if name.endswith(_TABLE_CACHE_SUFFIX):
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                continue
+            removed += 1
+    return removed
+
+# True when make_field would build log/antilog tables for GF(p^m) under memory_budget
+def uses_log_tables(p, m, memory_budget=None):
+    if memory_budget is None:
+        memory_budget = TABLE_MEMORY_BUDGET
+    return p ** m < 2 ** 32 and log_table_bytes(p, m) <= memory_budget
+
+# Pick the table engine when its tables fit in memory_budget, otherwise compute on demand.
+# With cache=True the tables are loaded from, or saved to, the on-disk table cache;
+# progress is passed on to LogTableField.
+def make_field(p, m, mod_poly, memory_budget=None, cache=False, progress=None, processes=None):
+    if uses_log_tables(p, m, memory_budget):
+        if not cache or p ** m < TABLE_CACHE_MIN_ORDER:
+            return LogTableField(p, m, mod_poly, progress, processes)
+        with stats_phase("table cache load"):
+            field = load_field_tables(p, m, mod_poly)
+        if field is None:
+            field = LogTableField(p, m, mod_poly, progress, processes)
+            try:
+                with stats_phase("table cache save"):
+                    save_field_tables(field)
+            except OSError:
+                # A read-only or full cache directory only costs the rebuild next time
+                pass
+        return field
+    return LazyField(p, m, mod_poly)
+
+# Parallel table construction. Tables are split into blocks of rows handed to a pool of
+# worker processes; every worker maps the same shared-memory file and writes its block in
+# place, so nothing but block bounds is pickled. The parent maps the file too and returns
+# memoryviews of it, which keep the mapping alive after the file itself is removed.
+# Fields (or multiplication tables) with fewer than PARALLEL_TABLE_MIN_SIZE elements (or
+# entries) are built serially, since starting the workers costs more than they save.
+PARALLEL_TABLE_MIN_SIZE = 1 << 18
+# Worker processes used for large tables when none are requested. Workers are started
+# with spawn, so scripts raising this need an `if __name__ == "__main__":` guard.
+TABLE_BUILD_PROCESSES = 1
+# Largest full multiplication table (in bytes) mul_table_array will build
+MUL_TABLE_MEMORY_BUDGET = 1 << 30
+
+# Number of processes to build a table of `size` entries with
+def _table_processes(size, processes=None):
+    if processes is None:
+        processes = TABLE_BUILD_PROCESSES
+    if processes <= 1 or size < PARALLEL_TABLE_MIN_SIZE:
+        return 1
+    import multiprocessing
+    # Pool workers are daemonic and may not start pools of their own
+    if multiprocessing.current_process().daemon:
+        return 1
+    return processes
+
+# A zero-filled file of `size` bytes in shared memory (/dev/shm where it exists), mapped
+# by the caller. Returns (path, mmap).
+def _shared_table_file(size):
+    import mmap
+    import os
+    import tempfile
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    fd, path = tempfile.mkstemp(prefix="ffc-table-", dir=directory)
+    try:
+        os.ftruncate(fd, size)
+        mm = mmap.mmap(fd, size)
+    except BaseException:
+        os.close(fd)
+        os.remove(path)
+        raise
+    os.close(fd)
+    return path, mm
+
+def _remove_shared_table_file(path):
+    import os
+    try:
+        os.remove(path)
+    except OSError:
+        # Windows cannot remove a file that is still mapped; the temp directory gets it later
+        pass
+
+# Split range(total) into about 4 blocks per process (for load balancing)
+def _table_blocks(total, processes):
+    size = max(1, -(-total // (4 * processes)))
+    return [(start, min(start + size, total)) for start in range(0, total, size)]
+
+# Run worker(path, start, stop) over blocks in a pool; progress(phase, done, total) is called
+# as blocks complete, counting in units of `total`
+def _run_table_pool(worker, path, blocks, processes, phase, total, progress, initargs=()):
+    import multiprocessing
+    # spawn rather than fork: the GUI builds fields from a worker thread, and a forked
+    # child of a threaded process can inherit locks held by other threads
+    context = multiprocessing.get_context("spawn")
+    done = 0
+    with context.Pool(processes, _table_worker_init, initargs) as pool:
+        tasks = [(path, start, stop) for start, stop in blocks]
+        for start, stop in pool.imap_unordered(worker, tasks):
+            done += stop - start
+            if progress:
+                progress(phase, done, total)
+
+# Worker-process state for parallel table construction
+_table_worker = {}
+
+def _table_worker_init(p=None, m=None, mod_poly=None, generator=None):
+    if p is None:
+        return
+    if generator is None:
+        _table_worker['field'] = make_field(p, m, mod_poly, processes=1)
+    else:
+        # Only the generator is needed to fill log blocks; the tables are in the shared file
+        _table_worker['field'] = LogTableField.from_tables(p, m, mod_poly, generator, None, None)
+
+# Memoryviews of consecutive 'I' tables with the given lengths in the mapping mm
+def _shared_table_views(mm, lengths):
+    view = memoryview(mm)
+    tables = []
+    offset = 0
+    for n in lengths:
+        tables.append(view[offset:offset + n * _TABLE_ITEMSIZE].cast(_TABLE_TYPECODE))
+        offset += n * _TABLE_ITEMSIZE
+    return tables
+
+def _log_block_worker(task):
+    import mmap
+    path, start, stop = task
+    field = _table_worker['field']
+    q = field.order
+    with open(path, "r+b") as f:
+        mm = mmap.mmap(f.fileno(), 0)
+    exp, log = _shared_table_views(mm, (2 * (q - 1), q))
+    field._fill_log_block(exp, log, start, stop)
+    exp.release()
+    log.release()
+    mm.close()
+    return start, stop
+
+def _zech_block_worker(task):
+    import mmap
+    path, start, stop = task
+    field = _table_worker['field']
+    q = field.order
+    with open(path, "r+b") as f:
+        mm = mmap.mmap(f.fileno(), 0)
+    field.exp, field.log, zech = _shared_table_views(mm, (2 * (q - 1), q, q - 1))
+    field._fill_zech_block(zech, start, stop)
+    for table in (field.exp, field.log, zech):
+        table.release()
+    field.exp = field.log = None
+    mm.close()
+    return start, stop
+
+# Build the exp / log (and for odd p, Zech) tables of `field` in `processes` workers.
+# The generator powers are split into independent blocks; the Zech table is a second
+# pass once exp and log are complete.
+def _build_tables_parallel(field, processes, progress=None):
+    p, m, q = field.p, field.m, field.order
+    has_zech = p != 2 and m > 1
+    lengths = (2 * (q - 1), q) + ((q - 1,) if has_zech else ())
+    path, mm = _shared_table_file(sum(lengths) * _TABLE_ITEMSIZE)
+    try:
+        initargs = (p, m, field.mod_poly, field.generator)
+        _run_table_pool(_log_block_worker, path, _table_blocks(q - 1, processes), processes,
+                        "log tables", q - 1, progress, initargs)
+        if has_zech:
+            _run_table_pool(_zech_block_worker, path, _table_blocks(q - 1, processes), processes,
+                            "Zech logarithms", q - 1, progress, initargs)
+    finally:
+        _remove_shared_table_file(path)
+    tables = _shared_table_views(mm, lengths)
+    field.exp, field.log = tables[0], tables[1]
+    field._zech = tables[2] if has_zech else None
+
+# Write rows start <= a < stop of the full multiplication table into `table` (a flat
+# q*q 'I' buffer, already zero-filled); row 0 and column 0 stay zero
+def _fill_mul_rows(field, table, start, stop):
+    from array import array
+    from operator import itemgetter
+    q = field.order
+    if isinstance(field, LogTableField):
+        exp = field.exp
+        # Row a is exp shifted by log[a], gathered at the logs of 1..q-1
+        gather = itemgetter(*field.log[1:]) if q > 2 else lambda row: (row[0],)
+        for a in range(max(start, 1), stop):
+            la = field.log[a]
+            table[a * q + 1:(a + 1) * q] = array(_TABLE_TYPECODE, gather(exp[la:la + q - 1]))
+    else:
+        for a in range(max(start, 1), stop):
+            table[a * q + 1:(a + 1) * q] = array(_TABLE_TYPECODE, [field.mul(a, b) for b in range(1, q)])
+
+def _mul_rows_worker(task):
+    import mmap
+    path, start, stop = task
+    field = _table_worker['field']
+    with open(path, "r+b") as f:
+        mm = mmap.mmap(f.fileno(), 0)
+    table, = _shared_table_views(mm, (field.order ** 2,))
+    _fill_mul_rows(field, table, start, stop)
+    table.release()
+    mm.close()
+    return start, stop
+
+# Full multiplication table of a field as a flat memoryview of q*q unsigned ints:
+# entry a*q + b is the packed product a*b. Large tables are built by `processes`
+# workers writing row blocks into shared memory; the result maps that memory directly.
+def mul_table_array(field, processes=None, progress=None):
+    q = field.order
+    if q * q * _TABLE_ITEMSIZE > MUL_TABLE_MEMORY_BUDGET or q >= 2 ** 32:
+        raise ValueError(f"F({field.p}^{field.m}) is too large for a full multiplication table")
+    with stats_phase("multiplication table"):
+        return _mul_table_array(field, q, _table_processes(q * q, processes), progress)
+
+def _mul_table_array(field, q, processes, progress):
+    from array import array
+    if processes == 1:
+        table = memoryview(array(_TABLE_TYPECODE, [0]) * (q * q))
+        for start, stop in _table_blocks(q, 1):
+            _fill_mul_rows(field, table, start, stop)
+            if progress:
+                progress("multiplication table", stop, q)
+        return table
+    path, mm = _shared_table_file(q * q * _TABLE_ITEMSIZE)
+    try:
+        _run_table_pool(_mul_rows_worker, path, _table_blocks(q, processes), processes,
+                        "multiplication table", q, progress, (field.p, field.m, field.mod_poly))
+    finally:
+        _remove_shared_table_file(path)
+    table, = _shared_table_views(mm, (q * q,))
+    return table
+
+# Lazily import NumPy; only the batch array arithmetic needs it
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("FieldArray needs NumPy; install it with 'pip install numpy'") from None
+    return numpy
+
+# Many elements of one field held as a NumPy int64 array of packed integers (see poly_to_int).
+# Arithmetic is elementwise and vectorized: log/antilog/Zech table gathers for a LogTableField,
+# bitwise carry-less products for GF(2^m), and digit-matrix polynomial multiplication and
+# reduction otherwise. Every result matches the scalar field methods exactly.
+class FieldArray:
+    def __init__(self, field, values):
+        np = _require_numpy()
+        if field.order >= 2 ** 62:
+            raise ValueError("FieldArray supports fields with fewer than 2^62 elements")
+        if field.mod_poly is None:
+            raise ValueError("FieldArray needs a field with a modulus over F_p; map tower elements "
+                             "to one with FieldIsomorphism")
+        self.field = field
+        self.values = np.asarray(values, dtype=np.int64)
+
+    @classmethod
+    def from_polys(cls, field, polys):
+        return cls(field, [field.to_int(poly) for poly in polys])
+
+    def to_polys(self):
+        return [self.field.from_int(int(v)) for v in self.values.ravel()]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        v = self.values[index]
+        return FieldArray(self.field, v) if v.ndim else int(v)
+
+    def __repr__(self):
+        return f"FieldArray(F({self.field.p}^{self.field.m}), {self.values.tolist()})"
+
+    def _operand(self, other):
+        np = _require_numpy()
+        if isinstance(other, FieldArray):
+            if other.field is not self.field:
+                raise ValueError("FieldArray operands belong to different fields")
+            return other.values
+        return np.asarray(other, dtype=np.int64)
+
+    def _wrap(self, values):
+        return FieldArray(self.field, values)
+
+    # NumPy views of the log/antilog/Zech tables, shared zero-copy with the field
+    def _tables(self):
+        np = _require_numpy()
+        field = self.field
+        tables = getattr(field, "_numpy_tables", None)
+        if tables is None:
+            exp = np.frombuffer(field.exp, dtype=np.dtype(_TABLE_TYPECODE)).astype(np.int64)
+            log = np.frombuffer(field.log, dtype=np.dtype(_TABLE_TYPECODE)).astype(np.int64)
+            zech = None
+            if field._zech is not None:
+                zech = np.frombuffer(field._zech, dtype=np.dtype(_TABLE_TYPECODE)).astype(np.int64)
+            tables = field._numpy_tables = (exp, log, zech)
+        return tables
+
+    # Base-p digits of packed values, shape values.shape + (m,)
+    def _digits(self, values):
+        np = _require_numpy()
+        p, m = self.field.p, self.field.m
+        out = np.empty(values.shape + (m,), dtype=np.int64)
+        rest = values.copy()
+        for i in range(m):
+            rest, out[..., i] = np.divmod(rest, p)
+        return out
+
+    def _pack(self, digits):
+        np = _require_numpy()
+        weights = np.array([self.field.p ** i for i in range(self.field.m)], dtype=np.int64)
+        return digits @ weights
+
+    def _add(self, a, b):
+        np = _require_numpy()
+        field = self.field
+        p = field.p
+        if p == 2:
+            return a ^ b
+        if field.m == 1:
+            return (a + b) % p
+        if isinstance(field, LogTableField):
+            exp, log, zech = self._tables()
+            a, b = np.broadcast_arrays(a, b)
+            q1 = field.order - 1
+            la = log[a]
+            z = zech[(log[b] - la) % q1]
+            res = np.where(z == q1, 0, exp[la + np.where(z == q1, 0, z)])
+            return np.where(a == 0, b, np.where(b == 0, a, res))
+        return self._pack((self._digits(a) + self._digits(b)) % p)
+
+    def _neg(self, a):
+        np = _require_numpy()
+        field = self.field
+        if field.p == 2:
+            return a.copy()
+        if field.m == 1:
+            return (-a) % field.p
+        if isinstance(field, LogTableField):
+            exp, log, _ = self._tables()
+            return np.where(a == 0, 0, exp[log[a] + (field.order - 1) // 2])
+        return self._pack((-self._digits(a)) % field.p)
+
+    def _mul(self, a, b):
+        np = _require_numpy()
+        field = self.field
+        p, m = field.p, field.m
+        a, b = np.broadcast_arrays(a, b)
+        if isinstance(field, LogTableField):
+            exp, log, _ = self._tables()
+            return np.where((a == 0) | (b == 0), 0, exp[log[a] + log[b]])
+        if m == 1:
+            if p < 2 ** 31:
+                return a * b % p
+            return (a.astype(object) * b % p).astype(np.int64)
+        if p == 2:
+            # Carry-less shift-and-add, folding x^m back in at every step as _gf2_mulmod does
+            mod_int = poly_to_int(field.mod_poly, 2)
+            res = np.zeros(a.shape, dtype=np.int64)
+            cur = a.copy()
+            for i in range(m):
+                res ^= np.where((b >> i) & 1, cur, 0)
+                cur <<= 1
+                cur ^= np.where((cur >> m) & 1, mod_int, 0)
+            return res
+        da, db = self._digits(a), self._digits(b)
+        prod = np.zeros(a.shape + (2 * m - 1,), dtype=np.int64)
+        for i in range(m):
+            prod[..., i:i + m] = (prod[..., i:i + m] + da[..., i:i + 1] * db) % p
+        low = np.array(field.mod_poly[:m], dtype=np.int64)
+        for k in range(2 * m - 2, m - 1, -1):
+            top = prod[..., k:k + 1]
+            prod[..., k - m:k] = (prod[..., k - m:k] - top * low) % p
+        return self._pack(prod[..., :m])
+
+    def _pow(self, a, e):
+        np = _require_numpy()
+        field = self.field
+        q1 = field.order - 1
+        if e < 0 and np.any(a == 0):
+            raise ValueError("No inverse exists for 0")
+        if isinstance(field, LogTableField):
+            exp, log, _ = self._tables()
+            k = (log[a].astype(np.uint64) * np.uint64(e % q1) % np.uint64(q1)).astype(np.int64)
+            res = exp[k]
+        else:
+            res = np.ones(a.shape, dtype=np.int64)
+            base = a.copy()
+            k = e % q1
+            while k:
+                if k & 1:
+                    res = self._mul(res, base)
+                base = self._mul(base, base)
+                k >>= 1
+        # 0^e stays 0 for e > 0 and is 1 for e = 0, matching FiniteField.pow
+        return np.where(a == 0, 0 if e > 0 else 1, res)
+
+    def __add__(self, other):
+        return self._wrap(self._add(self.values, self._operand(other)))
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return self._wrap(self._neg(self.values))
+
+    def __sub__(self, other):
+        return self._wrap(self._add(self.values, self._neg(self._operand(other))))
+
+    def __rsub__(self, other):
+        return self._wrap(self._add(self._operand(other), self._neg(self.values)))
+
+    def __mul__(self, other):
+        return self._wrap(self._mul(self.values, self._operand(other)))
+
+    __rmul__ = __mul__
+
+    def __pow__(self, e):
+        return self._wrap(self._pow(self.values, int(e)))
+
+    def inv(self):
+        return self._wrap(self._pow(self.values, -1))
+
+    def __truediv__(self, other):
+        np = _require_numpy()
+        divisor = self._operand(other)
+        if np.any(divisor == 0):
+            raise ValueError("No inverse exists for 0")
+        return self._wrap(self._mul(self.values, self._pow(divisor, -1)))
+
+    # Field sum of all elements, as a packed integer
+    def sum(self):
+        np = _require_numpy()
+        values = self.values.ravel()
+        if self.field.p == 2:
+            return int(np.bitwise_xor.reduce(values)) if len(values) else 0
+        if self.field.m == 1:
+            return int(values.astype(object).sum() % self.field.p)
+        return int(self._pack(self._digits(values).sum(axis=0) % self.field.p))
+
+    def dot(self, other):
+        return (self * other).sum()
+
+# A field element given as a packed integer, a coefficient list or a polynomial string
+def _field_element(field, value):
+    if isinstance(value, str):
+        return field.from_str(value)
+    if isinstance(value, (list, tuple)):
+        if isinstance(field, TowerField):
+            return field.from_coeffs(value)
+        return field.to_int(poly_mod(list(value), field.mod_poly, field.p))
+    return value
+
+# Pack GF(2^m) elements into one integer, m bits per entry (entry j at bits j*m ... j*m + m - 1)
+def _pack_bits(values, m):
+    if m == 8:
+        return int.from_bytes(bytes(values), 'little')
+    return int("".join(format(v, f"0{m}b") for v in reversed(values)) or "0", 2)
+
+def _unpack_bits(row, count, m):
+    if m == 8:
+        return list(row.to_bytes(count, 'little'))
+    bits = format(row, f"0{count * m}b")
+    return [int(bits[i - m:i], 2) for i in range(count * m, 0, -m)]
+
+# Rows of a GF(2^m) matrix as bit-packed integers. Adding rows is one XOR; a row times a
+# scalar comes from a table of the row's multiples, built once per pivot from the row times
+# 1, x, ..., x^(m-1) (every slot shifted and reduced at once) and combined 8 bits at a time.
+class _PackedRows:
+    def __init__(self, field, rows, ncols):
+        m = field.m
+        self.field = field
+        self.rows = rows
+        self.m = m
+        self.mask = (1 << m) - 1
+        ones = ((1 << (ncols * m)) - 1) // self.mask  # bit 0 of every slot
+        self._ones = ones
+        self._low = ones * ((1 << (m - 1)) - 1)  # all but the top bit of every slot
+        self._red = poly_to_int(field.mod_poly, 2) ^ (1 << m)  # x^m in terms of lower powers
+
+    def get(self, i, j):
+        return (self.rows[i] >> (j * self.m)) & self.mask
+
+    def swap(self, i, k):
+        rows = self.rows
+        rows[i], rows[k] = rows[k], rows[i]
+
+    # The row times x^0 ... x^(m-1)
+    def _basis(self, row):
+        basis = [row]
+        low, ones, red, top = self._low, self._ones, self._red, self.m - 1
+        for _ in range(top):
+            row = ((row & low) << 1) ^ (((row >> top) & ones) * red)
+            basis.append(row)
+        return basis
+
+    def _multiples(self, row):
+        basis = self._basis(row)
+        tables = []
+        for start in range(0, self.m, 8):
+            chunk = basis[start:start + 8]
+            table = [0] * (1 << len(chunk))
+            for v in range(1, len(table)):
+                low = v & -v
+                table[v] = table[v ^ low] ^ chunk[low.bit_length() - 1]
+            tables.append(table)
+        return tables
+
+    def scale(self, i, c):
+        basis = self._basis(self.rows[i])
+        row = 0
+        for k, b in enumerate(basis):
+            if c >> k & 1:
+                row ^= b
+        self.rows[i] = row
+
+    # Subtract (in characteristic 2, add) the right multiple of row i, whose entry in
+    # column col is 1, from each target row
+    def eliminate(self, i, col, targets):
+        rows, mask = self.rows, self.mask
+        shift = col * self.m
+        tables = self._multiples(rows[i])
+        if len(tables) == 1:
+            table = tables[0]
+            for r in targets:
+                c = (rows[r] >> shift) & mask
+                if c:
+                    rows[r] ^= table[c]
+            return
+        for r in targets:
+            c = (rows[r] >> shift) & mask
+            k = 0
+            while c:
+                if c & 255:
+                    rows[r] ^= tables[k][c & 255]
+                c >>= 8
+                k += 1
+
+# Rows of a matrix over any field as lists of packed integers, one field operation per entry
+class _ListRows:
+    def __init__(self, field, rows):
+        self.field = field
+        self.rows = rows
+
+    def get(self, i, j):
+        return self.rows[i][j]
+
+    def swap(self, i, k):
+        rows = self.rows
+        rows[i], rows[k] = rows[k], rows[i]
+
+    def scale(self, i, c):
+        mul = self.field.mul
+        self.rows[i] = [mul(c, a) for a in self.rows[i]]
+
+    def eliminate(self, i, col, targets):
+        field, rows = self.field, self.rows
+        add, mul = field.add, field.mul
+        pivot = rows[i][col:]
+        for r in targets:
+            row = rows[r]
+            c = row[col]
+            if c:
+                c = field.neg(c)
+                rows[r] = row[:col] + [add(a, mul(c, b)) for a, b in zip(row[col:], pivot)]
+
+# Rows as one NumPy array; each step updates every target row at once. Prime fields with
+# word-size p use plain int64 arithmetic, fields of at most _DENSE_TABLE_ORDER elements full
+# addition and multiplication tables (two gathers per entry), others the FieldArray arithmetic.
+_DENSE_TABLE_ORDER = 1024
+
+class _ArrayRows:
+    def __init__(self, field, rows):
+        np = _require_numpy()
+        self.field = field
+        self.array = np.array(rows, dtype=np.int64).reshape(len(rows), -1)
+        self._ops = FieldArray(field, [])
+        self._tables = None
+        if field.m > 1 and field.order <= _DENSE_TABLE_ORDER:
+            tables = getattr(field, "_dense_tables", None)
+            if tables is None:
+                q = np.arange(field.order, dtype=np.int64)
+                tables = field._dense_tables = (self._ops._add(q[:, None], q[None, :]),
+                                                self._ops._mul(q[:, None], q[None, :]))
+            self._tables = tables
+
+    @property
+    def rows(self):
+        return self.array.tolist()
+
+    def get(self, i, j):
+        return int(self.array[i, j])
+
+    def swap(self, i, k):
+        self.array[[i, k]] = self.array[[k, i]]
+
+    def scale(self, i, c):
+        self.array[i] = self._ops._mul(self.array[i], c)
+
+    def eliminate(self, i, col, targets):
+        np = _require_numpy()
+        a, ops = self.array, self._ops
+        targets = np.fromiter(targets, dtype=np.int64)
+        targets = targets[a[targets, col] != 0]
+        if not len(targets):
+            return
+        block = a[targets, col:]
+        factors = ops._neg(block[:, :1])
+        pivot = a[i, col:][None, :]
+        field = self.field
+        if field.m == 1 and field.p < 2 ** 31:
+            a[targets, col:] = (block + factors * pivot) % field.p
+        elif self._tables is not None:
+            add, mul = self._tables
+            a[targets, col:] = add[block, mul[factors, pivot]]
+        else:
+            a[targets, col:] = ops._add(block, ops._mul(factors, pivot))
+
+# Gauss-Jordan elimination over the first `ncols` columns. Returns (pivot columns,
+# determinant factor): with full=False only the rows below each pivot are cleared (row
+# echelon form, enough for rank and determinant), otherwise the reduced row echelon form.
+def _row_reduce(field, backend, nrows, ncols, full=True):
+    pivots = []
+    det = 1
+    rank = 0
+    for col in range(ncols):
+        if rank == nrows:
+            break
+        pivot = next((i for i in range(rank, nrows) if backend.get(i, col)), None)
+        if pivot is None:
+            continue
+        if pivot != rank:
+            backend.swap(pivot, rank)
+            det = field.neg(det)
+        c = backend.get(rank, col)
+        det = field.mul(det, c)
+        if c != 1:
+            backend.scale(rank, field.inv(c))
+        targets = range(rank + 1, nrows) if not full else [r for r in range(nrows) if r != rank]
+        backend.eliminate(rank, col, targets)
+        pivots.append(col)
+        rank += 1
+    return pivots, det
+
+# Matrices over a field engine, holding packed elements. Over GF(2^m) rows are bit-packed
+# integers (see _PackedRows); otherwise row operations use NumPy when it is installed
+# (and the field has fewer than 2^62 elements) and plain lists of field operations if not.
+# Entries may be given as packed integers, coefficient lists or polynomial strings.
+class FieldMatrix:
+    def __init__(self, field, rows):
+        rows = [[_field_element(field, v) for v in row] for row in rows]
+        if any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("All matrix rows must have the same length")
+        self.field = field
+        self.nrows = len(rows)
+        self.ncols = len(rows[0]) if rows else 0
+        self._rows = rows
+
+    @classmethod
+    def _from_rows(cls, field, rows, ncols):
+        matrix = cls.__new__(cls)
+        matrix.field = field
+        matrix.nrows = len(rows)
+        matrix.ncols = ncols
+        matrix._rows = rows
+        return matrix
+
+    @classmethod
+    def zeros(cls, field, nrows, ncols=None):
+        ncols = nrows if ncols is None else ncols
+        return cls._from_rows(field, [[0] * ncols for _ in range(nrows)], ncols)
+
+    @classmethod
+    def identity(cls, field, n):
+        return cls._from_rows(field, [[int(i == j) for j in range(n)] for i in range(n)], n)
+
+    @classmethod
+    def random(cls, field, nrows, ncols=None, rng=None):
+        if rng is None:
+            import random
+            rng = random
+        ncols = nrows if ncols is None else ncols
+        q = field.order
+        return cls._from_rows(field, [[rng.randrange(q) for _ in range(ncols)] for _ in range(nrows)], ncols)
+
+    @property
+    def shape(self):
+        return self.nrows, self.ncols
+
+    def tolist(self):
+        return [row[:] for row in self._rows]
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            i, j = index
+            return self._rows[i][j]
+        return self._rows[index][:]
+
+    def __eq__(self, other):
+        return (isinstance(other, FieldMatrix) and other.field is self.field
+                and other.shape == self.shape and other._rows == self._rows)
+
+    def __repr__(self):
+        return f"FieldMatrix(F({self.field.p}^{self.field.m}), {self.nrows}x{self.ncols}, {self._rows})"
+
+    def transpose(self):
+        return FieldMatrix._from_rows(self.field, [list(col) for col in zip(*self._rows)], self.nrows)
+
+    T = property(transpose)
+
+    def _check_same_field(self, other):
+        if other.field is not self.field:
+            raise ValueError("Matrices belong to different fields")
+
+    def __add__(self, other):
+        self._check_same_field(other)
+        if other.shape != self.shape:
+            raise ValueError(f"Cannot add {self.nrows}x{self.ncols} and {other.nrows}x{other.ncols} matrices")
+        add = self.field.add
+        return FieldMatrix._from_rows(self.field, [[add(a, b) for a, b in zip(r, s)]
+                                                   for r, s in zip(self._rows, other._rows)], self.ncols)
+
+    def __neg__(self):
+        neg = self.field.neg
+        return FieldMatrix._from_rows(self.field, [[neg(a) for a in row] for row in self._rows], self.ncols)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    # Scalar multiple (a packed element, coefficient list or polynomial string)
+    def __mul__(self, scalar):
+        if isinstance(scalar, FieldMatrix):
+            raise TypeError("Use @ for matrix products")
+        c = _field_element(self.field, scalar)
+        mul = self.field.mul
+        return FieldMatrix._from_rows(self.field, [[mul(c, a) for a in row] for row in self._rows], self.ncols)
+
+    __rmul__ = __mul__
+
+    # Row backend for elimination over the given rows (a copy of this matrix's by default)
+    def _backend(self, rows, ncols):
+        field = self.field
+        if field.mod_poly is None:
+            return _ListRows(field, [row[:] for row in rows])
+        if field.p == 2:
+            m = field.m
+            return _PackedRows(field, [_pack_bits(row, m) for row in rows], ncols)
+        if field.order < 2 ** 62:
+            try:
+                _require_numpy()
+                return _ArrayRows(field, rows)
+            except ImportError:
+                pass
+        return _ListRows(field, [row[:] for row in rows])
+
+    def _backend_rows(self, backend, ncols):
+        if isinstance(backend, _PackedRows):
+            return [_unpack_bits(row, ncols, self.field.m) for row in backend.rows]
+        return backend.rows
+
+    def __matmul__(self, other):
+        self._check_same_field(other)
+        if self.ncols != other.nrows:
+            raise ValueError(f"Cannot multiply {self.nrows}x{self.ncols} by {other.nrows}x{other.ncols}")
+        field, n = self.field, other.ncols
+        if field.p == 2 and field.mod_poly is not None:
+            # Row i of the product is the sum of a_ij times row j of other; the multiples
+            # of each packed row j are tabulated once and shared by every i
+            backend = self._backend(other._rows, n)
+            result = [0] * self.nrows
+            columns = list(zip(*self._rows)) if self.nrows else []
+            for j, column in enumerate(columns):
+                tables = backend._multiples(backend.rows[j])
+                for i, c in enumerate(column):
+                    k = 0
+                    while c:
+                        if c & 255:
+                            result[i] ^= tables[k][c & 255]
+                        c >>= 8
+                        k += 1
+            return FieldMatrix._from_rows(field, [_unpack_bits(row, n, field.m) for row in result], n)
+        backend = self._backend(other._rows, n)
+        if isinstance(backend, _ArrayRows):
+            np = _require_numpy()
+            a = np.array(self._rows, dtype=np.int64).reshape(self.nrows, self.ncols)
+            b, ops = backend.array, backend._ops
+            if field.m == 1 and self.ncols * (field.p - 1) ** 2 < 2 ** 63:
+                product = a @ b % field.p
+            elif backend._tables is not None:
+                add, mul = backend._tables
+                product = np.zeros((self.nrows, n), dtype=np.int64)
+                for j in range(self.ncols):
+                    product = add[product, mul[a[:, j:j + 1], b[j][None, :]]]
+            else:
+                product = np.zeros((self.nrows, n), dtype=np.int64)
+                for j in range(self.ncols):
+                    product = ops._add(product, ops._mul(a[:, j:j + 1], b[j][None, :]))
+            return FieldMatrix._from_rows(field, product.tolist(), n)
+        add, mul = field.add, field.mul
+        result = []
+        for row in self._rows:
+            acc = [0] * n
+            for c, other_row in zip(row, other._rows):
+                if c:
+                    acc = [add(s, mul(c, b)) for s, b in zip(acc, other_row)]
+            result.append(acc)
+        return FieldMatrix._from_rows(field, result, n)
+
+    # Reduced row echelon form and its pivot columns
+    def rref(self):
+        backend = self._backend(self._rows, self.ncols)
+        pivots, _ = _row_reduce(self.field, backend, self.nrows, self.ncols)
+        return FieldMatrix._from_rows(self.field, self._backend_rows(backend, self.ncols), self.ncols), pivots
+
+    def rank(self):
+        backend = self._backend(self._rows, self.ncols)
+        return len(_row_reduce(self.field, backend, self.nrows, self.ncols, full=False)[0])
+
+    def det(self):
+        if self.nrows != self.ncols:
+            raise ValueError("Only square matrices have a determinant")
+        backend = self._backend(self._rows, self.ncols)
+        pivots, det = _row_reduce(self.field, backend, self.nrows, self.ncols, full=False)
+        return det if len(pivots) == self.nrows else 0
+
+    def inverse(self):
+        n = self.nrows
+        if n != self.ncols:
+            raise ValueError("Only square matrices can be inverted")
+        identity = FieldMatrix.identity(self.field, n)._rows
+        backend = self._backend([row + extra for row, extra in zip(self._rows, identity)], 2 * n)
+        pivots, _ = _row_reduce(self.field, backend, n, n)
+        if len(pivots) < n:
+            raise ValueError("Matrix is singular")
+        rows = self._backend_rows(backend, 2 * n)
+        return FieldMatrix._from_rows(self.field, [row[n:] for row in rows], n)
+
+    # Solve self @ x = b for a vector (list of elements) or matrix b; with free variables
+    # the solution setting them to zero is returned
+    def solve(self, b):
+        vector = not isinstance(b, FieldMatrix)
+        if vector:
+            b = FieldMatrix(self.field, [[v] for v in b])
+        self._check_same_field(b)
+        if b.nrows != self.nrows:
+            raise ValueError(f"Right-hand side has {b.nrows} rows, expected {self.nrows}")
+        n, k = self.ncols, b.ncols
+        backend = self._backend([row + extra for row, extra in zip(self._rows, b._rows)], n + k)
+        pivots, _ = _row_reduce(self.field, backend, self.nrows, n)
+        rows = self._backend_rows(backend, n + k)
+        if any(any(row[n:]) for row in rows[len(pivots):]):
+            raise ValueError("The system has no solution")
+        solution = [[0] * k for _ in range(n)]
+        for row, col in zip(rows, pivots):
+            solution[col] = row[n:]
+        if vector:
+            return [row[0] for row in solution]
+        return FieldMatrix._from_rows(self.field, solution, k)
+
+# Products of polynomials over GF(p^m) with both factors at least this long use Kronecker
+# substitution, and divisions with quotient and divisor this long use a Newton inverse
+FIELD_POLY_KRONECKER_THRESHOLD = 32
+FIELD_POLY_NEWTON_THRESHOLD = 64
+# Subproduct-tree nodes of at most this many points are finished with Horner's rule
+_SUBPRODUCT_LEAF = 8
+
+def _fpoly_trim(coeffs):
+    while coeffs and coeffs[-1] == 0:
+        coeffs.pop()
+    return coeffs
+
+def _fpoly_add(field, a, b):
+    add = field.add
+    if len(a) < len(b):
+        a, b = b, a
+    return _fpoly_trim([add(x, y) for x, y in zip(a, b)] + a[len(b):])
+
+def _fpoly_sub(field, a, b):
+    neg = field.neg
+    return _fpoly_add(field, a, [neg(c) for c in b])
+
+def _fpoly_scale(field, c, a):
+    mul = field.mul
+    return _fpoly_trim([mul(c, x) for x in a]) if c else []
+
+# Product of two coefficient lists of packed elements (low degree first)
+def _fpoly_mul(field, a, b):
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) >= FIELD_POLY_KRONECKER_THRESHOLD and field.m > 1 and field.mod_poly is not None:
+        return _fpoly_trim(_fpoly_kron_mul(field, a, b))
+    res = [0] * (len(a) + len(b) - 1)
+    if field.p == 2 and isinstance(field, LogTableField):
+        # XOR-accumulate products read straight off the log tables
+        exp, log = field.exp, field.log
+        logs = [(j, log[y]) for j, y in enumerate(b) if y]
+        for i, x in enumerate(a):
+            if x:
+                lx = log[x]
+                for j, ly in logs:
+                    res[i + j] ^= exp[lx + ly]
+        return _fpoly_trim(res)
+    add, mul = field.add, field.mul
+    nonzero = [(j, y) for j, y in enumerate(b) if y]
+    for i, x in enumerate(a):
+        if x:
+            for j, y in nonzero:
+                res[i + j] = add(res[i + j], mul(x, y))
+    return _fpoly_trim(res)
+
+# Kronecker substitution into F_p[x]: coefficient i contributes its m base-p digits at
+# x^(i(2m-1)), so each product of two coefficients fills its own 2m-1 slot and one poly_mul
+# (one big-integer product) yields every unreduced coefficient; each slot is then reduced
+# modulo the field polynomial. Prime fields (m = 1) never get here.
+def _fpoly_kron_mul(field, a, b):
+    p, m = field.p, field.m
+    if p == 2:
+        return _gf2_kron_mul(field, a, b)
+    w = 2 * m - 1
+    pad = [0] * (m - 1)
+    spread_a, spread_b = [], []
+    for c in a:
+        spread_a += field.from_int(c) + pad
+    for c in b:
+        spread_b += field.from_int(c) + pad
+    prod = poly_mul(spread_a, spread_b, p) + [0] * w
+    mod_poly, to_int = field.mod_poly, field.to_int
+    return [to_int(poly_mod(prod[k * w:(k + 1) * w], mod_poly, p)) for k in range(len(a) + len(b) - 1)]
+
+# Bit i of a byte moved to the low byte of slot i, for slots of `step` bytes
+_gf2_spread_tables = {}
+# Parity of a byte as an ASCII binary digit
+_PARITY_DIGITS = b"01" * 128
+
+def _gf2_spread_table(step):
+    table = _gf2_spread_tables.get(step)
+    if table is None:
+        table = _gf2_spread_tables[step] = [
+            b"".join(bytes([v >> i & 1]) + bytes(step - 1) for i in range(8)) for v in range(256)]
+    return table
+
+# The same over GF(2^m) with one integer slot of whole bytes per bit, wide enough that no slot
+# sum spills into the next: the parity of each slot's low byte is the carry-less product bit
+def _gf2_kron_mul(field, a, b):
+    m = field.m
+    w = 2 * m - 1
+    count = len(a) + len(b) - 1
+    step = -(-(min(len(a), len(b)) * m).bit_length() // 8)
+    spread = _gf2_spread_table(step)
+    nbytes, keep, tail = -(-m // 8), m * step, bytes((w - m) * step)
+
+    def pack(poly):
+        if nbytes == 1:
+            parts = [spread[c] + tail for c in poly]
+        else:
+            parts = [b"".join(spread[v] for v in c.to_bytes(nbytes, 'little'))[:keep] + tail for c in poly]
+        return int.from_bytes(b"".join(parts), 'little')
+
+    raw = (pack(a) * pack(b)).to_bytes(count * w * step, 'little')
+    bits = raw[::step].translate(_PARITY_DIGITS).decode()
+    fold = _gf2_fold_table(field)
+    low = (1 << m) - 1
+    res = []
+    for k in range(0, count * w, w):
+        v = int(bits[k:k + w][::-1], 2)
+        res.append((v & low) ^ fold(v >> m))
+    return res
+
+# Over GF(2^m), h -> h * x^m mod f for h < 2^(m-1) (the high half of an unreduced product),
+# tabulated for m <= 16
+def _gf2_fold_table(field):
+    fold = getattr(field, "_gf2_fold", None)
+    if fold is None:
+        m = field.m
+        mod_int = poly_to_int(field.mod_poly, 2)
+        x_m = mod_int ^ (1 << m)
+        if m <= 16:
+            table = [_gf2_mulmod(h, x_m, mod_int, m) for h in range(1 << (m - 1))]
+            fold = table.__getitem__
+        else:
+            fold = lambda h: _gf2_mulmod(h, x_m, mod_int, m)
+        field._gf2_fold = fold
+    return fold
+
+# 1 / f mod x^n by Newton iteration (f[0] must be nonzero)
+def _fpoly_inv_series(field, f, n):
+    neg = field.neg
+    g = [field.inv(f[0])]
+    prec = 1
+    while prec < n:
+        prec = min(2 * prec, n)
+        e = _fpoly_mul(field, f[:prec], g)[:prec]
+        e += [0] * (prec - len(e))
+        # e = 1 mod x^len(g); the next coefficients of g cancel the rest of e
+        high = _fpoly_mul(field, g, e[len(g):])[:prec - len(g)]
+        g = g + [neg(c) for c in high] + [0] * (prec - len(g) - len(high))
+    return g
+
+# (quotient, remainder) of coefficient lists; b must be nonzero
+def _fpoly_divmod(field, a, b):
+    if not b:
+        raise ValueError("Polynomial division by zero")
+    if len(a) < len(b):
+        return [], a[:]
+    qlen = len(a) - len(b) + 1
+    if min(qlen, len(b)) >= FIELD_POLY_NEWTON_THRESHOLD:
+        # Reversed polynomials turn the quotient into a truncated power series product
+        inv = _fpoly_inv_series(field, b[::-1], qlen)
+        quot = _fpoly_mul(field, a[::-1][:qlen], inv)[:qlen]
+        quot = _fpoly_trim((quot + [0] * (qlen - len(quot)))[::-1])
+        rem = _fpoly_sub(field, a[:len(b) - 1], _fpoly_mul(field, quot, b)[:len(b) - 1])
+        return quot, rem
+    add, mul, neg = field.add, field.mul, field.neg
+    lead_inv = field.inv(b[-1])
+    rem = a[:]
+    quot = [0] * qlen
+    body = [(i, neg(c)) for i, c in enumerate(b[:-1]) if c]
+    for shift in range(qlen - 1, -1, -1):
+        top = rem[shift + len(b) - 1]
+        if top:
+            factor = mul(top, lead_inv)
+            quot[shift] = factor
+            for i, c in body:
+                rem[shift + i] = add(rem[shift + i], mul(factor, c))
+    return _fpoly_trim(quot), _fpoly_trim(rem[:len(b) - 1])
+
+def _fpoly_horner(field, coeffs, x):
+    add, mul = field.add, field.mul
+    acc = 0
+    for c in reversed(coeffs):
+        acc = add(mul(acc, x), c)
+    return acc
+
+# Subproduct tree of prod(x - points[i]): tree[0] are the linear leaves, every level above
+# holds the products of adjacent pairs (an odd node out is carried up unchanged)
+def _subproduct_tree(field, points):
+    neg = field.neg
+    level = [[neg(x), 1] for x in points]
+    tree = [level]
+    while len(level) > 1:
+        level = [_fpoly_mul(field, level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                 for i in range(0, len(level), 2)]
+        tree.append(level)
+    return tree
+
+# Values of coeffs at points through the tree: the remainder modulo each node is passed
+# down to its children, and nodes of at most _SUBPRODUCT_LEAF points use Horner's rule
+def _subproduct_evaluate(field, coeffs, points, tree):
+    values = [0] * len(points)
+    stack = [(len(tree) - 1, 0, _fpoly_divmod(field, coeffs, tree[-1][0])[1])]
+    while stack:
+        depth, index, rem = stack.pop()
+        start = index << depth
+        stop = min(start + (1 << depth), len(points))
+        if stop - start <= _SUBPRODUCT_LEAF:
+            for i in range(start, stop):
+                values[i] = _fpoly_horner(field, rem, points[i])
+            continue
+        below = tree[depth - 1]
+        for child in (2 * index, 2 * index + 1):
+            if child < len(below):
+                stack.append((depth - 1, child, _fpoly_divmod(field, rem, below[child])[1]))
+    return values
+
+# Polynomials in x with coefficients in a field engine, stored low degree first as packed
+# elements (the zero polynomial has no coefficients). Coefficients may also be given as
+# coefficient lists or polynomial strings, as FieldMatrix entries are.
+class FieldPoly:
+    def __init__(self, field, coeffs):
+        self.field = field
+        self.coeffs = _fpoly_trim([_field_element(field, c) for c in coeffs])
+
+    @classmethod
+    def _wrap(cls, field, coeffs):
+        poly = cls.__new__(cls)
+        poly.field = field
+        poly.coeffs = coeffs
+        return poly
+
+    # prod(x - r) over the roots, multiplied as a balanced tree
+    @classmethod
+    def from_roots(cls, field, roots):
+        roots = [_field_element(field, r) for r in roots]
+        if not roots:
+            return cls._wrap(field, [1])
+        return cls._wrap(field, _subproduct_tree(field, roots)[-1][0])
+
+    # The polynomial of degree below len(xs) through the points (xs[i], ys[i]): Lagrange
+    # weights ys[i] / M'(xs[i]) for M = prod(x - xs[i]), recombined up the subproduct tree
+    @classmethod
+    def interpolate(cls, field, xs, ys):
+        xs = [_field_element(field, x) for x in xs]
+        ys = [_field_element(field, y) for y in ys]
+        if len(xs) != len(ys):
+            raise ValueError("Interpolation needs as many values as points")
+        if not xs:
+            return cls._wrap(field, [])
+        tree = _subproduct_tree(field, xs)
+        derivative = cls._wrap(field, tree[-1][0]).derivative().coeffs
+        denominators = _subproduct_evaluate(field, derivative, xs, tree)
+        if 0 in denominators:
+            raise ValueError("Interpolation points must be distinct")
+        level = [[field.div(y, d)] if y else [] for y, d in zip(ys, denominators)]
+        for depth in range(len(tree) - 1):
+            nodes = tree[depth]
+            level = [_fpoly_add(field, _fpoly_mul(field, level[i], nodes[i + 1]),
+                                _fpoly_mul(field, level[i + 1], nodes[i]))
+                     if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)]
+        return cls._wrap(field, level[0])
+
+    @property
+    def degree(self):
+        return len(self.coeffs) - 1
+
+    def __bool__(self):
+        return bool(self.coeffs)
+
+    def __eq__(self, other):
+        return isinstance(other, FieldPoly) and other.field is self.field and other.coeffs == self.coeffs
+
+    def __repr__(self):
+        return f"FieldPoly(F({self.field.p}^{self.field.m}), {self.coeffs})"
+
+    def _operand(self, other):
+        if isinstance(other, FieldPoly):
+            if other.field is not self.field:
+                raise ValueError("Polynomials belong to different fields")
+            return other.coeffs
+        c = _field_element(self.field, other)
+        return [c] if c else []
+
+    def __add__(self, other):
+        return FieldPoly._wrap(self.field, _fpoly_add(self.field, self.coeffs, self._operand(other)))
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        neg = self.field.neg
+        return FieldPoly._wrap(self.field, [neg(c) for c in self.coeffs])
+
+    def __sub__(self, other):
+        return FieldPoly._wrap(self.field, _fpoly_sub(self.field, self.coeffs, self._operand(other)))
+
+    def __rsub__(self, other):
+        return FieldPoly._wrap(self.field, _fpoly_sub(self.field, self._operand(other), self.coeffs))
+
+    def __mul__(self, other):
+        return FieldPoly._wrap(self.field, _fpoly_mul(self.field, self.coeffs, self._operand(other)))
+
+    __rmul__ = __mul__
+
+    def __divmod__(self, other):
+        quot, rem = _fpoly_divmod(self.field, self.coeffs, self._operand(other))
+        return FieldPoly._wrap(self.field, quot), FieldPoly._wrap(self.field, rem)
+
+    def __floordiv__(self, other):
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        return divmod(self, other)[1]
+
+    # Formal derivative; coefficient i is multiplied by i mod p
+    def derivative(self):
+        mul = self.field.mul
+        p = self.field.p
+        return FieldPoly._wrap(self.field, _fpoly_trim([mul(c, i % p) for i, c in enumerate(self.coeffs) if i]))
+
+    def monic(self):
+        if not self.coeffs:
+            return self
+        return FieldPoly._wrap(self.field, _fpoly_scale(self.field, self.field.inv(self.coeffs[-1]), self.coeffs))
+
+    # Value at one point (Horner's rule)
+    def __call__(self, x):
+        return _fpoly_horner(self.field, self.coeffs, _field_element(self.field, x))
+
+    # Values at many points: Horner's rule for few points or a low degree, otherwise
+    # subproduct trees over blocks of degree + 1 points
+    def evaluate(self, points):
+        field = self.field
+        points = [_field_element(field, x) for x in points]
+        if len(points) <= _SUBPRODUCT_LEAF or self.degree <= _SUBPRODUCT_LEAF:
+            return [_fpoly_horner(field, self.coeffs, x) for x in points]
+        block = max(self.degree + 1, 2 * _SUBPRODUCT_LEAF)
+        values = []
+        for start in range(0, len(points), block):
+            chunk = points[start:start + block]
+            values += _subproduct_evaluate(field, self.coeffs, chunk, _subproduct_tree(field, chunk))
+        return values
+
+# Byte budget for the multiple tables of one _BatchLinearMap
+BATCH_MAP_TABLE_BUDGET = 64 * 1024 * 1024
+
+# The linear map x -> x @ M over a field, applied to many row vectors at once (a 2-D array
+# of packed elements, one vector per row). Over GF(2^m) with m <= 16, each row of M gets a
+# table of its multiples by every byte value, stored as uint64 words, so a vector entry costs
+# one gather and one XOR of a few words per byte. Past BATCH_MAP_TABLE_BUDGET, GF(2^m) log
+# tables give each product as one gather (logs of zero point past the end of the antilog
+# table, into zeros); other fields accumulate rows with the FieldArray arithmetic.
+class _BatchLinearMap:
+    def __init__(self, field, matrix):
+        np = _require_numpy()
+        self.field = field
+        self._ops = FieldArray(field, [])
+        self.matrix = np.array(matrix, dtype=np.int64).reshape(len(matrix), -1)
+        rows, cols = self.matrix.shape
+        self._tables = self._log = None
+        if field.p == 2 and field.m <= 16:
+            self._dtype = np.dtype(np.uint8 if field.m <= 8 else np.uint16)
+            self._chunks = -(-field.m // 8)
+            width = -(-cols * self._dtype.itemsize // 8) * 8 // self._dtype.itemsize
+            if rows * self._chunks * 256 * width * self._dtype.itemsize <= BATCH_MAP_TABLE_BUDGET:
+                self._build_tables(rows, cols, width)
+        if self._tables is None and field.p == 2 and isinstance(field, LogTableField):
+            exp, log, _ = self._ops._tables()
+            zero = 2 * (field.order - 1)
+            self._log = log.copy()
+            self._log[0] = zero
+            self._exp = np.concatenate([exp, np.zeros(zero + 1, dtype=np.int64)]).astype(np.uint32)
+            self._log_matrix = self._log[self.matrix]
+
+    def _build_tables(self, rows, cols, width):
+        np = _require_numpy()
+        tables = np.zeros((rows, self._chunks, 256, width), dtype=self._dtype)
+        for s in range(self._chunks):
+            values = np.arange(256, dtype=np.int64) << (8 * s)
+            values[values >= self.field.order] = 0
+            # A block of rows at a time keeps the int64 intermediates small
+            for start in range(0, rows, 64):
+                block = self.matrix[start:start + 64]
+                tables[start:start + 64, s, :, :cols] = self._ops._mul(values[None, :, None], block[:, None, :])
+        self._tables = tables.view(np.uint64)
+
+    def apply(self, vectors):
+        np = _require_numpy()
+        count = vectors.shape[0]
+        rows, cols = self.matrix.shape
+        if self._tables is not None:
+            acc = np.zeros((count, self._tables.shape[-1]), dtype=np.uint64)
+            columns = np.ascontiguousarray(vectors.T)
+            for i in range(rows):
+                column, table = columns[i], self._tables[i]
+                acc ^= table[0][column & 255 if self._chunks > 1 else column]
+                for s in range(1, self._chunks):
+                    acc ^= table[s][(column >> (8 * s)) & 255]
+            return acc.view(self._dtype)[:, :cols].astype(np.int64)
+        if self._log is not None:
+            logs = self._log[vectors]
+            acc = np.zeros((count, cols), dtype=np.uint32)
+            for i in range(rows):
+                acc ^= self._exp[logs[:, i:i + 1] + self._log_matrix[i]]
+            return acc.astype(np.int64)
+        ops = self._ops
+        vectors = np.asarray(vectors, dtype=np.int64)
+        acc = np.zeros((count, cols), dtype=np.int64)
+        for i in range(rows):
+            acc = ops._add(acc, ops._mul(vectors[:, i:i + 1], self.matrix[i][None, :]))
+        return acc
+
+# Systematic Reed-Solomon code RS(n, k) over a field: a codeword is the k message symbols
+# followed by n - k parity symbols, symbol i being the coefficient of x^(n-1-i), and the
+# generator polynomial has the roots alpha^fcr ... alpha^(fcr+n-k-1). Encoding and syndromes
+# are batched linear maps over whole arrays of blocks (see _BatchLinearMap); blocks with
+# nonzero syndromes are corrected one by one with Berlekamp-Massey, a vectorized Chien search
+# and Forney's formula, up to (n - k) // 2 symbol errors each. Needs NumPy.
+class ReedSolomonCodec:
+    def __init__(self, field, n, k, fcr=0, alpha=None):
+        _require_numpy()
+        if not 0 < k < n <= field.order - 1:
+            raise ValueError(f"Reed-Solomon codes over F({field.p}^{field.m}) need 0 < k < n <= "
+                             f"{field.order - 1}, got n={n}, k={k}")
+        alpha = field.primitive_element() if alpha is None else _field_element(field, alpha)
+        order = field.element_order(alpha)
+        if order < n:
+            raise ValueError(f"alpha has order {order}, below the code length {n}")
+        self.field = field
+        self.n = n
+        self.k = k
+        self.fcr = fcr
+        self.alpha = alpha
+        nsym = n - k
+        sub, mul, neg = field.sub, field.mul, field.neg
+        roots = [field.pow(alpha, fcr + j) for j in range(nsym)]
+        self.generator_poly = FieldPoly.from_roots(field, roots)
+        # Message symbol i is the coefficient of x^(n-1-i); its parity is -(x^(n-1-i) mod g),
+        # built up from x^(n-k) mod g one multiplication by x at a time
+        g = self.generator_poly.coeffs
+        rem = [neg(c) for c in g[:-1]]
+        powers = []
+        for _ in range(k):
+            powers.append(rem)
+            top = rem[-1]
+            rem = [sub(s, mul(top, c)) for s, c in zip([0] + rem[:-1], g[:-1])]
+        self._encoder = _BatchLinearMap(field, [[neg(c) for c in reversed(powers[k - 1 - i])] for i in range(k)])
+        # Syndrome j is sum_i c_i * roots[j]^(n-1-i)
+        column = [1] * nsym
+        matrix = []
+        for _ in range(n):
+            matrix.append(column)
+            column = [mul(c, r) for c, r in zip(column, roots)]
+        self._syndromes = _BatchLinearMap(field, matrix[::-1])
+        # Chien search points 1/X for the locators X = alpha^(n-1-i) of every position i, and
+        # X^(1-fcr) for Forney's formula
+        locators = [field.pow(alpha, n - 1 - i) for i in range(n)]
+        self._chien_points = FieldArray(field, [field.inv(x) for x in locators])
+        self._forney_scale = FieldArray(field, [field.pow(x, 1 - fcr) for x in locators]).values
+        powers = [FieldArray(field, [1] * n).values]
+        for _ in range(nsym + 1):
+            powers.append(self._chien_points._mul(powers[-1], self._chien_points.values))
+        self._chien = _BatchLinearMap(field, powers)
+
+    def _blocks(self, blocks, length):
+        np = _require_numpy()
+        blocks = np.asarray(blocks)
+        if blocks.ndim != 2 or blocks.shape[1] != length:
+            raise ValueError(f"Expected an array of blocks of {length} symbols")
+        if blocks.size and (blocks.min() < 0 or blocks.max() >= self.field.order):
+            raise ValueError(f"Symbols must be elements of F({self.field.p}^{self.field.m})")
+        return blocks
+
+    # Codewords for an array of messages, one k-symbol message per row
+    def encode_blocks(self, messages):
+        np = _require_numpy()
+        messages = self._blocks(messages, self.k)
+        parity = self._encoder.apply(messages)
+        return np.concatenate([messages, parity.astype(messages.dtype)], axis=1)
+
+    # (messages, corrected symbols per block) for an array of received codewords; a block
+    # with more errors than the code corrects raises ValueError
+    def decode_blocks(self, codewords):
+        np = _require_numpy()
+        codewords = self._blocks(codewords, self.n)
+        syndromes = self._syndromes.apply(codewords)
+        bad = np.flatnonzero(syndromes.any(axis=1))
+        counts = np.zeros(len(codewords), dtype=np.int64)
+        if len(bad):
+            rows, positions, errors, found, failed = self._locate_errors(syndromes[bad])
+            if len(failed):
+                raise ValueError(f"Block {bad[failed[0]]}: too many errors to correct")
+            codewords = codewords.copy()
+            ops = self._chien_points
+            rows = bad[rows]
+            codewords[rows, positions] = ops._add(codewords[rows, positions].astype(np.int64), ops._neg(errors))
+            counts[bad] = found
+            # A word beyond the correction radius can look decodable; it still fails here
+            left = self._syndromes.apply(codewords[bad]).any(axis=1)
+            if left.any():
+                raise ValueError(f"Block {bad[np.flatnonzero(left)[0]]}: too many errors to correct")
+        return codewords[:, :self.k], counts
+
+    # Error positions and values for the blocks with nonzero syndromes, all at once: each
+    # step of Berlekamp-Massey, the Chien search and Forney's formula is one vectorized
+    # operation across the blocks. Returns (rows, positions, values, error counts, failed
+    # rows), where failed rows have more errors than the code corrects.
+    def _locate_errors(self, syndromes):
+        np = _require_numpy()
+        ops = self._chien_points
+        nsym = self.n - self.k
+        count = len(syndromes)
+        rows = np.arange(count)
+        # Berlekamp-Massey: the shortest LFSR (error locator) generating each block's syndromes;
+        # `shifted` holds the previous locator times x^(steps since the last length change)
+        locator = np.zeros((count, nsym + 2), dtype=np.int64)
+        locator[:, 0] = 1
+        shifted = np.zeros_like(locator)
+        shifted[:, 1] = 1
+        length = np.zeros(count, dtype=np.int64)
+        last = np.ones(count, dtype=np.int64)
+        for i in range(nsym):
+            d = syndromes[:, i].copy()
+            for j in range(1, i + 1):
+                d = ops._add(d, ops._mul(locator[:, j], syndromes[:, i - j]))
+            nonzero = d != 0
+            factor = ops._mul(d, ops._pow(last, -1))
+            update = ops._add(locator, ops._neg(ops._mul(factor[:, None], shifted)))
+            grow = nonzero & (2 * length <= i)
+            shifted = np.where(grow[:, None], locator, shifted)
+            shifted[:, 1:] = shifted[:, :-1].copy()
+            shifted[:, 0] = 0
+            length = np.where(grow, i + 1 - length, length)
+            last = np.where(grow, d, last)
+            locator = np.where(nonzero[:, None], update, locator)
+        degree = np.where(locator.any(axis=1), locator.shape[1] - 1 - np.argmax(locator[:, ::-1] != 0, axis=1), -1)
+        failed = (degree != length) | (2 * length > nsym)
+        # Chien search: the locator at every position of every block, a linear map of its
+        # coefficients
+        roots = self._chien.apply(locator) == 0
+        failed |= roots.sum(axis=1) != length
+        roots &= ~failed[:, None]
+        # Forney: e = -X^(1-fcr) * omega(1/X) / locator'(1/X), omega = S * locator mod x^(n-k)
+        omega = np.zeros((count, nsym), dtype=np.int64)
+        for j in range(nsym):
+            omega[:, j:] = ops._add(omega[:, j:], ops._mul(locator[:, j:j + 1], syndromes[:, :nsym - j]))
+        derivative = ops._mul(locator[:, 1:], np.arange(1, nsym + 2) % self.field.p)
+        error_rows, positions = np.nonzero(roots)
+        x_inv = ops.values[positions]
+        numerator = np.zeros(len(positions), dtype=np.int64)
+        for j in range(nsym - 1, -1, -1):
+            numerator = ops._add(ops._mul(numerator, x_inv), omega[error_rows, j])
+        denominator = np.zeros(len(positions), dtype=np.int64)
+        for j in range(nsym, -1, -1):
+            denominator = ops._add(ops._mul(denominator, x_inv), derivative[error_rows, j])
+        singular = denominator == 0
+        if singular.any():
+            failed[error_rows[singular]] = True
+            keep = ~failed[error_rows]
+            error_rows, positions = error_rows[keep], positions[keep]
+            numerator, denominator = numerator[keep], denominator[keep]
+        errors = ops._neg(ops._mul(ops._mul(numerator, ops._pow(denominator, -1)), self._forney_scale[positions]))
+        return error_rows, positions, errors, np.where(failed, 0, length), rows[failed]
+
+    def encode(self, message):
+        message = [_field_element(self.field, s) for s in message]
+        return self.encode_blocks([message])[0].tolist()
+
+    # (message, number of corrected symbols) for one codeword
+    def decode(self, codeword):
+        codeword = [_field_element(self.field, s) for s in codeword]
+        messages, counts = self.decode_blocks([codeword])
+        return messages[0].tolist(), int(counts[0])
+
+    # Symbols of byte streams: one byte over GF(2^8), two little-endian bytes over GF(2^16)
+    def _byte_dtype(self):
+        np = _require_numpy()
+        if self.field.p != 2 or self.field.m not in (8, 16):
+            raise ValueError("Byte streams need a code over GF(2^8) or GF(2^16)")
+        return np.dtype(np.uint8 if self.field.m == 8 else '<u2')
+
+    def _byte_symbols(self, data, dtype):
+        np = _require_numpy()
+        if len(data) % dtype.itemsize:
+            raise ValueError(f"Byte streams over F(2^16) need an even number of bytes, got {len(data)}")
+        return np.frombuffer(data, dtype=dtype)
+
+    # Encode a byte stream in k-symbol blocks; a short last block is shortened (its missing
+    # leading message symbols are zeros that are not transmitted)
+    def encode_bytes(self, data):
+        np = _require_numpy()
+        dtype = self._byte_dtype()
+        symbols = self._byte_symbols(data, dtype)
+        full, rest = divmod(len(symbols), self.k)
+        blocks = symbols[:full * self.k].reshape(full, self.k)
+        if rest:
+            last = np.zeros((1, self.k), dtype=dtype)
+            last[0, self.k - rest:] = symbols[full * self.k:]
+            blocks = np.concatenate([blocks, last])
+        codewords = self.encode_blocks(blocks)
+        if not rest:
+            return codewords.tobytes()
+        return codewords[:full].tobytes() + codewords[full, self.k - rest:].tobytes()
+
+    # Inverse of encode_bytes: correct and strip the parity of every block
+    def decode_bytes(self, data):
+        np = _require_numpy()
+        dtype = self._byte_dtype()
+        symbols = self._byte_symbols(data, dtype)
+        nsym = self.n - self.k
+        full, rest = divmod(len(symbols), self.n)
+        blocks = symbols[:full * self.n].reshape(full, self.n)
+        if rest:
+            if rest <= nsym:
+                raise ValueError(f"Truncated codeword: {rest} symbols left, the parity alone is {nsym}")
+            last = np.zeros((1, self.n), dtype=dtype)
+            last[0, self.n - rest:] = symbols[full * self.n:]
+            blocks = np.concatenate([blocks, last])
+        messages, _ = self.decode_blocks(blocks)
+        if not rest:
+            return messages.tobytes()
+        return messages[:full].tobytes() + messages[full, self.k - (rest - nsym):].tobytes()
+
+# a^e mod f for coefficient lists over a field (square-and-multiply)
+def _fpoly_powmod(field, a, e, f):
+    result = [1]
+    a = _fpoly_divmod(field, a, f)[1]
+    while e:
+        if e & 1:
+            result = _fpoly_divmod(field, _fpoly_mul(field, result, a), f)[1]
+        e >>= 1
+        if e:
+            a = _fpoly_divmod(field, _fpoly_mul(field, a, a), f)[1]
+    return result
+
+# Monic greatest common divisor of two coefficient lists
+def _fpoly_gcd(field, a, b):
+    while b:
+        a, b = b, _fpoly_divmod(field, a, b)[1]
+    return _fpoly_scale(field, field.inv(a[-1]), a) if a else a
+
+# Rabin's test over a field of order Q: f of degree n is irreducible iff x^(Q^n) = x mod f
+# and gcd(x^(Q^(n/r)) - x, f) = 1 for every prime r dividing n
+def _fpoly_is_irreducible(field, f):
+    n = len(f) - 1
+    if n < 1 or f[0] == 0:
+        return n == 1
+    f = _fpoly_scale(field, field.inv(f[-1]), f)
+    checkpoints = {n // r for r in factorize(n)}
+    h = [0, 1]
+    for i in range(1, n + 1):
+        h = _fpoly_powmod(field, h, field.order, f)
+        if i in checkpoints and len(_fpoly_gcd(field, f, _fpoly_sub(field, h, [0, 1]))) > 1:
+            return False
+    return h == [0, 1]
+
+# A root of f (a coefficient list over the field), or None if it has none. gcd(f, x^q - x)
+# keeps the linear factors, which are split by Cantor-Zassenhaus (gcd with (x + d)^((q-1)/2) - 1
+# for odd q, with the absolute trace of d*x for q = 2^m, for random d) following the smaller
+# factor each time. The random choices are seeded, so the same f gives the same root.
+def _fpoly_root(field, f):
+    import random
+    f = _fpoly_trim(f[:])
+    if not f:
+        raise ValueError("The zero polynomial has every element as a root")
+    f = _fpoly_scale(field, field.inv(f[-1]), f)
+    q = field.order
+    g = _fpoly_gcd(field, f, _fpoly_sub(field, _fpoly_powmod(field, [0, 1], q, f), [0, 1]))
+    rng = random.Random(0)
+    while len(g) > 2:
+        d = rng.randrange(1, q)
+        if field.p == 2:
+            t = _fpoly_divmod(field, [0, d], g)[1]
+            trace = t
+            for _ in range(field.m - 1):
+                t = _fpoly_divmod(field, _fpoly_mul(field, t, t), g)[1]
+                trace = _fpoly_add(field, trace, t)
+            h = _fpoly_gcd(field, g, trace)
+        else:
+            h = _fpoly_gcd(field, g, _fpoly_sub(field, _fpoly_powmod(field, [d, 1], (q - 1) // 2, g), [1]))
+        if 1 < len(h) < len(g):
+            other = _fpoly_divmod(field, g, h)[0]
+            g = h if len(h) <= len(other) else other
+    return field.neg(g[0]) if len(g) == 2 else None
+
+# GF(Q^n) built on a field engine for GF(Q): elements are polynomials in y of degree below n
+# with coefficients in the base field, reduced by a monic irreducible tower_poly over it, e.g.
+# GF((2^4)^2) as another representation of GF(2^8). Coefficient i of an element is packed at
+# Q^i, so elements are still base-p digit vectors (in the basis x^j y^i) and add/neg are the
+# digitwise ones. A product costs about n^2 base products (3 for n = 2) and an inverse one base
+# inversion (n = 2) or a short Euclid over the base; over a log-table base this beats the
+# table-free LazyField of the flat field by far. There is no single modulus over F_p
+# (mod_poly is None), so NumPy paths that work on digits (FieldArray, ReedSolomonCodec) need
+# elements mapped to a flat field first (see FieldIsomorphism). Elements print as polynomials
+# in y with parenthesized base coefficients, e.g. "(1 + x^3)y + (x)".
+class TowerField(FiniteField):
+    def __init__(self, base, n, tower_poly=None):
+        if n < 2:
+            raise ValueError("A tower extension needs degree n >= 2")
+        self.base = base
+        self.n = n
+        self.p = base.p
+        self.m = base.m * n
+        self.mod_poly = None
+        self.order = base.order ** n
+        self._factors = None
+        self._primitive = None
+        self._frobenius = None
+        self._non_residue = None
+        if tower_poly is None:
+            tower_poly = self._find_tower_poly()
+        else:
+            tower_poly = _fpoly_trim([_field_element(base, c) for c in tower_poly])
+            if len(tower_poly) != n + 1 or not _fpoly_is_irreducible(base, tower_poly):
+                raise ValueError(f"The tower polynomial must be irreducible of degree {n} over F({base.p}^{base.m})")
+            tower_poly = _fpoly_scale(base, base.inv(tower_poly[-1]), tower_poly)
+        self.tower_poly = tower_poly
+        # (y^p)^i for the Frobenius map, which acts on the coefficients and on y separately
+        self._y_p_powers = None
+        if _stats is not None:
+            instrument_field(self)
+
+    # A monic irreducible polynomial of degree n over the base, by seeded random search
+    # (about one candidate in n is irreducible)
+    def _find_tower_poly(self):
+        import random
+        rng = random.Random(f"tower {self.base.order} {self.n}")
+        q = self.base.order
+        while True:
+            poly = [rng.randrange(1, q)] + [rng.randrange(q) for _ in range(self.n - 1)] + [1]
+            if _fpoly_is_irreducible(self.base, poly):
+                return poly
+
+    def _coeffs(self, a):
+        q = self.base.order
+        coeffs = []
+        for _ in range(self.n):
+            a, c = divmod(a, q)
+            coeffs.append(c)
+        return coeffs
+
+    def _pack(self, coeffs):
+        q = self.base.order
+        a = 0
+        for c in reversed(coeffs):
+            a = a * q + c
+        return a
+
+    # The element with base-field coefficients coeffs (packed elements, y^0 first)
+    def from_coeffs(self, coeffs):
+        coeffs = [_field_element(self.base, c) for c in coeffs]
+        return self._pack(_fpoly_divmod(self.base, _fpoly_trim(coeffs), self.tower_poly)[1])
+
+    def to_str(self, a):
+        terms = []
+        for i, c in reversed(list(enumerate(self._coeffs(a)))):
+            if c:
+                terms.append(f"({self.base.to_str(c)})" + ("" if i == 0 else "y" if i == 1 else f"y^{i}"))
+        return " + ".join(terms) or "0"
+
+    # One term "(c)y^k" of the to_str form as (base element c, power k)
+    def _parse_term(self, term):
+        power = 0
+        head, y, exponent = term.rpartition("y")
+        if y and ")" not in exponent:
+            if exponent and not exponent[1:].isdigit():
+                raise ValueError(f"Cannot parse the tower term {term!r}")
+            power = int(exponent[1:]) if exponent else 1
+            term = head.rstrip("*") or "1"
+        if term.startswith("(") and term.endswith(")"):
+            term = term[1:-1]
+        if not term:
+            raise ValueError(f"Cannot parse the tower term {term!r}")
+        return self.base.from_str(term), power
+
+    # Parse the to_str form; a term without y is a base-field element ("x^3+1" is y^0 terms)
+    def from_str(self, s):
+        terms, depth, start = [], 0, 0
+        s = s.replace(" ", "")
+        for i, ch in enumerate(s):
+            depth += ch == "("
+            depth -= ch == ")"
+            if ch == "+" and depth == 0:
+                terms.append(s[start:i])
+                start = i + 1
+        terms.append(s[start:])
+        coeffs = [0] * self.n
+        for term in terms:
+            try:
+                c, power = self._parse_term(term)
+            except ValueError:
+                raise ValueError(f"Cannot parse the tower term {term!r}") from None
+            # y^power mod tower_poly by square-and-multiply, so large powers are never expanded
+            reduced = _fpoly_scale(self.base, c, _fpoly_powmod(self.base, [0, 1], power, self.tower_poly))
+            coeffs = [self.base.add(x, y) for x, y in itertools.zip_longest(coeffs, reduced, fillvalue=0)]
+        return self._pack(coeffs)
+
+    def mul(self, a, b):
+        if a == 0 or b == 0:
+            return 0
+        base = self.base
+        if self.n == 2:
+            # Karatsuba over y^2 = -t*y - u
+            q = base.order
+            a1, a0 = divmod(a, q)
+            b1, b0 = divmod(b, q)
+            u, t = self.tower_poly[0], self.tower_poly[1]
+            low, high = base.mul(a0, b0), base.mul(a1, b1)
+            middle = base.sub(base.mul(base.add(a0, a1), base.add(b0, b1)), base.add(low, high))
+            c0 = base.sub(low, base.mul(u, high))
+            c1 = base.sub(middle, base.mul(t, high))
+            return c1 * q + c0
+        prod = _fpoly_mul(base, _fpoly_trim(self._coeffs(a)), _fpoly_trim(self._coeffs(b)))
+        return self._pack(_fpoly_divmod(base, prod, self.tower_poly)[1])
+
+    def inv(self, a):
+        if a == 0:
+            raise ValueError("No inverse exists for 0")
+        base = self.base
+        if self.n == 2:
+            # a * conj(a) is the norm a0^2 - t*a0*a1 + u*a1^2, an element of the base field
+            q = base.order
+            a1, a0 = divmod(a, q)
+            u, t = self.tower_poly[0], self.tower_poly[1]
+            c0 = base.sub(a0, base.mul(t, a1))
+            norm = base.add(base.mul(a0, c0), base.mul(u, base.mul(a1, a1)))
+            scale = base.inv(norm)
+            return base.mul(base.neg(a1), scale) * q + base.mul(c0, scale)
+        # Extended Euclid over the base field
+        r0, r1 = self.tower_poly, _fpoly_trim(self._coeffs(a))
+        s0, s1 = [], [1]
+        while len(r1) > 1:
+            quot, rem = _fpoly_divmod(base, r0, r1)
+            r0, r1 = r1, rem
+            s0, s1 = s1, _fpoly_sub(base, s0, _fpoly_mul(base, quot, s1))
+        return self._pack(_fpoly_scale(base, base.inv(r1[0]), s1))
+
+    # a^(p^k): the base Frobenius on each coefficient, times the matching power of y^p
+    def frobenius(self, a, k=1):
+        k %= self.m
+        if k == 0 or a == 0:
+            return a
+        if self._y_p_powers is None:
+            y_p = 1
+            for _ in range(self.p):
+                y_p = self.mul(y_p, self.base.order)
+            powers = [1]
+            for _ in range(self.n - 1):
+                powers.append(self.mul(powers[-1], y_p))
+            self._y_p_powers = powers
+        base = self.base
+        for _ in range(k):
+            result = 0
+            for c, y_power in zip(self._coeffs(a), self._y_p_powers):
+                if c:
+                    result = self.add(result, self.mul(base.frobenius(c), y_power))
+            a = result
+        return a
+
+    def _find_generator(self):
+        q = self.order
+        exponents = [(q - 1) // r for r in self.order_factors()]
+        # The base field has smaller multiplicative order, so start at y
+        for g in range(self.base.order, q):
+            if all(self.pow(g, e) != 1 for e in exponents):
+                return g
+        raise ValueError("No primitive element found; the tower polynomial is not irreducible")
+
+# Images in target of the base-p digit basis of source (element p^d for digit d): powers of a
+# root of the modulus for a flat field; for a tower, products of the base field's images and
+# powers of a root of the tower polynomial carried into target. target must contain a copy of
+# source (its degree a multiple of source's).
+def _embedding_images(source, target):
+    if isinstance(source, TowerField):
+        base_images = _embedding_images(source.base, target)
+        carry = _FieldLinearMap(source.base, target, base_images)
+        root = _fpoly_root(target, [carry(c) for c in source.tower_poly])
+        if root is None:
+            raise ValueError(f"F({target.p}^{target.m}) does not contain F({source.p}^{source.m})")
+        y_powers = [1]
+        for _ in range(source.n - 1):
+            y_powers.append(target.mul(y_powers[-1], root))
+        return [target.mul(b, y) for y in y_powers for b in base_images]
+    root = _fpoly_root(target, list(source.mod_poly))
+    if root is None:
+        raise ValueError(f"F({target.p}^{target.m}) does not contain F({source.p}^{source.m})")
+    powers = [1]
+    for _ in range(source.m - 1):
+        powers.append(target.mul(powers[-1], root))
+    return powers
+
+# An F_p-linear map from source elements to target elements given by the images of the
+# digit basis: one XOR of byte-table entries per 8 bits for p = 2, a digit combination otherwise
+class _FieldLinearMap:
+    def __init__(self, source, target, images):
+        self.source = source
+        self.target = target
+        self.images = images
+        self._bytes = None
+        if source.p == 2:
+            self._bytes = []
+            for start in range(0, len(images), 8):
+                chunk = images[start:start + 8]
+                table = [0] * 256
+                for v in range(1, 256):
+                    low = v & -v
+                    bit = low.bit_length() - 1
+                    table[v] = table[v ^ low] ^ (chunk[bit] if bit < len(chunk) else 0)
+                self._bytes.append(table)
+        else:
+            self._digits = [target.from_int(image) for image in images]
+
+    def __call__(self, a):
+        if self._bytes is not None:
+            result = 0
+            for table in self._bytes:
+                result ^= table[a & 255]
+                a >>= 8
+            return result
+        p = self.source.p
+        acc = [0] * self.target.m
+        for d, row in zip(self.source.from_int(a), self._digits):
+            if d:
+                acc = [x + d * y for x, y in zip(acc, row)]
+        return self.target.to_int([x % p for x in acc])
+
+# An isomorphism between two engines for the same field GF(p^m), e.g. two moduli of the same
+# degree, or a flat field and a tower over a subfield. A root in target of source's modulus
+# (and tower polynomial) fixes where source's basis goes; since both fields are F_p-vector
+# spaces the map is the change-of-basis matrix (`matrix`, row d: the digits of the image of
+# digit d). Elements convert one at a time with iso(a), and arrays with map_array, which is a
+# vectorized matrix-vector product (byte-table gathers for p = 2).
+class FieldIsomorphism:
+    def __init__(self, source, target, images=None):
+        if (source.p, source.m) != (target.p, target.m):
+            raise ValueError(f"F({source.p}^{source.m}) and F({target.p}^{target.m}) are not isomorphic")
+        self.source = source
+        self.target = target
+        self._map = _FieldLinearMap(source, target, images or _embedding_images(source, target))
+        self.matrix = [target.from_int(image) for image in self._map.images]
+        self._array_tables = None
+
+    def __call__(self, a):
+        return self._map(_field_element(self.source, a))
+
+    # The inverse isomorphism, from the inverse change-of-basis matrix over F_p
+    def inverse(self):
+        p = self.source.p
+        prime_field = make_field(p, 1, [0, 1])
+        try:
+            inverse = FieldMatrix(prime_field, self.matrix).inverse()
+        except ValueError:
+            raise ValueError("The map is not invertible") from None
+        images = [self.source.to_int(row) for row in inverse.tolist()]
+        return FieldIsomorphism(self.target, self.source, images)
+
+    # Convert a FieldArray (or array of packed source elements) to a FieldArray over target;
+    # for a tower target, which FieldArray does not take, the packed int64 array itself
+    def map_array(self, values):
+        np = _require_numpy()
+        if isinstance(values, FieldArray):
+            values = values.values
+        values = np.asarray(values, dtype=np.int64)
+        source, target = self.source, self.target
+        if target.order >= 2 ** 62:
+            raise ValueError("map_array supports fields with fewer than 2^62 elements")
+        if source.p == 2:
+            if self._array_tables is None:
+                self._array_tables = np.array(self._map._bytes, dtype=np.int64)
+            result = np.zeros(values.shape, dtype=np.int64)
+            for s, table in enumerate(self._array_tables):
+                result ^= table[(values >> (8 * s)) & 255]
+        else:
+            p, m = source.p, source.m
+            digits = np.empty(values.shape + (m,), dtype=np.int64)
+            rest = values
+            for i in range(m):
+                rest, digits[..., i] = np.divmod(rest, p)
+            matrix = np.array(self.matrix, dtype=np.int64)
+            if m * (p - 1) ** 2 < 2 ** 63:
+                mapped = digits @ matrix % p
+            else:
+                mapped = (digits.astype(object) @ matrix.astype(object) % p).astype(np.int64)
+            result = mapped @ np.array([p ** i for i in range(m)], dtype=np.int64)
+        return result if target.mod_poly is None else FieldArray(target, result)
+
+# Tokens of a field expression: polynomial literals (2x^3, x, 5), names, operators
+_TOKEN_PATTERN = r"\s*(?:(\d*x(?:\^\d+)?(?!\w)|\d+(?![A-Za-z_]))|([A-Za-z_]\w*)|([-+*/()^,])|(\S))"
+_token_re = None  # compiled on first use so importing the module does not pull in re
+_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2}
+# Functions callable in expressions, with the argument counts they accept
+_FUNCTION_ARITY = {'sqrt': (1,), 'log': (1, 2)}
+
+def _tokenize(expr):
+    global _token_re
+    if _token_re is None:
+        import re
+        _token_re = re.compile(_TOKEN_PATTERN)
+    tokens = []
+    for match in _token_re.finditer(expr):
+        literal, name, op, bad = match.groups()
+        if bad is not None:
+            raise ValueError(f"Unexpected character {bad!r} in expression")
+        if literal is not None:
+            tokens.append(('const', literal))
+        elif name is not None:
+            tokens.append(('var', name))
+        elif op is not None:
+            tokens.append(('op', op))
+    return tokens
+
+def _field_functions(field):
+    return {'sqrt': field.sqrt, 'log': field.dlog}
+
+# Compile an expression into a postfix program of ('const', packed value), ('var', name),
+# ('op', symbol), ('pow', exponent) and ('call', (function, argument count)) steps.
+# Literals are parsed and reduced once, and every subexpression made only of constants
+# is folded to a single constant. Exponents after '^' are integer literals (optionally
+# negative) and bind tighter than any other operator. log() gives an integer rather than
+# a field element, so it may only be the whole expression; folded it becomes an
+# ('exponent', k) step.
+def _compile_program(expr, field):
+    ops = {'+': field.add, '-': field.sub, '*': field.mul, '/': field.div}
+    functions = _field_functions(field)
+    output = []  # each entry is ('const', value) or ('code', [steps]); 'int'/'intcode' for log()
+    pending = []  # operators, '(' and ('call', name, output depth) for function parentheses
 
-# Check if a polynomial is irreducible
-def is_irreducible(poly, p):
-    degree = len(poly) - 1
-    if degree <= 0:
-        return False
-    
-    # For degree 1, any polynomial ax + b (a≠0) is irreducible
-    if degree == 1:
-        return poly[1] != 0
-    
-    # For degree 2 and 3, check if there are any linear factors
-    if degree in [2, 3]:
-        # Check if polynomial is divisible by any linear polynomial (x - a)
-        for a in range(p):
-            divisor = [a, 1]  # x - a as [a, 1]
-            if len(poly_mod(poly.copy(), divisor, p)) == 0:
-                return False
-        return True
-    
-    return "Cannot conclusively verify irreducibility for degrees > 3"
+    def code(entry):
+        return [entry] if entry[0] == 'const' else entry[1]
 
-# Generate all elements of the field
-def generate_field_elements(p, m):
-    return [list(coeffs) for coeffs in itertools.product(range(p), repeat=m)]
+    def operand(entry, what):
+        if entry[0] in ('int', 'intcode'):
+            raise ValueError(f"log() gives an integer and cannot be used in {what}")
+        return entry
 
-# Build multiplication table
-def build_mul_table(elements, mod_poly, p):
-    table = {}
-    for a in elements:
-        for b in elements:
-            prod = poly_mod(poly_mul(a, b, p), mod_poly, p)
-            prod_tuple = tuple(prod + [0] * (len(a) - len(prod)))
-            table[(tuple(a), tuple(b))] = prod_tuple
-    return table
+    def apply_op(op):
+        if len(output) < 2:
+            raise ValueError(f"Missing operand for '{op}'")
+        b = operand(output.pop(), f"'{op}'")
+        a = operand(output.pop(), f"'{op}'")
+        if a[0] == 'const' and b[0] == 'const':
+            output.append(('const', ops[op](a[1], b[1])))
+        else:
+            output.append(('code', code(a) + code(b) + [('op', op)]))
 
-# Build inverse table
-def build_inv_table(elements, mul_table):
-    identity = tuple([1] + [0] * (len(elements[0]) - 1))
-    inv_table = {}
-    for a in elements:
-        a_tuple = tuple(a)
-        for b in elements:
-            if mul_table.get((a_tuple, tuple(b))) == identity:
-                inv_table[a_tuple] = tuple(b)
-                break
-    return inv_table
+    def apply_call(name, depth):
+        args = [operand(arg, f"{name}()") for arg in output[depth:]]
+        del output[depth:]
+        if len(args) not in _FUNCTION_ARITY[name]:
+            raise ValueError(f"{name}() takes {' or '.join(map(str, _FUNCTION_ARITY[name]))} argument(s)")
+        integer = name == 'log'
+        if all(arg[0] == 'const' for arg in args):
+            value = functions[name](*(arg[1] for arg in args))
+            output.append(('int' if integer else 'const', value))
+        else:
+            steps = [step for arg in args for step in code(arg)]
+            output.append(('intcode' if integer else 'code', steps + [('call', (name, len(args)))]))
 
-# Pretty print polynomial
-def poly_str(poly):
-    terms = []
-    for i, c in enumerate(poly):
-        if c == 0:
-            continue
-        if i == 0:
-            terms.append(f"{c}")
-        elif i == 1:
-            if c == 1:
-                terms.append("x")
+    def close_group(message="Unbalanced parentheses"):
+        while pending and pending[-1] in _PRECEDENCE:
+            apply_op(pending.pop())
+        if not pending:
+            raise ValueError(message)
+        return pending.pop()
+
+    tokens = _tokenize(expr)
+    i = 0
+    prev = None  # kind of the previous token: 'operand' or 'operator'
+    while i < len(tokens):
+        kind, token = tokens[i]
+        i += 1
+        if kind == 'const':
+            output.append(('const', field.from_str(token)))
+            prev = 'literal' if '^' in token else 'operand'
+        elif kind == 'var':
+            if token in _FUNCTION_ARITY and i < len(tokens) and tokens[i] == ('op', '('):
+                pending.append(('call', token, len(output)))
+                i += 1
+                prev = 'operator'
+                continue
+            output.append(('code', [('var', token)]))
+            prev = 'operand'
+        elif token == '^':
+            if prev == 'power' or prev == 'literal':
+                raise ValueError("Chained exponents need parentheses")
+            if prev != 'operand' or not output:
+                raise ValueError("Missing operand for '^'")
+            sign = 1
+            if i < len(tokens) and tokens[i] == ('op', '-'):
+                sign = -1
+                i += 1
+            if i >= len(tokens) or tokens[i][0] != 'const' or not tokens[i][1].isdigit():
+                raise ValueError("Exponents after '^' must be integer literals")
+            e = sign * int(tokens[i][1])
+            i += 1
+            base = operand(output.pop(), "'^'")
+            if base[0] == 'const':
+                output.append(('const', field.pow(base[1], e)))
             else:
-                terms.append(f"{c}x")
+                output.append(('code', code(base) + [('pow', e)]))
+            prev = 'power'
+        elif token == '(':
+            pending.append(token)
+            prev = 'operator'
+        elif token == ',':
+            opener = close_group("',' outside a function call")
+            if opener == '(':
+                raise ValueError("',' outside a function call")
+            pending.append(opener)
+            prev = 'operator'
+        elif token == ')':
+            opener = close_group()
+            if opener != '(':
+                if len(output) == opener[2]:
+                    raise ValueError(f"{opener[1]}() needs an argument")
+                apply_call(opener[1], opener[2])
+            prev = 'operand'
         else:
-            if c == 1:
-                terms.append(f"x^{i}")
+            while pending and pending[-1] in _PRECEDENCE and _PRECEDENCE[pending[-1]] >= _PRECEDENCE[token]:
+                apply_op(pending.pop())
+            pending.append(token)
+            prev = 'operator'
+
+    while pending:
+        op = pending.pop()
+        if op not in _PRECEDENCE:
+            raise ValueError("Unbalanced parentheses")
+        apply_op(op)
+    if len(output) != 1:
+        raise ValueError("Empty or malformed expression")
+    if output[0][0] == 'int':
+        return (('exponent', output[0][1]),)
+    return tuple(code(output[0]))
+
+# An expression compiled for one field; evaluate it many times with different variable bindings.
+# Bindings may be packed integers, coefficient lists or polynomial strings. Expressions
+# ending in log() evaluate to a plain integer (returns_exponent is then true).
+class CompiledExpression:
+    def __init__(self, expr, field, program):
+        self.expr = expr
+        self.field = field
+        self.program = program
+        self.variables = sorted({arg for kind, arg in program if kind == 'var'})
+        last_kind, last_arg = program[-1]
+        self.returns_exponent = last_kind == 'exponent' or last_kind == 'call' and last_arg[0] == 'log'
+        self._ops = {'+': field.add, '-': field.sub, '*': field.mul, '/': field.div}
+        self._functions = _field_functions(field)
+
+    def evaluate(self, bindings=None, **kwargs):
+        if bindings:
+            kwargs = dict(bindings, **kwargs)
+        try:
+            env = {name: _field_element(self.field, kwargs[name]) for name in self.variables}
+        except KeyError as e:
+            raise ValueError(f"No value bound for variable {e.args[0]}") from None
+        ops = self._ops
+        stack = []
+        for kind, arg in self.program:
+            if kind == 'const' or kind == 'exponent':
+                stack.append(arg)
+            elif kind == 'var':
+                stack.append(env[arg])
+            elif kind == 'op':
+                b = stack.pop()
+                stack[-1] = ops[arg](stack[-1], b)
+            elif kind == 'pow':
+                stack[-1] = self.field.pow(stack[-1], arg)
             else:
-                terms.append(f"{c}x^{i}")
-    return ' + '.join(terms) if terms else "0"
+                name, count = arg
+                args = stack[-count:]
+                del stack[-count:]
+                stack.append(self._functions[name](*args))
+        return stack[0]
 
-# Parse polynomial string like "1+x+x^2"
-def parse_poly(s, p, m=None):
-    s = s.replace(" ", "")
-    terms = s.split("+")
-    max_deg = 0
-    coeffs = {}
-    for term in terms:
-        if "x^" in term:
-            c, i = term.split("x^")
-            c = int(c) if c else 1
-            i = int(i)
-        elif "x" in term:
-            c = term.replace("x", "")
-            c = int(c) if c else 1
-            i = 1
-        else:
-            c = int(term)
-            i = 0
-        coeffs[i] = coeffs.get(i, 0) + c % p
-        max_deg = max(max_deg, i)
+    __call__ = evaluate
 
-    size = m if m else max_deg + 1
-    result = [0] * size
-    for i, c in coeffs.items():
-        if i < size:
-            result[i] = c % p
-    return result
+# Compiled programs for the most recent expressions, keyed by (expression, p, m, modulus);
+# fields without a modulus over F_p (towers) are keyed by the engine itself
+EXPRESSION_CACHE_SIZE = 256
+_expression_cache = {}  # insertion ordered: oldest first
+
+def compile_expression(expr, field):
+    key = (expr, field.p, field.m, field if field.mod_poly is None else tuple(field.mod_poly))
+    program = _expression_cache.pop(key, None)
+    if program is None:
+        with stats_phase("expression compile"):
+            program = _compile_program(expr, field)
+        if len(_expression_cache) >= EXPRESSION_CACHE_SIZE:
+            _evict_oldest(_expression_cache)
+    _expression_cache[key] = program
+    return CompiledExpression(expr, field, program)
 
 # Evaluate expression in the field
-def evaluate_expression(expr, p, m, mul_table, inv_table):
+# (with field=, the expression is compiled once and evaluated on packed integers)
+def evaluate_expression(expr, p, m, mul_table=None, inv_table=None, field=None):
+    if field is not None:
+        compiled = compile_expression(expr, field)
+        with stats_phase("expression evaluation"):
+            result = compiled.evaluate()
+        return result if compiled.returns_exponent else field.from_int(result)
+
     tokens = []
     i = 0
     expr = expr.replace(" ", "")
@@ -259,14 +3890,486 @@ def evaluate_expression(expr, p, m, mul_table, inv_table):
 
 
 
+
+# Command-line batch mode: stream expressions (one per line) through a field without the GUI.
+# Each input line gives exactly one output line; blank lines stay blank and failures
+# are written as "ERROR: ..." so results stay aligned with their inputs.
+def _format_element(field, value, fmt):
+    if fmt == 'int':
+        return str(value)
+    if fmt == 'tuple':
+        return str(tuple(field.from_int(value)))
+    return field.to_str(value)
+
+def _evaluate_line(field, line, fmt):
+    expr = line.strip()
+    if not expr:
+        return "", True
+    try:
+        compiled = compile_expression(expr, field)
+        result = compiled.evaluate()
+        if compiled.returns_exponent:
+            return str(result), True
+        return _format_element(field, result, fmt), True
+    except (ValueError, ZeroDivisionError) as e:
+        return f"ERROR: {e}", False
+
+# Worker-process state for parallel batch evaluation (one field per worker)
+_cli_worker = {}
+
+def _cli_worker_init(p, m, mod_poly, memory_budget, cache, fmt):
+    _cli_worker['field'] = make_field(p, m, mod_poly, memory_budget, cache)
+    _cli_worker['fmt'] = fmt
+
+def _cli_worker_chunk(lines):
+    field, fmt = _cli_worker['field'], _cli_worker['fmt']
+    return [_evaluate_line(field, line, fmt) for line in lines]
+
+def _read_lines(paths):
+    if not paths:
+        yield from sys.stdin
+        return
+    for path in paths:
+        if path == '-':
+            yield from sys.stdin
+        else:
+            with open(path) as handle:
+                yield from handle
+
+def cli_main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Evaluate finite field expressions from files or stdin, one per line.")
+    parser.add_argument("-p", "--prime", type=int, required=True, help="characteristic p")
+    parser.add_argument("-m", "--degree", type=int, required=True, help="extension degree m")
+    parser.add_argument("--modulus", required=True, help="irreducible polynomial, e.g. 1+x+x^3")
+    parser.add_argument("files", nargs="*", help="expression files ('-' or none for stdin)")
+    parser.add_argument("-o", "--output", help="write results to this file instead of stdout")
+    parser.add_argument("--format", choices=["poly", "tuple", "int"], default="poly",
+                        help="result format: polynomial string, coefficient tuple or packed integer")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes (default 1)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="lines per parallel work unit")
+    parser.add_argument("--memory-budget", type=int, help="table memory budget in bytes")
+    parser.add_argument("--no-cache", dest="cache", action="store_false",
+                        help="always rebuild field tables instead of using the on-disk table cache")
+    parser.add_argument("--stats", metavar="FILE",
+                        help="write timing and operation statistics as JSON (worker processes are not counted)")
+    args = parser.parse_args(argv)
+
+    p, m = args.prime, args.degree
+    if not is_prime(p) or m < 1:
+        print(f"error: {p} is not a prime number or m < 1", file=sys.stderr)
+        return 1
+    if args.stats:
+        enable_stats()
+    try:
+        mod_poly = parse_poly(args.modulus, p, m + 1)
+    except ValueError:
+        print(f"error: cannot parse the modulus {args.modulus!r}", file=sys.stderr)
+        return 1
+    with stats_phase("irreducibility check"):
+        irreducible = is_irreducible(mod_poly, p)
+    if not irreducible:
+        print(f"error: {args.modulus} is not an irreducible polynomial of degree {m} over F{p}", file=sys.stderr)
+        return 1
+
+    try:
+        out = open(args.output, "w") if args.output else sys.stdout
+    except OSError as exc:
+        print(f"error: cannot write {args.output}: {exc.strerror}", file=sys.stderr)
+        return 1
+    interactive = not args.files and sys.stdin.isatty()
+    failures = 0
+    try:
+        lines = _read_lines(args.files)
+        if args.jobs <= 1:
+            field = make_field(p, m, mod_poly, args.memory_budget, args.cache)
+            for line in lines:
+                text, ok = _evaluate_line(field, line, args.format)
+                failures += not ok
+                out.write(text + "\n")
+                if interactive:
+                    out.flush()
+        else:
+            import multiprocessing
+            from collections import deque
+            chunks = iter(lambda: list(itertools.islice(lines, args.chunk_size)), [])
+            if args.cache:
+                # Build and save the tables once here so every worker just maps the file
+                make_field(p, m, mod_poly, args.memory_budget, cache=True, processes=args.jobs)
+            with multiprocessing.Pool(args.jobs, _cli_worker_init,
+                                      (p, m, mod_poly, args.memory_budget, args.cache,
+                                       args.format)) as pool:
+                # Keep only a few chunks in flight so memory stays bounded for huge inputs
+                in_flight = deque()
+                for chunk in itertools.chain(chunks, [None]):
+                    if chunk is not None:
+                        in_flight.append(pool.apply_async(_cli_worker_chunk, (chunk,)))
+                    while in_flight and (chunk is None or len(in_flight) > 2 * args.jobs):
+                        for text, ok in in_flight.popleft().get():
+                            failures += not ok
+                            out.write(text + "\n")
+                        out.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); stop quietly
+        import os
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except OSError as exc:
+        # A missing or unreadable input file, or a failed write to the output
+        print(f"error: {exc.filename}: {exc.strerror}" if exc.filename else f"error: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.flush()
+        if args.stats:
+            export_stats(args.stats)
+            disable_stats()
+    return 1 if failures else 0
+
+# Server mode: a long-running process keeps initialized fields warm so scripts skip the Python
+# startup and table construction of a fresh batch run. Messages in both directions are frames
+# of a 4-byte big-endian length and a UTF-8 JSON object. A request is
+#   {"id": 7, "p": 2, "m": 8, "modulus": "1+x^2+x^3+x^4+x^8", "expressions": [...], "format": "poly"}
+# (modulus as a polynomial string or a coefficient list, format as in the batch mode) and its
+# response {"id": 7, "results": [...], "failed": [indices]}, one result per expression as the
+# batch mode writes it, or {"id": 7, "error": "..."} when the field itself is rejected.
+# Clients may send many requests before reading; each connection is answered in order.
+SERVER_FIELD_CACHE_SIZE = 16
+# Frames longer than this close the connection
+SERVER_MAX_FRAME = 16 * 1024 * 1024
+_FRAME_HEADER = ">I"
+_FRAME_HEADER_SIZE = 4
+
+def _encode_frame(message):
+    import json
+    import struct
+    body = json.dumps(message, separators=(",", ":")).encode()
+    return struct.pack(_FRAME_HEADER, len(body)) + body
+
+# The irreducible modulus of a request as a coefficient list of degree exactly m
+def _request_modulus(p, m, modulus):
+    if isinstance(modulus, str):
+        modulus = parse_poly(modulus, p)
+    mod_poly = [int(c) % p for c in modulus]
+    while mod_poly and mod_poly[-1] == 0:
+        mod_poly.pop()
+    if len(mod_poly) != m + 1:
+        raise ValueError(f"modulus must have degree {m}")
+    return mod_poly
+
+# Message for a failure reported to a client; unexpected exception types are named
+def _server_error(e):
+    if isinstance(e, (ValueError, TypeError, ZeroDivisionError)) and str(e):
+        return str(e)
+    return f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+
+# Serves evaluate_expression requests from an LRU cache of fields keyed by (p, m, modulus).
+# Field builds and expression batches run in worker threads, so a slow build or expression
+# does not hold up other clients; concurrent requests for the same field share one build.
+# Any failure becomes an error in the response rather than closing the connection.
+# memory_budget and cache are passed on to make_field.
+class FieldServer:
+    def __init__(self, cache_size=None, memory_budget=None, cache=True):
+        self.cache_size = SERVER_FIELD_CACHE_SIZE if cache_size is None else cache_size
+        if self.cache_size < 1:
+            raise ValueError("cache_size must be at least 1")
+        self.memory_budget = memory_budget
+        self.cache = cache
+        self._fields = {}  # insertion ordered: least recently used first
+        self._building = {}  # key -> future of a build in progress
+        self._server = None
+        self._path = None
+
+    def _build_field(self, p, m, mod_poly):
+        with stats_phase("irreducibility check"):
+            irreducible = is_irreducible(mod_poly, p)
+        if not irreducible:
+            raise ValueError(f"{poly_str(mod_poly)} is not an irreducible polynomial of degree {m} over F{p}")
+        return make_field(p, m, mod_poly, self.memory_budget, self.cache)
+
+    async def field(self, p, m, modulus):
+        import asyncio
+        if not isinstance(p, int) or not isinstance(m, int) or m < 1 or not is_prime(p):
+            raise ValueError(f"{p} is not a prime number or m < 1")
+        mod_poly = _request_modulus(p, m, modulus)
+        key = (p, m, tuple(mod_poly))
+        field = self._fields.pop(key, None)
+        if field is None:
+            future = self._building.get(key)
+            if future is None:
+                loop = asyncio.get_running_loop()
+                future = self._building[key] = loop.run_in_executor(None, self._build_field, p, m, mod_poly)
+                try:
+                    field = await asyncio.shield(future)
+                finally:
+                    del self._building[key]
+            else:
+                return await asyncio.shield(future)
+            if len(self._fields) >= self.cache_size:
+                del self._fields[next(iter(self._fields))]
+        self._fields[key] = field
+        return field
+
+    # Evaluate one batch (in a worker thread). Besides the errors the batch mode reports, any
+    # exception (e.g. MemoryError) fails just its own expression.
+    def _evaluate_batch(self, field, expressions, fmt):
+        results, failed = [], []
+        with stats_phase("server request"):
+            for i, expr in enumerate(expressions):
+                try:
+                    text, ok = _evaluate_line(field, expr, fmt)
+                except Exception as e:
+                    text, ok = f"ERROR: {_server_error(e)}", False
+                results.append(text)
+                if not ok:
+                    failed.append(i)
+        return results, failed
+
+    async def handle_request(self, request):
+        import asyncio
+        response = {"id": request.get("id")}
+        missing = [name for name in ("p", "m", "modulus", "expressions") if name not in request]
+        if missing:
+            response["error"] = f"missing request field {missing[0]!r}"
+            return response
+        expressions = request["expressions"]
+        fmt = request.get("format", "poly")
+        try:
+            if not isinstance(expressions, list) or not all(isinstance(e, str) for e in expressions):
+                raise ValueError("expressions must be a list of strings")
+            if fmt not in ("poly", "tuple", "int"):
+                raise ValueError(f"unknown format {fmt!r}")
+            field = await self.field(request["p"], request["m"], request["modulus"])
+            loop = asyncio.get_running_loop()
+            results, failed = await loop.run_in_executor(None, self._evaluate_batch, field, expressions, fmt)
+        except Exception as e:
+            response["error"] = _server_error(e)
+            return response
+        response["results"] = results
+        response["failed"] = failed
+        return response
+
+    async def handle_connection(self, reader, writer):
+        import asyncio
+        import json
+        import struct
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(_FRAME_HEADER_SIZE)
+                except asyncio.IncompleteReadError:
+                    break
+                size, = struct.unpack(_FRAME_HEADER, header)
+                if size > SERVER_MAX_FRAME:
+                    break
+                try:
+                    request = json.loads((await reader.readexactly(size)).decode())
+                except ValueError:
+                    writer.write(_encode_frame({"id": None, "error": "malformed request"}))
+                    await writer.drain()
+                    continue
+                if isinstance(request, dict):
+                    response = await self.handle_request(request)
+                else:
+                    response = {"id": None, "error": "a request must be a JSON object"}
+                writer.write(_encode_frame(response))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    # Listen on the Unix socket `path`, or on TCP host:port when path is None
+    async def start(self, path=None, host="127.0.0.1", port=0):
+        import asyncio
+        import os
+        if path is not None:
+            if os.path.exists(path):
+                os.unlink(path)  # stale socket of an earlier run
+            self._server = await asyncio.start_unix_server(self.handle_connection, path)
+            self._path = path
+        else:
+            self._server = await asyncio.start_server(self.handle_connection, host, port)
+        return self._server
+
+    # The bound address: the socket path, or (host, port)
+    @property
+    def address(self):
+        if self._path is not None:
+            return self._path
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        import os
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._path is not None:
+            if os.path.exists(self._path):
+                os.unlink(self._path)
+            self._path = None
+
+# Run a FieldServer until interrupted; ready, if given, is called with the bound address
+def serve(path=None, host="127.0.0.1", port=0, cache_size=None, memory_budget=None, cache=True, ready=None):
+    import asyncio
+    server = FieldServer(cache_size, memory_budget, cache)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(server.start(path, host, port))
+        if ready is not None:
+            ready(server.address)
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(server.close())
+        loop.close()
+        asyncio.set_event_loop(None)
+
+# Blocking client of a FieldServer, for scripts. The connection is opened on first use and
+# kept for later calls (reopened once if the server dropped it while idle). send() returns a
+# request id without waiting, so many batches can be in flight; receive() collects them.
+# address is a Unix socket path or a (host, port) pair.
+class FieldClient:
+    def __init__(self, address, timeout=None):
+        self.address = address
+        self.timeout = timeout
+        self._sock = None
+        self._file = None
+        self._next_id = 0
+        self._outstanding = set()
+        self._responses = {}  # responses read while waiting for another id
+
+    def _connect(self):
+        import socket
+        if isinstance(self.address, str):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            sock = socket.socket(socket.AF_INET6 if ":" in self.address[0] else socket.AF_INET,
+                                 socket.SOCK_STREAM)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._file = sock.makefile("rb")
+
+    def close(self):
+        if self._sock is not None:
+            self._file.close()
+            self._sock.close()
+            self._sock = self._file = None
+        self._outstanding.clear()
+        self._responses.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def send(self, expressions, p, m, modulus, fmt="poly"):
+        request_id = self._next_id
+        self._next_id += 1
+        frame = _encode_frame({"id": request_id, "p": p, "m": m, "modulus": modulus,
+                               "expressions": list(expressions), "format": fmt})
+        if self._sock is None:
+            self._connect()
+        try:
+            self._sock.sendall(frame)
+        except (BrokenPipeError, ConnectionResetError):
+            if self._outstanding:
+                self.close()
+                raise
+            # An idle connection the server has closed (e.g. restarted): reconnect once
+            self.close()
+            self._connect()
+            self._sock.sendall(frame)
+        self._outstanding.add(request_id)
+        return request_id
+
+    def _read_frame(self):
+        import json
+        import struct
+        header = self._file.read(_FRAME_HEADER_SIZE)
+        if len(header) < _FRAME_HEADER_SIZE:
+            self.close()
+            raise ConnectionError("the field server closed the connection")
+        size, = struct.unpack(_FRAME_HEADER, header)
+        body = self._file.read(size)
+        if len(body) < size:
+            self.close()
+            raise ConnectionError("the field server closed the connection")
+        return json.loads(body.decode())
+
+    # Results of request_id: one string per expression, failures written as "ERROR: ..."
+    # like the batch mode. A rejected field (e.g. a reducible modulus) raises ValueError.
+    def receive(self, request_id):
+        if request_id not in self._outstanding:
+            raise ValueError(f"no request {request_id} is outstanding")
+        response = self._responses.pop(request_id, None)
+        while response is None:
+            message = self._read_frame()
+            if message.get("id") == request_id:
+                response = message
+            elif message.get("id") in self._outstanding:
+                self._responses[message["id"]] = message
+            else:
+                self.close()
+                raise ConnectionError(f"unexpected response from the field server: {message.get('error')}")
+        self._outstanding.discard(request_id)
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["results"]
+
+    def evaluate_batch(self, expressions, p, m, modulus, fmt="poly"):
+        return self.receive(self.send(expressions, p, m, modulus, fmt))
+
+    # One expression; raises ValueError if it fails
+    def evaluate(self, expr, p, m, modulus, fmt="poly"):
+        result, = self.evaluate_batch([expr], p, m, modulus, fmt)
+        if result.startswith("ERROR: "):
+            raise ValueError(result[len("ERROR: "):])
+        return result
+
+def server_main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog="cs425proj_mod.py serve",
+        description="Serve finite field expression evaluation over a Unix socket or localhost TCP.")
+    where = parser.add_mutually_exclusive_group(required=True)
+    where.add_argument("--socket", help="listen on this Unix socket path")
+    where.add_argument("--port", type=int, help="listen on this TCP port")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP address to bind (default 127.0.0.1)")
+    parser.add_argument("--cache-size", type=int, default=SERVER_FIELD_CACHE_SIZE,
+                        help=f"fields kept initialized (default {SERVER_FIELD_CACHE_SIZE})")
+    parser.add_argument("--memory-budget", type=int, help="table memory budget in bytes")
+    parser.add_argument("--no-cache", dest="cache", action="store_false",
+                        help="always rebuild field tables instead of using the on-disk table cache")
+    args = parser.parse_args(argv)
+    if args.cache_size < 1:
+        print("error: --cache-size must be at least 1", file=sys.stderr)
+        return 1
+
+    def ready(address):
+        print(f"serving on {address if args.socket else '%s:%d' % tuple(address)}", file=sys.stderr)
+
+    serve(args.socket, args.host, args.port, args.cache_size, args.memory_budget, args.cache, ready)
+    return 0
 
 # GUI functions and variables
 current_p = None
 current_m = None
 current_mod_poly = None
-current_elements = None
-current_mul_table = None
-current_inv_table = None
+current_field = None
 element_buttons = []  # To store references to element buttons
 
 # Function to add a character to the expression entry
@@ -287,62 +4390,107 @@ def clear_expr():
     entry_expr.delete(0, tk.END)
     entry_expr.focus_set()
 
-# Function to show multiplication table
+# Function to show multiplication table.
+# The table is a virtual grid on one Canvas: only the cells in view are drawn, each product is
+# computed from the field engine when it scrolls into view, so any field size opens instantly.
 def show_multiplication_table():
-    if current_elements is None:
+    if current_field is None:
         messagebox.showerror("Field Not Initialized", "Please initialize the field first!")
         return
-    
+    from tkinter import font as tkfont
+    field = current_field
+    q = field.order
+
     # Create a new window for the multiplication table
     table_window = tk.Toplevel(root)
-    table_window.title(f"Multiplication Table for F({current_p}^{current_m})")
+    table_window.title(f"Multiplication Table for F({field.p}^{field.m})")
     table_window.geometry("800x600")
-    
+
+    # Cell format selector
+    options = tk.Frame(table_window)
+    options.pack(fill=tk.X, padx=10, pady=(10, 0))
+    tk.Label(options, text="Show elements as:").pack(side=tk.LEFT)
+    fmt = tk.StringVar(table_window, value="poly")
+    for label, value in (("Polynomial", "poly"), ("Tuple", "tuple"), ("Integer", "int")):
+        tk.Radiobutton(options, text=label, variable=fmt, value=value,
+                       command=lambda: redraw()).pack(side=tk.LEFT)
+
     # Create a frame with scrollbars for the table
     frame = tk.Frame(table_window)
     frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-    
-    # Create scrollbars
+
+    # Create scrollbars and the canvas; the scrollbars drive the view directly
     v_scrollbar = tk.Scrollbar(frame, orient=tk.VERTICAL)
     h_scrollbar = tk.Scrollbar(frame, orient=tk.HORIZONTAL)
-    
-    # Create canvas with scrollbars
-    canvas = tk.Canvas(frame, yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-    v_scrollbar.config(command=canvas.yview)
-    h_scrollbar.config(command=canvas.xview)
-    
+    canvas = tk.Canvas(frame, bg="white", highlightthickness=0)
+
     # Pack scrollbars and canvas
     v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
     canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-    
-    # Create a frame inside the canvas to hold the table
-    table_frame = tk.Frame(canvas)
-    canvas.create_window((0, 0), window=table_frame, anchor=tk.NW)
-    
-    # Add table headers - first cell is empty
-    tk.Label(table_frame, text="", width=8, relief=tk.RIDGE, padx=5, pady=5).grid(row=0, column=0)
-    
-    # Add column headers (field elements)
-    for col, element in enumerate(current_elements, 1):
-        tk.Label(table_frame, text=poly_str(element), width=8, relief=tk.RIDGE, 
-                 bg='lightgray', padx=5, pady=5).grid(row=0, column=col)
-    
-    # Add row headers and fill the table
-    for row, a in enumerate(current_elements, 1):
-        # Row header
-        tk.Label(table_frame, text=poly_str(a), width=8, relief=tk.RIDGE,
-                 bg='lightgray', padx=5, pady=5).grid(row=row, column=0)
-        
-        # Table cells
-        for col, b in enumerate(current_elements, 1):
-            prod = list(current_mul_table[(tuple(a), tuple(b))])
-            tk.Label(table_frame, text=poly_str(prod), width=8, relief=tk.RIDGE,
-                     padx=5, pady=5).grid(row=row, column=col)
-    
-    # Update canvas scroll region
-    table_frame.update_idletasks()
-    canvas.config(scrollregion=canvas.bbox("all"))
+
+    cell_font = tkfont.nametofont("TkDefaultFont")
+    cell_height = cell_font.metrics("linespace") + 10
+    # First row and column in view, and the number of rows and columns that fit
+    view = {"row": 0, "col": 0, "rows": 1, "cols": 1}
+
+    # Widest label of the chosen format: the element whose coefficients are all p - 1
+    def cell_width():
+        widest = _format_element(field, q - 1, fmt.get())
+        return max(cell_font.measure(widest), cell_font.measure("0" * 4)) + 16
+
+    def draw():
+        canvas.delete("all")
+        width = cell_width()
+        view["cols"] = cols = max(1, canvas.winfo_width() // width - 1)
+        view["rows"] = rows = max(1, canvas.winfo_height() // cell_height - 1)
+        r0 = view["row"] = max(0, min(view["row"], q - rows))
+        c0 = view["col"] = max(0, min(view["col"], q - cols))
+        row_values = range(r0, min(r0 + rows, q))
+        col_values = range(c0, min(c0 + cols, q))
+
+        def cell(x, y, text, header=False):
+            canvas.create_rectangle(x, y, x + width, y + cell_height, outline="gray",
+                                    fill="lightgray" if header else "white")
+            canvas.create_text(x + width // 2, y + cell_height // 2, text=text, font=cell_font)
+
+        # Add table headers - first cell is empty
+        cell(0, 0, "", header=True)
+        for j, b in enumerate(col_values, 1):
+            cell(j * width, 0, _format_element(field, b, fmt.get()), header=True)
+        for i, a in enumerate(row_values, 1):
+            cell(0, i * cell_height, _format_element(field, a, fmt.get()), header=True)
+            for j, b in enumerate(col_values, 1):
+                cell(j * width, i * cell_height, _format_element(field, field.mul(a, b), fmt.get()))
+
+        v_scrollbar.set(r0 / q, row_values.stop / q)
+        h_scrollbar.set(c0 / q, col_values.stop / q)
+
+    def redraw(event=None):
+        with stats_phase("multiplication table view"):
+            draw()
+
+    # Scrollbar commands arrive as ("moveto", fraction) or ("scroll", n, "units" | "pages")
+    def scroll(axis, action, amount, what=None):
+        span = view["rows"] if axis == "row" else view["cols"]
+        if action == "moveto":
+            view[axis] = int(float(amount) * q)
+        else:
+            view[axis] += int(amount) * (span if what == "pages" else 1)
+        redraw()
+
+    def wheel(axis, steps):
+        scroll(axis, "scroll", 3 * steps, "units")
+
+    v_scrollbar.config(command=lambda *args: scroll("row", *args))
+    h_scrollbar.config(command=lambda *args: scroll("col", *args))
+    canvas.bind("<Configure>", redraw)
+    canvas.bind("<MouseWheel>", lambda e: wheel("row", -1 if e.delta > 0 else 1))
+    canvas.bind("<Shift-MouseWheel>", lambda e: wheel("col", -1 if e.delta > 0 else 1))
+    canvas.bind("<Button-4>", lambda e: wheel("row", -1))
+    canvas.bind("<Button-5>", lambda e: wheel("row", 1))
+    canvas.bind("<Shift-Button-4>", lambda e: wheel("col", -1))
+    canvas.bind("<Shift-Button-5>", lambda e: wheel("col", 1))
 
 # Function to check if a polynomial is irreducible over the field
 def check_irreducibility():
@@ -355,31 +4503,198 @@ def check_irreducibility():
         poly_str_input = entry_poly.get()
         poly = parse_poly(poly_str_input, p)
         
-        irreducible_result = is_irreducible(poly, p)
-        if isinstance(irreducible_result, str):
-            messagebox.showinfo("Irreducibility Check", irreducible_result)
-        elif irreducible_result:
+        with stats_phase("irreducibility check"):
+            irreducible = is_irreducible(poly, p)
+        if irreducible:
             messagebox.showinfo("Irreducibility Check", f"The polynomial {poly_str_input} is irreducible over F{p}.")
         else:
             messagebox.showerror("Irreducibility Check", f"The polynomial {poly_str_input} is NOT irreducible over F{p}.")
     except Exception as e:
         messagebox.showerror("Error", f"Error checking irreducibility: {e}")
 
+# Function to list irreducible polynomials for the entered p and m.
+# Results are pulled from the generator in short slices between Tk events so the window stays responsive.
+def show_irreducible_polys(limit=50):
+    try:
+        p = int(entry_p.get())
+        m = int(entry_m.get())
+    except ValueError:
+        messagebox.showerror("Input Error", "Please enter valid integer values for p and m.")
+        return
+    if not is_prime(p) or m < 1:
+        messagebox.showerror("Input Error", "p must be prime and m must be at least 1.")
+        return
+
+    list_window = tk.Toplevel(root)
+    list_window.title(f"Irreducible Polynomials of Degree {m} over F{p}")
+    list_window.geometry("400x400")
+
+    total = count_irreducible_polys(p, m)
+    status = tk.Label(list_window, text=f"{total} monic irreducible polynomials; searching...")
+    status.pack(fill=tk.X, padx=10, pady=5)
+
+    frame = tk.Frame(list_window)
+    frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+    scrollbar_list = tk.Scrollbar(frame, orient=tk.VERTICAL)
+    listbox = tk.Listbox(frame, yscrollcommand=scrollbar_list.set)
+    scrollbar_list.config(command=listbox.yview)
+    scrollbar_list.pack(side=tk.RIGHT, fill=tk.Y)
+    listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    # Double-click copies the polynomial into the field initialization entry
+    def use_selected(event):
+        selection = listbox.curselection()
+        if selection:
+            entry_poly.delete(0, tk.END)
+            entry_poly.insert(0, listbox.get(selection[0]))
+    listbox.bind("<Double-Button-1>", use_selected)
+
+    polys = irreducible_polys(p, m)
+
+    def fill():
+        if not list_window.winfo_exists():
+            return
+        deadline = time.perf_counter() + 0.02
+        while time.perf_counter() < deadline:
+            poly = next(polys, None) if listbox.size() < limit else None
+            if poly is None:
+                status.config(text=f"{total} monic irreducible polynomials; showing the first {listbox.size()} "
+                                   "(double-click to use)")
+                return
+            listbox.insert(tk.END, poly_str(poly))
+        list_window.after(1, fill)
+
+    fill()
+
+# Statistics window (Tools > Statistics): switches collection on and off, refreshes its
+# report every second while open, and exports the numbers as JSON
+def show_stats():
+    stats_window = tk.Toplevel(root)
+    stats_window.title("Field Statistics")
+    stats_window.geometry("520x460")
+    collecting = tk.BooleanVar(value=stats_enabled())
+    trace_memory = tk.BooleanVar(value=False)
+
+    controls = tk.Frame(stats_window)
+    controls.pack(fill=tk.X, padx=10, pady=5)
+    report = scrolledtext.ScrolledText(stats_window, height=20, font=("Courier", 10))
+    report.pack(fill=tk.BOTH, expand=True, padx=10)
+    buttons = tk.Frame(stats_window)
+    buttons.pack(fill=tk.X, padx=10, pady=5)
+
+    def show():
+        report.config(state=tk.NORMAL)
+        report.delete("1.0", tk.END)
+        report.insert(tk.END, format_stats(get_stats()))
+        report.config(state=tk.DISABLED)
+
+    def start():
+        enable_stats(trace_memory.get())
+        if current_field is not None:
+            instrument_field(current_field)
+        show()
+
+    def toggle():
+        if collecting.get():
+            start()
+        else:
+            disable_stats()
+            show()
+
+    def reset():
+        if stats_enabled():
+            start()
+
+    def export():
+        if not stats_enabled():
+            messagebox.showerror("Statistics", "Statistics collection is off.", parent=stats_window)
+            return
+        from tkinter import filedialog
+        path = filedialog.asksaveasfilename(parent=stats_window, defaultextension=".json",
+                                            filetypes=[("JSON files", "*.json"), ("All files", "*")])
+        if path:
+            try:
+                export_stats(path)
+            except OSError as e:
+                messagebox.showerror("Statistics", f"Could not write {path}: {e}", parent=stats_window)
+
+    def refresh():
+        if not stats_window.winfo_exists():
+            return
+        show()
+        stats_window.after(1000, refresh)
+
+    tk.Checkbutton(controls, text="Collect statistics", variable=collecting, command=toggle).pack(side=tk.LEFT)
+    tk.Checkbutton(controls, text="Trace peak memory (slower)", variable=trace_memory).pack(side=tk.LEFT, padx=10)
+    tk.Button(buttons, text="Reset", command=reset).pack(side=tk.LEFT)
+    tk.Button(buttons, text="Export JSON...", command=export).pack(side=tk.LEFT, padx=5)
+    tk.Button(buttons, text="Close", command=stats_window.destroy).pack(side=tk.RIGHT)
+    refresh()
+
+# Field construction runs on a worker thread: it checks the modulus, then builds (or loads)
+# the tables while the Tk thread polls its progress with root.after. Raising from the
+# progress callback is how a cancelled build stops.
+class _BuildCancelled(Exception):
+    pass
+
+class _FieldBuildJob:
+    def __init__(self, p, m, mod_poly):
+        import threading
+        self.p = p
+        self.m = m
+        self.mod_poly = mod_poly
+        self.phase = "checking irreducibility"
+        self.done = 0
+        self.total = 0
+        self.irreducible = None
+        self.field = None
+        self.error = None
+        self.finished = False
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _progress(self, phase, done, total):
+        if self._cancel.is_set():
+            raise _BuildCancelled
+        self.phase, self.done, self.total = phase, done, total
+
+    def _run(self):
+        import os
+        try:
+            with stats_phase("irreducibility check"):
+                self.irreducible = is_irreducible(self.mod_poly, self.p)
+            if self.irreducible:
+                self._progress("building tables", 0, 0)
+                self.field = make_field(self.p, self.m, self.mod_poly, cache=True, progress=self._progress,
+                                        processes=os.cpu_count())
+        except _BuildCancelled:
+            pass
+        except Exception as e:
+            self.error = e
+        finally:
+            self.finished = True
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+# The most recent initialization; results from older jobs are ignored
+current_job = None
+
 def initialize_field():
-    global current_p, current_m, current_mod_poly, current_elements, current_mul_table, current_inv_table, element_buttons
-    
-    # Clear any existing element buttons
-    for button in element_buttons:
-        button.destroy()
-    element_buttons = []
+    global current_p, current_m, current_mod_poly, current_field, element_buttons, current_job
     
     try:
-        current_p = int(entry_p.get())
-        current_m = int(entry_m.get())
+        p = int(entry_p.get())
+        m = int(entry_m.get())
         
         # Validate p is prime
-        if not is_prime(current_p):
-            messagebox.showerror("Input Error", f"{current_p} is not a prime number!")
+        if not is_prime(p):
+            messagebox.showerror("Input Error", f"{p} is not a prime number!")
             return
             
     except ValueError:
@@ -388,72 +4703,154 @@ def initialize_field():
 
     poly_str_input = entry_poly.get()
     try:
-        current_mod_poly = parse_poly(poly_str_input, current_p, current_m + 1)
-        
-        # Show the irreducible polynomial in a nicer format
-        irreducible_poly_str = poly_str(current_mod_poly)
-        field_info.config(state=tk.NORMAL)
-        field_info.delete("1.0", tk.END)
-        field_info.insert(tk.END, f"Field: F({current_p}^{current_m})\n")
-        field_info.insert(tk.END, f"Irreducible Polynomial: {irreducible_poly_str}\n")
-        field_info.insert(tk.END, f"Field Order: {current_p**current_m} elements\n")
-        field_info.config(state=tk.DISABLED)
-        
+        mod_poly = parse_poly(poly_str_input, p, m + 1)
     except Exception as e:
         messagebox.showerror("Polynomial Error", f"Error parsing polynomial: {e}")
         return
 
-    # Check if the polynomial is irreducible
-    irreducible_result = is_irreducible(current_mod_poly, current_p)
-    if isinstance(irreducible_result, str):
-        messagebox.showwarning("Irreducibility Warning", 
-                               f"{irreducible_result}\nContinuing initialization, but please verify your polynomial is irreducible.")
-    elif not irreducible_result:
+    # Stop any build still running for a previous field
+    if current_job is not None and not current_job.finished:
+        current_job.cancel()
+
+    # Clear any existing element buttons
+    for button in element_buttons:
+        button.destroy()
+    element_buttons = []
+    text_field_elements.delete("1.0", tk.END)
+    page_label.config(text="")
+    button_frame.pack_forget()
+    operator_frame.pack_forget()
+
+    current_p, current_m, current_mod_poly = p, m, mod_poly
+    current_field = None
+
+    # Show the irreducible polynomial in a nicer format
+    field_info.config(state=tk.NORMAL)
+    field_info.delete("1.0", tk.END)
+    field_info.insert(tk.END, f"Field: F({p}^{m})\n")
+    field_info.insert(tk.END, f"Irreducible Polynomial: {poly_str(mod_poly)}\n")
+    field_info.insert(tk.END, f"Field Order: {p**m} elements\n")
+    field_info.config(state=tk.DISABLED)
+
+    current_job = _FieldBuildJob(p, m, mod_poly)
+    progress_bar.config(mode="indeterminate")
+    progress_bar.start(20)
+    progress_label.config(text="Checking irreducibility...")
+    progress_frame.pack(fill=tk.X, pady=5)
+    root.after(50, poll_field_build, current_job)
+
+# Cancel the running field build. Once the modulus has been accepted the calculator
+# keeps working with on-demand arithmetic.
+def cancel_field_build():
+    if current_job is None or current_job.finished:
+        return
+    current_job.cancel()
+    progress_bar.stop()
+    progress_frame.pack_forget()
+    field_info.config(state=tk.NORMAL)
+    if current_field is not None:
+        field_info.insert(tk.END, "Table construction cancelled; products are computed on demand.\n")
+    else:
+        field_info.insert(tk.END, "Field initialization cancelled.\n")
+    field_info.config(state=tk.DISABLED)
+
+# Pick up the worker's progress on the Tk thread, enabling each part of the window as soon
+# as what it needs is ready
+def poll_field_build(job):
+    global current_field
+    if job is not current_job or job.cancelled:
+        return
+    if job.irreducible is False:
+        progress_bar.stop()
+        progress_frame.pack_forget()
         messagebox.showerror("Irreducibility Error", 
-                             f"The polynomial {poly_str_input} is NOT irreducible over F{current_p}. Field initialization aborted.")
+                             f"The polynomial {poly_str(job.mod_poly)} is NOT irreducible over F{job.p}. Field initialization aborted.")
+        return
+    if job.irreducible and current_field is None:
+        # The calculator works straight away with on-demand arithmetic; the tables replace it when ready
+        current_field = LazyField(job.p, job.m, job.mod_poly)
+        operator_frame.pack(fill=tk.X, padx=10, pady=5)
+        button_frame.pack(fill=tk.X, padx=10, pady=10, before=operator_frame)
+        show_element_page(0)
+    if job.finished:
+        progress_bar.stop()
+        progress_frame.pack_forget()
+        if job.error is not None:
+            messagebox.showerror("Field Error", f"Error building field tables: {job.error}")
+            return
+        current_field = job.field
+        messagebox.showinfo("Field Initialization", "Field has been initialized successfully!")
+        return
+    if job.total:
+        progress_bar.stop()
+        progress_bar.config(mode="determinate", maximum=job.total, value=job.done)
+        progress_label.config(text=f"Building {job.phase}: {100 * job.done // job.total}%")
+    elif job.irreducible:
+        progress_label.config(text="Building field tables...")
+    root.after(50, poll_field_build, job)
+
+# The element list and element buttons show one page of ELEMENT_PAGE_SIZE elements at a
+# time (in packed integer order), so fields of any size can be browsed
+ELEMENT_PAGE_SIZE = 32
+element_page = 0
+
+def show_element_page(page, highlight=None):
+    if current_field is None:
         return
+    with stats_phase("element page"):
+        _show_element_page(page, highlight)
 
-    current_elements = generate_field_elements(current_p, current_m)
-    current_mul_table = build_mul_table(current_elements, current_mod_poly, current_p)
-    current_inv_table = build_inv_table(current_elements, current_mul_table)
+def _show_element_page(page, highlight):
+    global element_page
+    q = current_field.order
+    pages = -(-q // ELEMENT_PAGE_SIZE)
+    element_page = max(0, min(page, pages - 1))
+    first = element_page * ELEMENT_PAGE_SIZE
+    values = range(first, min(first + ELEMENT_PAGE_SIZE, q))
+    elements = [current_field.from_int(n) for n in values]
 
-    # Display field elements
     text_field_elements.delete("1.0", tk.END)
-    text_field_elements.insert(tk.END, "Field Elements:\n")
-    for e in current_elements:
-        text_field_elements.insert(tk.END, f"{poly_str(e)}  ->  {tuple(e)}\n")
-    
-    # Create buttons for field elements
-    button_frame.pack(fill=tk.X, padx=10, pady=10)
-    
-    # Calculate how many elements per row based on the number of elements
-    total_elements = len(current_elements)
-    elements_per_row = min(8, total_elements)  # Maximum 8 per row
-    
-    # Create buttons for each field element
-    for i, element in enumerate(current_elements):
-        row = i // elements_per_row
-        col = i % elements_per_row
-        element_str = poly_str(element)
-        btn = tk.Button(button_frame, text=element_str, 
-                        command=lambda e=element: add_element_to_expr(e),
-                        width=8, height=1)
-        btn.grid(row=row, column=col, padx=2, pady=2)
-        element_buttons.append(btn)
-    
-    # Show operator buttons
-    operator_frame.pack(fill=tk.X, padx=10, pady=5)
-    
-    messagebox.showinfo("Field Initialization", "Field has been initialized successfully!")
+    text_field_elements.insert(tk.END, f"Field Elements {first} to {values.stop - 1} of {q}:\n")
+    for n, e in zip(values, elements):
+        tag = ("found",) if n == highlight else ()
+        text_field_elements.insert(tk.END, f"{poly_str(e)}  ->  {tuple(e)}\n", tag)
+    if highlight is not None:
+        text_field_elements.see(f"{highlight - first + 2}.0")
+
+    # Reuse one button per page slot
+    elements_per_row = min(8, q)  # Maximum 8 per row
+    for i, element in enumerate(elements):
+        if i == len(element_buttons):
+            element_buttons.append(tk.Button(button_frame, width=8, height=1))
+        element_buttons[i].config(text=poly_str(element), command=lambda e=element: add_element_to_expr(e))
+        element_buttons[i].grid(row=i // elements_per_row, column=i % elements_per_row, padx=2, pady=2)
+    for btn in element_buttons[len(elements):]:
+        btn.grid_remove()
+    page_label.config(text=f"Page {element_page + 1} of {pages}")
+
+# Jump to the page holding the element typed into the search box
+def find_element():
+    if current_field is None:
+        messagebox.showerror("Field Not Initialized", "Please initialize the field first!")
+        return
+    try:
+        n = current_field.from_str(entry_find.get())
+    except Exception as e:
+        messagebox.showerror("Search Error", f"Error parsing element: {e}")
+        return
+    show_element_page(n // ELEMENT_PAGE_SIZE, highlight=n)
 
 def evaluate_expr():
-    if current_p is None or current_m is None or current_mod_poly is None:
+    if current_field is None:
         messagebox.showerror("Field Not Initialized", "Please initialize the field first!")
         return
     expr = entry_expr.get()
     try:
-        result = evaluate_expression(expr, current_p, current_m, current_mul_table, current_inv_table)
-        output = f"Result: {poly_str(result)}  ->  {tuple(result)}"
+        result = evaluate_expression(expr, current_p, current_m, field=current_field)
+        if isinstance(result, int):  # log() gives an exponent, not a field element
+            output = f"Result: {result}"
+        else:
+            output = f"Result: {poly_str(result)}  ->  {tuple(result)}"
         text_result.config(state=tk.NORMAL)
         text_result.delete("1.0", tk.END)
         text_result.insert(tk.END, output)
@@ -462,130 +4859,182 @@ def evaluate_expr():
         messagebox.showerror("Evaluation Error", f"Error evaluating expression: {e}")
 
 # GUI Layout
-root = tk.Tk()
-root.title("Finite Field Calculator for F(p^m)")
-root.geometry("800x700")  # Set initial window size
-
-# --- Create a Canvas and a Scrollbar for the main window ---
-canvas = tk.Canvas(root)
-scrollbar = ttk.Scrollbar(root, orient="vertical", command=canvas.yview)
-scrollable_frame = tk.Frame(canvas) # This frame will hold all the content
-
-scrollable_frame.bind(
-    "<Configure>",
-    lambda e: canvas.configure(
-        scrollregion=canvas.bbox("all")
+# Tkinter is imported here rather than at module level so the arithmetic functions above can be
+# imported (and the command-line mode run) quickly and without a display
+def build_gui():
+    global root, tk, messagebox, scrolledtext, ttk
+    global entry_p, entry_m, entry_poly, field_info, text_field_elements, button_frame, operator_frame, entry_expr, text_result
+    global progress_frame, progress_bar, progress_label, page_label, entry_find
+    import tkinter as tk
+    from tkinter import messagebox, scrolledtext
+    from tkinter import ttk # Import ttk for themed widgets like scrollbar
+
+    root = tk.Tk()
+    root.title("Finite Field Calculator for F(p^m)")
+    root.geometry("800x700")  # Set initial window size
+
+    # --- Create a Canvas and a Scrollbar for the main window ---
+    canvas = tk.Canvas(root)
+    scrollbar = ttk.Scrollbar(root, orient="vertical", command=canvas.yview)
+    scrollable_frame = tk.Frame(canvas) # This frame will hold all the content
+
+    scrollable_frame.bind(
+        "<Configure>",
+        lambda e: canvas.configure(
+            scrollregion=canvas.bbox("all")
+        )
     )
-)
-
-canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-canvas.configure(yscrollcommand=scrollbar.set)
-
-# Pack the canvas and scrollbar
-canvas.pack(side="left", fill="both", expand=True)
-scrollbar.pack(side="right", fill="y")
-# --- End of Scrollbar setup ---
-
-
-# Add a menubar
-menubar = tk.Menu(root)
-tools_menu = tk.Menu(menubar, tearoff=0)
-tools_menu.add_command(label="View Multiplication Table", command=show_multiplication_table)
-tools_menu.add_command(label="Check Irreducibility", command=check_irreducibility)
-menubar.add_cascade(label="Tools", menu=tools_menu)
-root.config(menu=menubar)
-
-# Main frame with border and padding - Now placed inside the scrollable_frame
-# Remove relief and borderwidth as it's inside the canvas now
-main_frame = tk.Frame(scrollable_frame, padx=15, pady=15)
-main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10) # Pack inside scrollable_frame
-
-# Field initialization frame - Now a child of main_frame
-frame_field = tk.LabelFrame(main_frame, text="Field Initialization", padx=10, pady=10)
-frame_field.pack(fill=tk.X)
-
-# Two-column layout for p and m
-input_frame = tk.Frame(frame_field)
-input_frame.pack(fill=tk.X, pady=5)
-
-tk.Label(input_frame, text="Prime p:").grid(row=0, column=0, sticky=tk.W)
-entry_p = tk.Entry(input_frame, width=8)
-entry_p.grid(row=0, column=1, padx=5, pady=2)
-
-tk.Label(input_frame, text="Degree m:").grid(row=0, column=2, sticky=tk.W, padx=(20,0))
-entry_m = tk.Entry(input_frame, width=8)
-entry_m.grid(row=0, column=3, padx=5, pady=2)
-
-# Polynomial input
-tk.Label(frame_field, text="Irreducible polynomial:").pack(anchor=tk.W, pady=(5,0))
-entry_poly = tk.Entry(frame_field, width=40)
-entry_poly.pack(fill=tk.X, padx=5, pady=2)
-
-# Initialize button
-btn_init = tk.Button(frame_field, text="Initialize Field", command=initialize_field, bg="#4CAF50", fg="white")
-btn_init.pack(pady=5)
-
-# Field information display
-field_info = tk.Text(frame_field, height=3, wrap=tk.WORD, state=tk.DISABLED)
-field_info.pack(fill=tk.X, pady=5)
-
-# Field elements display
-frame_elements = tk.LabelFrame(main_frame, text="Field Elements", padx=10, pady=10)
-frame_elements.pack(fill=tk.BOTH, expand=True, pady=5)
-text_field_elements = scrolledtext.ScrolledText(frame_elements, wrap=tk.WORD, height=8)
-text_field_elements.pack(fill=tk.BOTH, expand=True)
-
-# Button frame for field elements (will be populated after initialization)
-button_frame = tk.Frame(main_frame)
-# Not packing yet - will be packed after field initialization
-
-# Operator buttons
-operator_frame = tk.Frame(main_frame)
-# Not packing yet - will be packed after field initialization
-
-# Add operator buttons
-op_buttons = [
-    ('+', lambda: add_to_expr('+')),
-    ('-', lambda: add_to_expr('-')),
-    ('*', lambda: add_to_expr('*')),
-    ('/', lambda: add_to_expr('/')),
-    ('(', lambda: add_to_expr('(')),
-    (')', lambda: add_to_expr(')')),
-    ('x', lambda: add_to_expr('x')),
-    ('Clear', clear_expr)
-]
-
-for i, (op, cmd) in enumerate(op_buttons):
-    btn = tk.Button(operator_frame, text=op, command=cmd, width=5, height=1)
-    if op == 'Clear':
-        btn.config(bg="#f44336", fg="white")  # Red for Clear
-    elif op in '+-*/':
-        btn.config(bg="#2196F3", fg="white")  # Blue for operators
-    else:
-        btn.config(bg="#9E9E9E", fg="white")  # Gray for other symbols
-    btn.grid(row=i//4, column=i%4, padx=5, pady=2)
 
-# Expression input and evaluation
-frame_expr = tk.LabelFrame(main_frame, text="Expression Evaluation", padx=10, pady=10)
-frame_expr.pack(fill=tk.X, pady=5)
+    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+    canvas.configure(yscrollcommand=scrollbar.set)
+
+    # Pack the canvas and scrollbar
+    canvas.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+    # --- End of Scrollbar setup ---
+
+
+    # Add a menubar
+    menubar = tk.Menu(root)
+    tools_menu = tk.Menu(menubar, tearoff=0)
+    tools_menu.add_command(label="View Multiplication Table", command=show_multiplication_table)
+    tools_menu.add_command(label="Check Irreducibility", command=check_irreducibility)
+    tools_menu.add_command(label="List Irreducible Polynomials", command=show_irreducible_polys)
+    tools_menu.add_separator()
+    tools_menu.add_command(label="Statistics", command=show_stats)
+    menubar.add_cascade(label="Tools", menu=tools_menu)
+    root.config(menu=menubar)
+
+    # Main frame with border and padding - Now placed inside the scrollable_frame
+    # Remove relief and borderwidth as it's inside the canvas now
+    main_frame = tk.Frame(scrollable_frame, padx=15, pady=15)
+    main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10) # Pack inside scrollable_frame
+
+    # Field initialization frame - Now a child of main_frame
+    frame_field = tk.LabelFrame(main_frame, text="Field Initialization", padx=10, pady=10)
+    frame_field.pack(fill=tk.X)
+
+    # Two-column layout for p and m
+    input_frame = tk.Frame(frame_field)
+    input_frame.pack(fill=tk.X, pady=5)
+
+    tk.Label(input_frame, text="Prime p:").grid(row=0, column=0, sticky=tk.W)
+    entry_p = tk.Entry(input_frame, width=8)
+    entry_p.grid(row=0, column=1, padx=5, pady=2)
+
+    tk.Label(input_frame, text="Degree m:").grid(row=0, column=2, sticky=tk.W, padx=(20,0))
+    entry_m = tk.Entry(input_frame, width=8)
+    entry_m.grid(row=0, column=3, padx=5, pady=2)
+
+    # Polynomial input
+    tk.Label(frame_field, text="Irreducible polynomial:").pack(anchor=tk.W, pady=(5,0))
+    entry_poly = tk.Entry(frame_field, width=40)
+    entry_poly.pack(fill=tk.X, padx=5, pady=2)
+
+    # Initialize button
+    btn_init = tk.Button(frame_field, text="Initialize Field", command=initialize_field, bg="#4CAF50", fg="white")
+    btn_init.pack(pady=5)
+
+    # Progress of the background table build (shown only while it runs)
+    progress_frame = tk.Frame(frame_field)
+    progress_label = tk.Label(progress_frame, anchor=tk.W)
+    progress_label.pack(side=tk.LEFT)
+    tk.Button(progress_frame, text="Cancel", command=cancel_field_build).pack(side=tk.RIGHT)
+    progress_bar = ttk.Progressbar(progress_frame, orient=tk.HORIZONTAL)
+    progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+    # Field information display
+    field_info = tk.Text(frame_field, height=3, wrap=tk.WORD, state=tk.DISABLED)
+    field_info.pack(fill=tk.X, pady=5)
+
+    # Field elements display
+    frame_elements = tk.LabelFrame(main_frame, text="Field Elements", padx=10, pady=10)
+    frame_elements.pack(fill=tk.BOTH, expand=True, pady=5)
+    text_field_elements = scrolledtext.ScrolledText(frame_elements, wrap=tk.WORD, height=8)
+    text_field_elements.pack(fill=tk.BOTH, expand=True)
+    text_field_elements.tag_config("found", background="yellow")
+
+    # Paging and search for the element list and buttons
+    element_nav = tk.Frame(frame_elements)
+    element_nav.pack(fill=tk.X, pady=(5, 0))
+    tk.Button(element_nav, text="< Prev", command=lambda: show_element_page(element_page - 1)).pack(side=tk.LEFT)
+    page_label = tk.Label(element_nav, text="")
+    page_label.pack(side=tk.LEFT, padx=5)
+    tk.Button(element_nav, text="Next >", command=lambda: show_element_page(element_page + 1)).pack(side=tk.LEFT)
+    tk.Button(element_nav, text="Find", command=find_element).pack(side=tk.RIGHT)
+    entry_find = tk.Entry(element_nav, width=20)
+    entry_find.pack(side=tk.RIGHT, padx=5)
+    entry_find.bind("<Return>", lambda e: find_element())
+    tk.Label(element_nav, text="Element:").pack(side=tk.RIGHT)
+
+    # Button frame for field elements (will be populated after initialization)
+    button_frame = tk.Frame(main_frame)
+    # Not packing yet - will be packed after field initialization
+
+    # Operator buttons
+    operator_frame = tk.Frame(main_frame)
+    # Not packing yet - will be packed after field initialization
+
+    # Add operator buttons
+    op_buttons = [
+        ('+', lambda: add_to_expr('+')),
+        ('-', lambda: add_to_expr('-')),
+        ('*', lambda: add_to_expr('*')),
+        ('/', lambda: add_to_expr('/')),
+        ('(', lambda: add_to_expr('(')),
+        (')', lambda: add_to_expr(')')),
+        ('x', lambda: add_to_expr('x')),
+        ('^', lambda: add_to_expr('^')),
+        (',', lambda: add_to_expr(',')),
+        ('sqrt', lambda: add_to_expr('sqrt(')),
+        ('log', lambda: add_to_expr('log(')),
+        ('Clear', clear_expr)
+    ]
+
+    for i, (op, cmd) in enumerate(op_buttons):
+        btn = tk.Button(operator_frame, text=op, command=cmd, width=5, height=1)
+        if op == 'Clear':
+            btn.config(bg="#f44336", fg="white")  # Red for Clear
+        elif op in '+-*/':
+            btn.config(bg="#2196F3", fg="white")  # Blue for operators
+        else:
+            btn.config(bg="#9E9E9E", fg="white")  # Gray for other symbols
+        btn.grid(row=i//4, column=i%4, padx=5, pady=2)
+
+    # Expression input and evaluation
+    frame_expr = tk.LabelFrame(main_frame, text="Expression Evaluation", padx=10, pady=10)
+    frame_expr.pack(fill=tk.X, pady=5)
+
+    tk.Label(frame_expr, text="Enter or build expression:").pack(anchor=tk.W)
+    entry_expr = tk.Entry(frame_expr, width=60)
+    entry_expr.pack(fill=tk.X, padx=5, pady=5)
 
-tk.Label(frame_expr, text="Enter or build expression:").pack(anchor=tk.W)
-entry_expr = tk.Entry(frame_expr, width=60)
-entry_expr.pack(fill=tk.X, padx=5, pady=5)
+    btn_eval = tk.Button(frame_expr, text="Evaluate Expression", command=evaluate_expr,
+                         bg="#FF9800", fg="white", height=2)
+    btn_eval.pack(pady=5, fill=tk.X)
 
-btn_eval = tk.Button(frame_expr, text="Evaluate Expression", command=evaluate_expr,
-                     bg="#FF9800", fg="white", height=2)
-btn_eval.pack(pady=5, fill=tk.X)
+    # Result display
+    frame_result = tk.LabelFrame(main_frame, text="Result", padx=10, pady=10)
+    frame_result.pack(fill=tk.X, pady=5)
+    text_result = tk.Text(frame_result, height=2, wrap=tk.WORD, state=tk.DISABLED)
+    text_result.pack(fill=tk.X, padx=5, pady=2)
 
-# Result display
-frame_result = tk.LabelFrame(main_frame, text="Result", padx=10, pady=10)
-frame_result.pack(fill=tk.X, pady=5)
-text_result = tk.Text(frame_result, height=2, wrap=tk.WORD, state=tk.DISABLED)
-text_result.pack(fill=tk.X, padx=5, pady=2)
+    # Add some instructions at the bottom
+    instructions = tk.Label(main_frame, text="Instructions: First initialize the field, then use the calculator buttons or type directly. Use the Tools menu for additional functions.",
+                           anchor=tk.W, justify=tk.LEFT, wraplength=750)
+    instructions.pack(fill=tk.X, pady=10)
+    return root
 
-# Add some instructions at the bottom
-instructions = tk.Label(main_frame, text="Instructions: First initialize the field, then use the calculator buttons or type directly. Use the Tools menu for additional functions.",
-                       anchor=tk.W, justify=tk.LEFT, wraplength=750)
-instructions.pack(fill=tk.X, pady=10)
+# Entry point: `serve ...` starts the field server, other arguments run the headless
+# command-line mode, no arguments start the GUI
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["serve"]:
+        return server_main(argv[1:])
+    if argv:
+        return cli_main(argv)
+    build_gui().mainloop()
+    return 0
 
-root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main())
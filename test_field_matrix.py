@@ -0,0 +1,140 @@
+"""
+Regression tests for FieldMatrix: elimination results of every row backend (bit-packed rows
+over GF(2^m), NumPy rows for small odd characteristic, plain lists for large p) checked
+against a straightforward Gauss-Jordan elimination written with the scalar field operations.
+
+    python -m unittest test_field_matrix
+"""
+
+import random
+import unittest
+
+import cs425proj_mod as ffc
+
+# (p, m): GF(2^8) and GF(2^5) use _PackedRows, GF(3^4) and GF(65521) NumPy rows when it is
+# installed, GF((2^61-1)^2) is too large for int64 and always uses plain lists
+FIELDS = [(2, 8), (2, 5), (3, 4), (65521, 1), (2 ** 61 - 1, 2)]
+
+def _make_field(p, m, rng):
+    return ffc.make_field(p, m, ffc.random_irreducible_poly(p, m, rng), cache=False)
+
+# Reduced row echelon form, pivot columns and determinant (of the leading square block when
+# the matrix is square) by textbook elimination on lists of packed elements
+def _naive_rref(field, rows):
+    rows = [row[:] for row in rows]
+    nrows, ncols = len(rows), len(rows[0]) if rows else 0
+    pivots, det, r = [], 1, 0
+    for c in range(ncols):
+        pivot = next((i for i in range(r, nrows) if rows[i][c]), None)
+        if pivot is None:
+            continue
+        if pivot != r:
+            rows[r], rows[pivot] = rows[pivot], rows[r]
+            det = field.neg(det)
+        det = field.mul(det, rows[r][c])
+        inv = field.inv(rows[r][c])
+        rows[r] = [field.mul(inv, v) for v in rows[r]]
+        for i in range(nrows):
+            if i != r and rows[i][c]:
+                factor = rows[i][c]
+                rows[i] = [field.sub(a, field.mul(factor, b)) for a, b in zip(rows[i], rows[r])]
+        pivots.append(c)
+        r += 1
+    return rows, pivots, det
+
+def _naive_matmul(field, a, b):
+    result = []
+    for row in a:
+        out = []
+        for col in zip(*b):
+            acc = 0
+            for x, y in zip(row, col):
+                acc = field.add(acc, field.mul(x, y))
+            out.append(acc)
+        result.append(out)
+    return result
+
+# A random n x n matrix of rank r (a product of random n x r and r x n factors)
+def _low_rank(field, n, r, rng):
+    q = field.order
+    a = [[rng.randrange(q) for _ in range(r)] for _ in range(n)]
+    b = [[rng.randrange(q) for _ in range(n)] for _ in range(r)]
+    return _naive_matmul(field, a, b)
+
+class FieldMatrixTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(20)
+        cls.fields = [((p, m), _make_field(p, m, rng)) for p, m in FIELDS]
+
+    def setUp(self):
+        self.rng = random.Random(20)
+
+    def test_rref_rank_det(self):
+        for params, field in self.fields:
+            with self.subTest(params=params):
+                q = field.order
+                shapes = [(1, 1), (4, 4), (6, 9), (9, 6), (12, 12)]
+                matrices = [[[self.rng.randrange(q) for _ in range(c)] for _ in range(r)] for r, c in shapes]
+                matrices += [_low_rank(field, 8, 3, self.rng), _low_rank(field, 7, 0, self.rng)]
+                for rows in matrices:
+                    matrix = ffc.FieldMatrix(field, rows)
+                    expected, pivots, det = _naive_rref(field, rows)
+                    reduced, got_pivots = matrix.rref()
+                    self.assertEqual(reduced.tolist(), expected)
+                    self.assertEqual(list(got_pivots), pivots)
+                    self.assertEqual(matrix.rank(), len(pivots))
+                    if len(rows) == len(rows[0]):
+                        self.assertEqual(matrix.det(), det if len(pivots) == len(rows) else 0)
+
+    def test_inverse(self):
+        for params, field in self.fields:
+            with self.subTest(params=params):
+                for n in (1, 2, 7, 16):
+                    rows = [[self.rng.randrange(field.order) for _ in range(n)] for _ in range(n)]
+                    matrix = ffc.FieldMatrix(field, rows)
+                    if _naive_rref(field, rows)[1] != list(range(n)):
+                        with self.assertRaises(ValueError):
+                            matrix.inverse()
+                        continue
+                    inverse = matrix.inverse()
+                    identity = ffc.FieldMatrix.identity(field, n)
+                    self.assertEqual(_naive_matmul(field, rows, inverse.tolist()), identity.tolist())
+                    self.assertEqual(matrix @ inverse, identity)
+                singular = ffc.FieldMatrix(field, _low_rank(field, 6, 4, self.rng))
+                with self.assertRaises(ValueError):
+                    singular.inverse()
+                self.assertEqual(singular.det(), 0)
+
+    def test_solve(self):
+        for params, field in self.fields:
+            with self.subTest(params=params):
+                q = field.order
+                # Square, overdetermined (consistent) and underdetermined systems
+                for nrows, ncols in ((8, 8), (10, 6), (5, 9)):
+                    rows = [[self.rng.randrange(q) for _ in range(ncols)] for _ in range(nrows)]
+                    x = [self.rng.randrange(q) for _ in range(ncols)]
+                    b = [row[0] for row in _naive_matmul(field, rows, [[v] for v in x])]
+                    solution = ffc.FieldMatrix(field, rows).solve(b)
+                    self.assertEqual(_naive_matmul(field, rows, [[v] for v in solution]), [[v] for v in b])
+                    # Several right-hand sides at once, each in the column space of the matrix
+                    xs = [[v, self.rng.randrange(q)] for v in x]
+                    rhs = _naive_matmul(field, rows, xs)
+                    many = ffc.FieldMatrix(field, rows).solve(ffc.FieldMatrix(field, rhs))
+                    self.assertEqual(_naive_matmul(field, rows, many.tolist()), rhs)
+                # An inconsistent system: two equal rows with different right-hand sides
+                row = [self.rng.randrange(1, q) for _ in range(3)]
+                with self.assertRaises(ValueError):
+                    ffc.FieldMatrix(field, [row, row]).solve([0, 1])
+
+    def test_matmul(self):
+        for params, field in self.fields:
+            with self.subTest(params=params):
+                q = field.order
+                a = [[self.rng.randrange(q) for _ in range(7)] for _ in range(5)]
+                b = [[self.rng.randrange(q) for _ in range(4)] for _ in range(7)]
+                product = ffc.FieldMatrix(field, a) @ ffc.FieldMatrix(field, b)
+                self.assertEqual(product.tolist(), _naive_matmul(field, a, b))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Regression tests for FieldPoly and ReedSolomonCodec: products and divisions on both sides of
+the Kronecker and Newton thresholds against schoolbook arithmetic, multipoint evaluation and
+interpolation round trips through the subproduct tree, and Reed-Solomon decoding with up to
+t = (n - k) // 2 random errors per block and beyond. The codec tests need NumPy.
+
+    python -m unittest test_field_poly
+"""
+
+import random
+import unittest
+
+import cs425proj_mod as ffc
+
+# (p, m): binary fields (bit-packed Kronecker products), odd extension fields and prime fields
+FIELDS = [(2, 8), (2, 16), (3, 5), (65521, 1), (2 ** 61 - 1, 2)]
+
+def _make_field(p, m, rng):
+    return ffc.make_field(p, m, ffc.random_irreducible_poly(p, m, rng), cache=False)
+
+def _have_numpy():
+    try:
+        ffc._require_numpy()
+    except ImportError:
+        return False
+    return True
+
+def _schoolbook_mul(field, a, b):
+    result = [0] * (len(a) + len(b) - 1) if a and b else []
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            result[i + j] = field.add(result[i + j], field.mul(x, y))
+    return ffc._fpoly_trim(result)
+
+def _horner(field, coeffs, x):
+    acc = 0
+    for c in reversed(coeffs):
+        acc = field.add(field.mul(acc, x), c)
+    return acc
+
+class FieldPolyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(21)
+        cls.fields = [((p, m), _make_field(p, m, rng)) for p, m in FIELDS]
+
+    def setUp(self):
+        self.rng = random.Random(21)
+
+    def random_poly(self, field, length):
+        coeffs = [self.rng.randrange(field.order) for _ in range(length - 1)]
+        return ffc.FieldPoly(field, coeffs + [self.rng.randrange(1, field.order)])
+
+    def distinct_points(self, field, count):
+        points = {}
+        while len(points) < count:
+            points[self.rng.randrange(field.order)] = None
+        return list(points)
+
+    def test_mul_divmod(self):
+        lengths = [(1, 1), (5, 3), (40, 33), (90, 70), (150, 20)]
+        for params, field in self.fields:
+            with self.subTest(params=params):
+                for la, lb in lengths:
+                    a, b = self.random_poly(field, la), self.random_poly(field, lb)
+                    product = a * b
+                    self.assertEqual(product.coeffs, _schoolbook_mul(field, a.coeffs, b.coeffs))
+                    c = self.random_poly(field, max(1, lb - 1))
+                    quotient, remainder = divmod(product + c, b)
+                    self.assertEqual(quotient * b + remainder, product + c)
+                    self.assertLess(remainder.degree, b.degree)
+
+    def test_evaluate_interpolate(self):
+        for params, field in self.fields:
+            with self.subTest(params=params):
+                for npoints in (1, 7, 8, 9, 40, 130):
+                    points = self.distinct_points(field, min(npoints, field.order))
+                    poly = self.random_poly(field, len(points))
+                    values = poly.evaluate(points)
+                    self.assertEqual(list(values), [_horner(field, poly.coeffs, x) for x in points])
+                    self.assertEqual(ffc.FieldPoly.interpolate(field, points, values), poly)
+                    roots = ffc.FieldPoly.from_roots(field, points)
+                    self.assertEqual(roots.degree, len(points))
+                    self.assertFalse(any(roots.evaluate(points)))
+                with self.assertRaises(ValueError):
+                    ffc.FieldPoly.interpolate(field, [1, 1], [2, 3])
+
+@unittest.skipUnless(_have_numpy(), "the Reed-Solomon codec needs NumPy")
+class ReedSolomonTest(unittest.TestCase):
+    # (p, m, n, k, fcr)
+    CODES = [(2, 8, 255, 223, 0), (2, 8, 40, 30, 1), (2, 16, 300, 260, 0), (3, 5, 60, 44, 0)]
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(22)
+        cls.codecs = [((p, m, n, k), ffc.ReedSolomonCodec(_make_field(p, m, rng), n, k, fcr=fcr))
+                      for p, m, n, k, fcr in cls.CODES]
+
+    def setUp(self):
+        self.rng = random.Random(22)
+
+    def corrupt(self, codec, codeword, count):
+        received = list(codeword)
+        for position in self.rng.sample(range(codec.n), count):
+            received[position] = codec.field.add(received[position], self.rng.randrange(1, codec.field.order))
+        return received
+
+    def test_decode_up_to_t_errors(self):
+        for params, codec in self.codecs:
+            with self.subTest(params=params):
+                t, q = (codec.n - codec.k) // 2, codec.field.order
+                messages = [[self.rng.randrange(q) for _ in range(codec.k)] for _ in range(t + 1)]
+                codewords = codec.encode_blocks(messages).tolist()
+                self.assertEqual([row[:codec.k] for row in codewords], messages)
+                received = [self.corrupt(codec, word, errors) for errors, word in enumerate(codewords)]
+                decoded, counts = codec.decode_blocks(received)
+                self.assertEqual(decoded.tolist(), messages)
+                self.assertEqual(list(counts), list(range(t + 1)))
+                message, count = codec.decode(received[-1])
+                self.assertEqual((message, count), (messages[-1], t))
+
+    # Past t the decoder either reports the block as uncorrectable or lands on another
+    # codeword within distance t of what was received; it never returns a non-codeword
+    def test_decode_past_t(self):
+        for params, codec in self.codecs:
+            with self.subTest(params=params):
+                t, q = (codec.n - codec.k) // 2, codec.field.order
+                for errors in (t + 1, t + 3, codec.n - codec.k):
+                    message = [self.rng.randrange(q) for _ in range(codec.k)]
+                    received = self.corrupt(codec, codec.encode(message), errors)
+                    try:
+                        decoded, count = codec.decode(received)
+                    except ValueError:
+                        continue
+                    codeword = codec.encode(decoded)
+                    self.assertLessEqual(sum(a != b for a, b in zip(codeword, received)), t)
+                    self.assertEqual(count, sum(a != b for a, b in zip(codeword, received)))
+
+    def test_bytes_round_trip(self):
+        field = ffc.make_field(2, 8, [1, 0, 1, 1, 1, 0, 0, 0, 1], cache=False)
+        codec = ffc.ReedSolomonCodec(field, 255, 223)
+        data = bytes(self.rng.randrange(256) for _ in range(1000))
+        encoded = bytearray(codec.encode_bytes(data))
+        for position in self.rng.sample(range(len(encoded)), 8):
+            encoded[position] ^= 0x5A
+        self.assertEqual(codec.decode_bytes(bytes(encoded)), data)
+
+if __name__ == "__main__":
+    unittest.main()